@@ -41,6 +41,7 @@ from .storage.audit_log import export_audit_log
 
 # LLM layer (robust client)
 from .llm.client import LLMClient
+from .llm.cache import ResponseCache
 from .llm.schemas import StatementSchema, AmendmentSchema, VoteSchema
 
 __version__ = "0.2.0"
@@ -84,6 +85,7 @@ __all__ = [
 
     # LLM
     "LLMClient",
+    "ResponseCache",
     "StatementSchema",
     "AmendmentSchema",
     "VoteSchema",
@@ -25,7 +25,7 @@ import sys
 from pathlib import Path
 
 
-def _build_agents(factions_config: dict) -> list:
+def _build_agents(factions_config: dict, llm=None) -> list:
     from parliament.agents.efficiency import EfficiencyAgent
     from parliament.agents.safety import SafetyAgent
     from parliament.agents.equity import EquityAgent
@@ -33,14 +33,131 @@ def _build_agents(factions_config: dict) -> list:
     from parliament.agents.compliance import ComplianceAgent
 
     return [
-        EfficiencyAgent(factions_config["Efficiency"]),
-        SafetyAgent(factions_config["Safety"]),
-        EquityAgent(factions_config["Equity"]),
-        InnovationAgent(factions_config["Innovation"]),
-        ComplianceAgent(factions_config["Compliance"]),
+        EfficiencyAgent(factions_config["Efficiency"], llm=llm),
+        SafetyAgent(factions_config["Safety"], llm=llm),
+        EquityAgent(factions_config["Equity"], llm=llm),
+        InnovationAgent(factions_config["Innovation"], llm=llm),
+        ComplianceAgent(factions_config["Compliance"], llm=llm),
     ]
 
 
+def _build_llm(args: argparse.Namespace):
+    """Configure provider-wide limits and return the LLM client shared by all agents."""
+    from parliament.llm.client import DEFAULT_ROUTER_PROVIDERS, LLMClient, warm_up_clients
+    from parliament.llm.rate_limit import set_rate_limit
+
+    providers = DEFAULT_ROUTER_PROVIDERS if args.provider == "router" else [args.provider]
+    for provider in providers:
+        if args.rpm or args.tpm:
+            set_rate_limit(provider, requests_per_minute=args.rpm, tokens_per_minute=args.tpm)
+        if args.adaptive_concurrency:
+            from parliament.llm.adaptive import set_adaptive_concurrency
+
+            set_adaptive_concurrency(
+                provider,
+                initial_limit=min(4, args.adaptive_concurrency),
+                max_limit=args.adaptive_concurrency,
+            )
+
+    # Build the shared provider client(s) and open their connections before the first bill
+    warm_up_clients([args.provider])
+
+    cache = None
+    if args.llm_cache:
+        from parliament.llm.cache import ResponseCache
+
+        cache = ResponseCache(
+            db_path=Path(args.llm_cache),
+            ttl_seconds=args.llm_cache_ttl,
+        )
+    phase_profiles = {}
+    if args.phase_models:
+        from parliament.llm.profiles import load_phase_profiles
+
+        phase_profiles = load_phase_profiles(args.phase_models)
+
+    on_partial = None
+    if args.stream and sys.stdout.isatty():
+        from parliament.utils.colors import PartialRenderer
+
+        on_partial = PartialRenderer()
+
+    llm = LLMClient(
+        provider=args.provider,
+        cache=cache,
+        timeout=args.call_timeout,
+        structured_output=args.structured_output,
+        stream=args.stream,
+        on_partial=on_partial,
+        profiles=phase_profiles.get(args.provider),
+    )
+    if args.provider == "router":
+        # Backends talk to the providers, so they carry the request options
+        for backend in llm.client.backends:
+            backend.client.structured_output = args.structured_output
+            backend.client.stream = args.stream
+            backend.client.profiles = phase_profiles.get(backend.client.provider, {})
+
+    if args.context_cache:
+        from parliament.llm.context_cache import GeminiContextCache
+
+        # Explicit context caching is Gemini-only; other providers cache prefixes implicitly
+        for client in _sending_clients(llm):
+            if client.provider == "google":
+                client.context_cache = GeminiContextCache(client.client)
+    return llm
+
+
+def _sending_clients(llm) -> list:
+    """The client(s) that actually talk to a provider (router backends, or the client itself)."""
+    if llm.provider == "router":
+        return [backend.client for backend in llm.client.backends]
+    return [llm]
+
+
+def _print_template_stats(llm) -> None:
+    """Parse outcomes per registered prompt template, so a wording change shows up in telemetry."""
+    from parliament.llm.prompts import template_hashes
+
+    by_template = llm.parse_stats.as_dict()["by_template"]
+    for template_id in sorted(template_hashes()):
+        counts = {"clean": 0, "repaired": 0, "invalid": 0}
+        # Calls are recorded under "identity+task" ids; credit each registered part
+        for combined, outcomes in by_template.items():
+            if template_id in combined.split("+"):
+                for outcome, count in outcomes.items():
+                    counts[outcome] += count
+        if any(counts.values()):
+            print(
+                f"LLM JSON [{template_id}]: {counts['clean']} clean, "
+                f"{counts['repaired']} repaired, {counts['invalid']} invalid"
+            )
+
+
+def _print_prompt_cache_stats(llm) -> None:
+    for client in _sending_clients(llm):
+        for phase, stats in client.prompt_cache_stats.as_dict().items():
+            print(
+                f"Prompt cache [{client.provider}] {phase}: "
+                f"{stats['cached_ratio']:.0%} of {stats['prompt_tokens']} prompt tokens cached"
+            )
+
+
+def _phase_timeouts(seconds: float | None) -> dict[str, float] | None:
+    if seconds is None:
+        return None
+    phases = ["speaker_veto", "statement", "speaker_order", "debate", "amendments", "vote"]
+    return {phase: seconds for phase in phases}
+
+
+def _speaker_rulings(mode: str | None, store):
+    from parliament.procedure.rulings import RulingCache
+
+    if mode is None:
+        return None
+    return RulingCache(store=store if mode == "db" else None)
+
+
 def cmd_run(args: argparse.Namespace) -> int:
     import yaml
     from parliament.session.parliament_session import ParliamentSession
@@ -73,7 +190,9 @@ def cmd_run(args: argparse.Namespace) -> int:
             print(f"[ERROR] No YAML bills found in {bills_dir}", file=sys.stderr)
             return 1
 
-    agents = _build_agents(factions)
+    llm = _build_llm(args)
+
+    agents = _build_agents(factions, llm=llm)
     db_path = Path(args.db) if args.db else Path("parliament_sessions.db")
     store = SessionStore(db_path=db_path)
     log_dir = Path(args.log_dir) if args.log_dir else Path(".")
@@ -84,8 +203,32 @@ def cmd_run(args: argparse.Namespace) -> int:
         max_debate_rounds=args.debate_rounds,
         export_logs=not args.no_logs,
         log_dir=str(log_dir),
+        max_workers=args.workers,
+        speaker_llm=llm,
+        phase_timeouts=_phase_timeouts(args.phase_timeout),
+        debate_context=args.debate_context,
+        debate_window=args.debate_window,
+        debate_token_budget=args.debate_token_budget,
+        debate_mode=args.debate_mode,
+        convergence_threshold=args.debate_convergence,
+        vote_early_exit=args.vote_early_exit,
+        speaker_rulings=_speaker_rulings(args.speaker_rulings, store),
+        veto_rule_margin=args.veto_rule_margin,
+        debate_order_strategy=args.debate_order,
     )
-    session.run(bills)
+    session.run(bills, jobs=args.jobs, consistency=args.consistency)
+
+    if llm.cache is not None:
+        stats = llm.cache.stats()
+        print(f"LLM cache: {stats['hits']} hit(s), {stats['misses']} miss(es), {stats['entries']} entries")
+    parse = llm.parse_stats.as_dict()
+    if parse["responses"]:
+        print(
+            f"LLM JSON: {parse['repair_rate']:.0%} repaired locally, "
+            f"{parse['reprompt_rate']:.0%} re-prompted, {parse['failures']} failure(s)"
+        )
+        _print_template_stats(llm)
+    _print_prompt_cache_stats(llm)
     return 0
 
 
@@ -131,7 +274,7 @@ def cmd_replay(args: argparse.Namespace) -> int:
     return 0
 
 
-def main(argv: list[str] | None = None) -> int:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="parliament",
         description="AI Parliament — constrained multi-agent governance system",
@@ -164,6 +307,165 @@ def main(argv: list[str] | None = None) -> int:
         default=2,
         help="Maximum debate rounds per bill (default: 2)",
     )
+    run_parser.add_argument(
+        "--workers",
+        metavar="N",
+        type=int,
+        default=1,
+        help="Factions to query concurrently in statement, amendment and voting phases (default: 1)",
+    )
+    run_parser.add_argument(
+        "--provider",
+        choices=["cerebras", "google", "router"],
+        default="cerebras",
+        help="LLM provider; 'router' routes between all providers with failover (default: cerebras)",
+    )
+    run_parser.add_argument(
+        "--rpm",
+        metavar="N",
+        type=float,
+        default=None,
+        help="Provider requests-per-minute budget; excess requests queue (default: unlimited)",
+    )
+    run_parser.add_argument(
+        "--tpm",
+        metavar="N",
+        type=float,
+        default=None,
+        help="Provider tokens-per-minute budget, estimated from prompt size (default: unlimited)",
+    )
+    run_parser.add_argument(
+        "--adaptive-concurrency",
+        metavar="MAX",
+        type=int,
+        default=None,
+        help="Adapt in-flight LLM requests (AIMD) up to MAX from latency and 429s (default: off)",
+    )
+    run_parser.add_argument(
+        "--call-timeout",
+        metavar="SECONDS",
+        type=float,
+        default=None,
+        help="Deadline for each LLM call, retries included (default: none)",
+    )
+    run_parser.add_argument(
+        "--phase-timeout",
+        metavar="SECONDS",
+        type=float,
+        default=None,
+        help="Deadline for each procedural phase; late factions abstain or pass (default: none)",
+    )
+    run_parser.add_argument(
+        "--jobs",
+        metavar="N",
+        type=int,
+        default=1,
+        help="Bills to deliberate concurrently (needs --consistency snapshot or eventual; default: 1)",
+    )
+    run_parser.add_argument(
+        "--consistency",
+        choices=["strict", "snapshot", "eventual"],
+        default="strict",
+        help="Precedents seen by concurrent bills: all earlier decisions (strict, no parallelism), "
+             "those recorded before the bill's wave (snapshot), or whatever is recorded so far (eventual)",
+    )
+    run_parser.add_argument(
+        "--debate-mode",
+        choices=["sequential", "simultaneous"],
+        default="sequential",
+        help="'simultaneous' shows each round only earlier rounds and runs its turns across "
+             "--workers in parallel (default: sequential)",
+    )
+    run_parser.add_argument(
+        "--debate-convergence",
+        metavar="SIMILARITY",
+        type=float,
+        default=None,
+        help="Close the debate early once every faction's argument is at least this similar "
+             "(0-1, word-shingle Jaccard) to its previous one (default: off)",
+    )
+    run_parser.add_argument(
+        "--vote-early-exit",
+        choices=["cancel", "mark"],
+        default=None,
+        help="Once the vote outcome is locked (veto REJECT or unassailable weight), stop collecting "
+             "votes ('cancel') or collect and flag them as not needed ('mark') (default: off)",
+    )
+    run_parser.add_argument(
+        "--debate-order",
+        choices=["llm", "opposed_adjacent", "similar_adjacent", "distinctive_first"],
+        default="llm",
+        help="How the Speaker orders debate: ask the LLM, or plan locally from statement "
+             "similarity with the given objective (default: llm)",
+    )
+    run_parser.add_argument(
+        "--veto-rule-margin",
+        metavar="MARGIN",
+        type=float,
+        default=None,
+        help="Grant vetoes from red-line matches against the bill's risks and unknowns when every "
+             "faction's score is at least MARGIN from the 0.4 cutoff; otherwise ask the LLM (default: always LLM)",
+    )
+    run_parser.add_argument(
+        "--speaker-rulings",
+        choices=["memory", "db"],
+        default=None,
+        help="Reuse Speaker veto/order rulings for an identical bill and roster, within this run "
+             "('memory') or across runs via the session database ('db') (default: off)",
+    )
+    run_parser.add_argument(
+        "--debate-context",
+        choices=["full", "last_n", "targeted", "budget"],
+        default="full",
+        help="What each debate speaker sees: the full transcript, the last N rounds, arguments "
+             "targeting it, or a token budget; bounded modes add a rolling summary (default: full)",
+    )
+    run_parser.add_argument(
+        "--debate-window",
+        metavar="N",
+        type=int,
+        default=1,
+        help="Past rounds shown verbatim with --debate-context last_n (default: 1)",
+    )
+    run_parser.add_argument(
+        "--debate-token-budget",
+        metavar="TOKENS",
+        type=int,
+        default=600,
+        help="Verbatim argument budget with --debate-context budget (default: 600)",
+    )
+    run_parser.add_argument(
+        "--phase-models",
+        metavar="PATH",
+        help="Per-phase model/generation routing table, e.g. parliament/config/models.yaml (default: one model)",
+    )
+    run_parser.add_argument(
+        "--structured-output",
+        action="store_true",
+        help="Send output schemas as provider-native JSON-schema constraints where supported",
+    )
+    run_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream responses, stopping as soon as the JSON closes or turns invalid",
+    )
+    run_parser.add_argument(
+        "--context-cache",
+        action="store_true",
+        help="Cache each bill's stable prompt prefix server-side (Gemini cached contents)",
+    )
+    run_parser.add_argument(
+        "--llm-cache",
+        metavar="PATH",
+        help="Cache LLM responses in this SQLite file and reuse them on re-runs",
+    )
+    run_parser.add_argument(
+        "--llm-cache-ttl",
+        metavar="SECONDS",
+        type=float,
+        default=None,
+        help="Expire cached LLM responses after this many seconds (default: never)",
+    )
     run_parser.add_argument(
         "--no-logs",
         action="store_true",
@@ -191,6 +493,11 @@ def main(argv: list[str] | None = None) -> int:
         help="Directory for the exported log file (default: current directory)",
     )
 
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _build_parser()
     parsed = parser.parse_args(argv)
 
     if parsed.command == "run":
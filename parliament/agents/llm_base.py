@@ -1,10 +1,19 @@
 from uuid import uuid4
 from parliament.agents.base import BaseFactionAgent
+from parliament.agents.prompt_templates import (
+    AMENDMENTS_TEMPLATE,
+    DEBATE_TEMPLATE,
+    STATEMENT_TEMPLATE,
+    VOTE_TEMPLATE,
+)
 from parliament.llm.client import LLMClient
+from parliament.llm.deadline import Deadline
+from parliament.llm.prompts import LayoutPrompt, PromptTemplate, assemble, bill_section, compile_identity
 from parliament.llm.schemas import StatementSchema, DebateSchema, AmendmentSchema, VoteSchema
 from parliament.core.debate import DebateArgument
 from parliament.core.amendment import Amendment
 from parliament.core.vote import Vote, VoteChoice
+from parliament.engine.debate_context import DebateContext
 
 
 class LLMFactionAgent(BaseFactionAgent):
@@ -13,25 +22,61 @@ class LLMFactionAgent(BaseFactionAgent):
         self.llm = llm if llm is not None else LLMClient()
         self.weight = weight
 
-    def statement(self, bill, precedent_context: str = ""):
+    @property
+    def ideology(self) -> dict:
+        return self._ideology
+
+    @ideology.setter
+    def ideology(self, ideology: dict) -> None:
+        # Render the static identity section once, not on every call
+        self._ideology = ideology
+        self.identity_template = compile_identity(self.name, ideology)
+
+    def _prompt(self, bill, precedent_context: str, task: PromptTemplate, **fields) -> LayoutPrompt:
+        """
+        Assemble a prompt in canonical, prefix-stable order.
+
+        Identity, ideology, precedents and the bill are identical for every
+        phase on the same bill, so provider prefix caches can reuse them;
+        only the rendered ``task`` differs per call.
+        """
+        return assemble(
+            self.identity_template,
+            bill_section(bill),
+            task,
+            precedents=precedent_context,
+            **fields,
+        )
+
+    def _generate(self, prompt: LayoutPrompt, phase: str, schema, deadline: Deadline | None):
+        return self.llm.generate_json(
+            prompt.system_prompt,
+            prompt.user_prompt,
+            phase=phase,
+            timeout=Deadline.remaining_of(deadline),
+            schema=schema,
+            stable_prefix=prompt.stable_prefix,
+            template=prompt.template_id,
+        )
+
+    def statement(self, bill, precedent_context: str = "", deadline: Deadline | None = None):
         try:
-            system = f"You represent the {self.name} faction. Goal: {self.ideology['goal']}"
-            if precedent_context:
-                system += f"\n\n{precedent_context}"
-            user = f"""
-Bill:
-{bill.proposal}
-
-Return JSON:
-{{ "summary": "short position statement" }}
-"""
-
-            raw = self.llm.generate_json(system, user)
+            prompt = self._prompt(bill, precedent_context, STATEMENT_TEMPLATE)
+            raw = self._generate(prompt, "statement", StatementSchema, deadline)
             return StatementSchema(**raw).summary
         except Exception as e:
             return f"[{self.name}] Unable to generate structured statement due to LLM failure."
 
-    def debate(self, bill, round_number: int, all_factions: list[str], previous_arguments: list = None, precedent_context: str = ""):
+    def debate(
+        self,
+        bill,
+        round_number: int,
+        all_factions: list[str],
+        previous_arguments: list = None,
+        precedent_context: str = "",
+        deadline: Deadline | None = None,
+        debate_context: DebateContext | None = None,
+    ):
         """
         Generate a debate argument to persuade other factions.
         
@@ -41,6 +86,9 @@ Return JSON:
             all_factions: List of all faction names in parliament
             previous_arguments: List of DebateArgument from previous rounds
             precedent_context: Optional formatted precedent string for LLM context
+            deadline: Optional deadline; when it passes the faction passes this round
+            debate_context: Optional bounded view of the debate so far; when given
+                it replaces ``previous_arguments``
         
         Returns:
             DebateArgument or None if LLM fails
@@ -48,45 +96,19 @@ Return JSON:
         try:
             other_factions = [f for f in all_factions if f != self.name]
             
-            system = f"""
-You are the {self.name} faction in a parliamentary debate.
-
-Goal: {self.ideology['goal']}
-Priorities: {self.ideology['priorities']}
-Red lines: {self.ideology['red_lines']}
-
-Your task is to persuade other factions to support (or reject) this bill based on your ideology.
-Make compelling arguments that appeal to other factions' concerns.
-"""
-            if precedent_context:
-                system += f"\n\n{precedent_context}"
-
-            previous_context = ""
-            if previous_arguments and round_number > 1:
-                previous_context = "\n\nPrevious debate arguments:\n"
-                for arg in previous_arguments:
-                    previous_context += f"[{arg.speaker_faction}]: {arg.argument}\n"
-
-            user = f"""
-Bill:
-{bill.proposal}
-{previous_context}
-
-Round {round_number}: Make a persuasive argument.
-
-You can target specific factions or address everyone.
-Available factions to convince: {other_factions}
-
-Return JSON:
-{{
-  "argument": "your persuasive argument (2-3 sentences)",
-  "targeted_factions": ["Faction1", "Faction2"] or [] for everyone
-}}
-
-Be strategic and persuasive based on your faction's ideology.
-"""
-
-            raw = self.llm.generate_json(system, user)
+            if debate_context is None:
+                debate_context = DebateContext.from_arguments(previous_arguments or [])
+            previous_context = debate_context.render(self.name, round_number)
+
+            prompt = self._prompt(
+                bill,
+                precedent_context,
+                DEBATE_TEMPLATE,
+                previous_context=previous_context,
+                round_number=round_number,
+                other_factions=other_factions,
+            )
+            raw = self._generate(prompt, "debate", DebateSchema, deadline)
             parsed = DebateSchema(**raw)
             
             return DebateArgument(
@@ -103,24 +125,10 @@ Be strategic and persuasive based on your faction's ideology.
             # Graceful degradation - faction passes on this debate round
             return None
 
-    def propose_amendments(self, bill, precedent_context: str = ""):
+    def propose_amendments(self, bill, precedent_context: str = "", deadline: Deadline | None = None):
         try:
-            system = f"You represent the {self.name} faction."
-            if precedent_context:
-                system += f"\n\n{precedent_context}"
-            user = f"""
-Bill:
-{bill.proposal}
-
-If changes are needed, return JSON list:
-[
-  {{ "change_summary": "...", "rationale": "..." }}
-]
-
-If no amendments needed, return [].
-"""
-
-            raw = self.llm.generate_json(system, user)
+            prompt = self._prompt(bill, precedent_context, AMENDMENTS_TEMPLATE)
+            raw = self._generate(prompt, "amendments", list[AmendmentSchema], deadline)
 
             amendments = []
             for item in raw:
@@ -140,42 +148,15 @@ If no amendments needed, return [].
         except Exception as e:
             return []
 
-    def vote(self, bill, amendments, precedent_context: str = ""):
+    def vote(self, bill, amendments, precedent_context: str = "", deadline: Deadline | None = None):
         try:
-            system = f"""
-You are the {self.name} faction.
-
-Goal: {self.ideology['goal']}
-Priorities: {self.ideology['priorities']}
-Red lines: {self.ideology['red_lines']}
-
-You must vote strictly according to your faction's ideology.
-"""
-            if precedent_context:
-                system += f"\n\n{precedent_context}"
-
-            user = f"""
-Bill:
-{bill.proposal}
-
-Amendments proposed:
-{[a.change_summary for a in amendments]}
-
-You must return ONLY valid JSON matching this exact schema:
-
-{{
-  "choice": "APPROVE" | "REJECT" | "ABSTAIN",
-  "justification": string
-}}
-
-Rules:
-- choice MUST be one of: APPROVE, REJECT, ABSTAIN (uppercase)
-- No extra fields
-- No markdown
-- No explanation outside JSON
-"""
-
-            raw = self.llm.generate_json(system, user)
+            prompt = self._prompt(
+                bill,
+                precedent_context,
+                VOTE_TEMPLATE,
+                amendments=[a.change_summary for a in amendments],
+            )
+            raw = self._generate(prompt, "vote", VoteSchema, deadline)
             parsed = VoteSchema(**raw)
 
             return Vote(
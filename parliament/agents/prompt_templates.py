@@ -0,0 +1,78 @@
+"""
+Versioned prompt templates for faction agents.
+
+Bump a template's ``version`` whenever its wording changes in a way that
+matters; the content hash changes automatically with any edit. Both end up
+in the template id attached to every request (see ``parliament.llm.prompts``).
+"""
+
+from parliament.llm.prompts import PromptTemplate, register_template
+
+
+STATEMENT_TEMPLATE = register_template(PromptTemplate(
+    name="statement",
+    version=1,
+    text="""
+Return JSON:
+{{ "summary": "short position statement" }}
+""",
+))
+
+DEBATE_TEMPLATE = register_template(PromptTemplate(
+    name="debate",
+    version=1,
+    text="""
+This is a parliamentary debate. Your task is to persuade other factions to support (or reject) this bill based on your ideology.
+Make compelling arguments that appeal to other factions' concerns.
+{previous_context}
+Round {round_number}: Make a persuasive argument.
+
+You can target specific factions or address everyone.
+Available factions to convince: {other_factions}
+
+Return JSON:
+{{
+  "argument": "your persuasive argument (2-3 sentences)",
+  "targeted_factions": ["Faction1", "Faction2"] or [] for everyone
+}}
+
+Be strategic and persuasive based on your faction's ideology.
+""",
+))
+
+AMENDMENTS_TEMPLATE = register_template(PromptTemplate(
+    name="amendments",
+    version=1,
+    text="""
+If changes are needed, return JSON list:
+[
+  {{ "change_summary": "...", "rationale": "..." }}
+]
+
+If no amendments needed, return [].
+""",
+))
+
+VOTE_TEMPLATE = register_template(PromptTemplate(
+    name="vote",
+    version=1,
+    text="""
+You must vote strictly according to your faction's ideology.
+
+Amendments proposed:
+{amendments}
+
+You must return ONLY valid JSON matching this exact schema:
+
+{{
+  "choice": "APPROVE" | "REJECT" | "ABSTAIN",
+  "justification": string
+}}
+
+Rules:
+- choice MUST be one of: APPROVE, REJECT, ABSTAIN (uppercase)
+- No extra fields
+- No markdown
+- No explanation outside JSON
+""",
+))
@@ -0,0 +1,86 @@
+"""
+Debate convergence detection.
+
+Factions that keep restating the same position round after round are not
+moving the debate forward, and every further round costs one LLM call per
+faction. The detector compares each faction's argument with its argument
+from the previous round using word-shingle Jaccard similarity, a cheap
+local measure of near-duplicate text, and reports convergence once every
+faction has stayed above ``threshold`` for ``patience`` consecutive rounds.
+"""
+
+import re
+
+from parliament.core.debate import DebateArgument
+
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+
+def shingles(text: str, size: int = 3) -> frozenset[tuple[str, ...]]:
+    """Overlapping word ``size``-grams of ``text``, case- and punctuation-insensitive."""
+    words = _WORD.findall(text.lower())
+    if len(words) < size:
+        return frozenset([tuple(words)]) if words else frozenset()
+    return frozenset(tuple(words[i:i + size]) for i in range(len(words) - size + 1))
+
+
+def similarity(a: str, b: str, size: int = 3) -> float:
+    """Jaccard similarity of the two texts' shingle sets (1.0 = same wording)."""
+    sa, sb = shingles(a, size), shingles(b, size)
+    if not sa and not sb:
+        return 1.0
+    return len(sa & sb) / len(sa | sb)
+
+
+class ConvergenceDetector:
+    """
+    Tracks per-faction similarity between consecutive debate rounds.
+
+    Args:
+        threshold: Minimum similarity for a faction to count as restating itself.
+        patience: Consecutive converged rounds required before the debate closes.
+        shingle_size: Words per shingle.
+    """
+
+    def __init__(self, threshold: float = 0.6, patience: int = 1, shingle_size: int = 3):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        if patience < 1:
+            raise ValueError("patience must be at least 1")
+        self.threshold = threshold
+        self.patience = patience
+        self.shingle_size = shingle_size
+        self._previous: dict[str, str] = {}  # faction -> argument text from the last round
+        self._streak = 0
+        self.last_similarities: dict[str, float] = {}
+
+    def observe(self, round_arguments: list[DebateArgument]) -> str | None:
+        """
+        Feed one completed round; return the reason to stop, or None to continue.
+
+        Only factions that spoke in both rounds are compared. A faction that
+        passes does not reset the streak, but a round with no comparable
+        arguments does.
+        """
+        current = {a.speaker_faction: a.argument for a in round_arguments}
+        self.last_similarities = {
+            faction: similarity(self._previous[faction], text, self.shingle_size)
+            for faction, text in current.items()
+            if faction in self._previous
+        }
+        self._previous.update(current)
+
+        if self.last_similarities and min(self.last_similarities.values()) >= self.threshold:
+            self._streak += 1
+        else:
+            self._streak = 0
+
+        if self._streak < self.patience:
+            return None
+        lowest = min(self.last_similarities.values())
+        round_number = max(a.round_number for a in round_arguments)
+        return (
+            f"positions converged after round {round_number} "
+            f"(lowest similarity {lowest:.2f} >= {self.threshold:.2f})"
+        )
@@ -0,0 +1,149 @@
+"""
+Debate context management.
+
+Resending the full transcript to every speaker makes each debate prompt grow
+with factions × rounds, so the tokens spent on a bill grow quadratically
+with ``max_debate_rounds``. A DebateContext bounds what each speaker sees:
+
+- ``full``      every earlier argument verbatim (the original behaviour)
+- ``last_n``    arguments from the last ``window`` rounds (plus the current one)
+- ``targeted``  only arguments that explicitly target this faction
+- ``budget``    the most recent arguments that fit in ``token_budget``
+
+Every bounded mode also carries a rolling summary: each faction's latest
+stance, updated incrementally when a round ends. It is computed once per
+round and shared by all speakers, and its size depends on the number of
+factions, not on the number of rounds.
+"""
+
+import re
+import threading
+
+from parliament.core.debate import DebateArgument
+from parliament.llm.rate_limit import estimate_tokens
+
+
+CONTEXT_MODES = ("full", "last_n", "targeted", "budget")
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+
+def _gist(text: str, limit: int) -> str:
+    """First sentence of ``text``, clipped to ``limit`` characters."""
+    first = _SENTENCE_END.split(text.strip(), maxsplit=1)[0]
+    if len(first) <= limit:
+        return first
+    return first[: limit - 1].rstrip() + "…"
+
+
+def _line(argument: DebateArgument) -> str:
+    return f"[{argument.speaker_faction}]: {argument.argument}\n"
+
+
+class DebateContext:
+    """
+    The debate transcript for one bill, rendered per speaker within a bound.
+
+    Args:
+        mode: One of ``CONTEXT_MODES``.
+        window: Past rounds shown verbatim in ``last_n`` mode.
+        token_budget: Estimated tokens of verbatim arguments in ``budget`` mode.
+        gist_chars: Length cap of each faction's entry in the rolling summary.
+    """
+
+    def __init__(
+        self,
+        mode: str = "full",
+        window: int = 1,
+        token_budget: int = 600,
+        gist_chars: int = 160,
+    ):
+        if mode not in CONTEXT_MODES:
+            raise ValueError(f"Unknown debate context mode {mode!r}; expected one of {CONTEXT_MODES}")
+        if window < 0 or token_budget < 0:
+            raise ValueError("window and token_budget must be non-negative")
+        self.mode = mode
+        self.window = window
+        self.token_budget = token_budget
+        self.gist_chars = gist_chars
+        self._arguments: list[DebateArgument] = []
+        self._stances: dict[str, str] = {}  # faction -> gist of its latest argument
+        self._summary = ""
+        self._summarised = 0  # Arguments already folded into the summary
+        self._lock = threading.Lock()
+        self.summary_updates = 0
+
+    @classmethod
+    def from_arguments(cls, arguments: list[DebateArgument], mode: str = "full", **options) -> "DebateContext":
+        context = cls(mode=mode, **options)
+        for argument in arguments:
+            context.add(argument)
+        return context
+
+    @property
+    def arguments(self) -> list[DebateArgument]:
+        with self._lock:
+            return list(self._arguments)
+
+    def add(self, argument: DebateArgument) -> None:
+        with self._lock:
+            self._arguments.append(argument)
+
+    def end_round(self) -> None:
+        """Fold the arguments added since the last call into the shared summary."""
+        with self._lock:
+            fresh = self._arguments[self._summarised:]
+            if not fresh:
+                return
+            for argument in fresh:
+                self._stances[argument.speaker_faction] = (
+                    f"(round {argument.round_number}) {_gist(argument.argument, self.gist_chars)}"
+                )
+            self._summarised = len(self._arguments)
+            self._summary = "".join(f"- {faction}: {stance}\n" for faction, stance in self._stances.items())
+            self.summary_updates += 1
+
+    @property
+    def summary(self) -> str:
+        with self._lock:
+            return self._summary
+
+    # ---- Rendering ----
+
+    def _select(self, faction: str, round_number: int, arguments: list[DebateArgument]) -> list[DebateArgument]:
+        if self.mode == "last_n":
+            return [a for a in arguments if a.round_number >= round_number - self.window]
+        if self.mode == "targeted":
+            return [a for a in arguments if faction in a.targeted_factions]
+        if self.mode == "budget":
+            chosen: list[DebateArgument] = []
+            spent = 0
+            for argument in reversed(arguments):
+                cost = estimate_tokens(_line(argument))
+                if spent + cost > self.token_budget:
+                    break
+                chosen.append(argument)
+                spent += cost
+            return chosen[::-1]
+        return arguments
+
+    def render(self, faction: str, round_number: int) -> str:
+        """The ``previous_context`` section of ``faction``'s prompt for ``round_number``."""
+        if round_number <= 1:
+            return ""
+        with self._lock:
+            arguments = [a for a in self._arguments if a.speaker_faction != faction or self.mode == "full"]
+            summary = self._summary
+
+        if self.mode == "full":
+            if not arguments:
+                return ""
+            return "\nPrevious debate arguments:\n" + "".join(_line(a) for a in arguments)
+
+        selected = self._select(faction, round_number, arguments)
+        context = ""
+        if summary:
+            context += "\nDebate so far (latest stance per faction):\n" + summary
+        if selected:
+            context += "\nRecent debate arguments:\n" + "".join(_line(a) for a in selected)
+        return context
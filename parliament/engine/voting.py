@@ -86,3 +86,60 @@ class VotingEngine:
             decided_at=datetime.now(),
             decision_summary=summary
         )
+
+
+class VoteTally:
+    """
+    Running vote tally that reports as soon as the outcome is locked.
+
+    Follows the same rules as VotingEngine: a REJECT from a veto faction
+    rejects the bill, otherwise approve weight must exceed reject weight.
+    The outcome is locked once the weight still outstanding can no longer
+    flip it; a pass is only locked when no veto faction is still to vote.
+    """
+
+    def __init__(self, weights: dict[str, float], veto_factions: set[str] | None = None):
+        self.weights = dict(weights)  # faction -> vote weight, for every expected vote
+        self.veto_factions = veto_factions or set()
+        self.pending = set(weights)
+        self.approve_weight = 0.0
+        self.reject_weight = 0.0
+        self.vetoed_by: list[str] = []
+        self.passed: bool | None = None  # Set once decided
+        self.reason: str | None = None
+        self.decided_after: int | None = None  # Votes counted when the outcome locked
+
+    @property
+    def decided(self) -> bool:
+        return self.passed is not None
+
+    def add(self, vote: Vote) -> bool:
+        """Count one vote; returns True once the outcome is decided."""
+        if vote.faction not in self.pending:
+            raise ValueError(f"Unexpected or duplicate vote from faction {vote.faction}")
+        self.pending.discard(vote.faction)
+
+        if vote.choice == VoteChoice.APPROVE:
+            self.approve_weight += vote.weight
+        elif vote.choice == VoteChoice.REJECT:
+            self.reject_weight += vote.weight
+            if vote.faction in self.veto_factions:
+                self.vetoed_by.append(vote.faction)
+
+        if not self.decided:
+            self._check()
+        return self.decided
+
+    def _check(self) -> None:
+        remaining = sum(self.weights[f] for f in self.pending)
+        if self.vetoed_by:
+            self._decide(False, f"vetoed by {', '.join(self.vetoed_by)}")
+        elif self.approve_weight + remaining <= self.reject_weight:
+            self._decide(False, f"reject weight {self.reject_weight} cannot be overturned by the {remaining} outstanding")
+        elif not self.pending & self.veto_factions and self.approve_weight > self.reject_weight + remaining:
+            self._decide(True, f"approve weight {self.approve_weight} cannot be overturned by the {remaining} outstanding")
+
+    def _decide(self, passed: bool, reason: str) -> None:
+        self.passed = passed
+        self.reason = reason
+        self.decided_after = len(self.weights) - len(self.pending)
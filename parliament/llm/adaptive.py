@@ -0,0 +1,255 @@
+"""
+Adaptive (AIMD) concurrency control for LLM providers.
+
+A fixed concurrency cap is either too low when the provider is healthy or
+too high during a brownout. The AdaptiveConcurrencyLimiter instead adjusts
+its limit from what it observes:
+
+- Additive increase: while latency and error rate are healthy, the limit
+  grows by roughly one slot per ``limit`` successful calls.
+- Multiplicative decrease: a 429, a 5xx or a latency spike (well above the
+  rolling p95) cuts the limit by ``decrease_factor``.
+
+Only one cut happens per "generation": calls that were already in flight
+when the limit was cut cannot cut it again, so one burst of 429s halves
+the limit once instead of collapsing it to the minimum.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+
+
+def _status_code(exc: BaseException) -> int | None:
+    for candidate in (
+        getattr(exc, "status_code", None),
+        getattr(exc, "code", None),
+        getattr(getattr(exc, "response", None), "status_code", None),
+    ):
+        if isinstance(candidate, int):
+            return candidate
+    return None
+
+
+def is_overload_error(exc: BaseException) -> bool:
+    """True for provider errors that signal overload (HTTP 429 or 5xx)."""
+    status = _status_code(exc)
+    if status is not None:
+        return status == 429 or status >= 500
+    text = str(exc).lower()
+    return any(marker in text for marker in ("429", "rate limit", "resource_exhausted", "overloaded", "503"))
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limiter on the number of in-flight requests.
+
+    Usage:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=32)
+        with limiter.track():
+            call_provider()
+        async with limiter.atrack():
+            await call_provider_async()
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        decrease_factor: float = 0.5,
+        latency_spike_factor: float = 2.0,
+        error_rate_threshold: float = 0.1,
+        window: int = 50,
+        min_samples: int = 10,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Require 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_spike_factor = latency_spike_factor
+        self.error_rate_threshold = error_rate_threshold
+        self.min_samples = min_samples
+
+        self.in_flight = 0
+        self._generation = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._outcomes: deque[bool] = deque(maxlen=window)  # True = error
+        self._lock = threading.Lock()
+        self._waiters: deque = deque()
+
+        self.increases = 0
+        self.decreases = 0
+
+    # ---- Slot management ----
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def _try_take(self) -> int | None:
+        """Take a slot if one is free and nobody is queued ahead; return its generation."""
+        with self._lock:
+            if self._has_capacity() and not self._waiters:
+                self.in_flight += 1
+                return self._generation
+        return None
+
+    def _wake_waiters(self) -> None:
+        """Hand freed slots to queued callers in FIFO order. Caller holds the lock."""
+        while self._waiters and self._has_capacity():
+            wake = self._waiters.popleft()
+            self.in_flight += 1
+            wake()
+
+    def acquire(self) -> int:
+        """Block until a slot is free. Returns the generation token for ``release``."""
+        generation = self._try_take()
+        if generation is not None:
+            return generation
+        event = threading.Event()
+        with self._lock:
+            self._waiters.append(event.set)
+            self._wake_waiters()
+        event.wait()
+        return self._generation
+
+    async def aacquire(self) -> int:
+        """Async counterpart of ``acquire``."""
+        generation = self._try_take()
+        if generation is not None:
+            return generation
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def wake():
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+        with self._lock:
+            self._waiters.append(wake)
+            self._wake_waiters()
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if wake in self._waiters:
+                    self._waiters.remove(wake)
+                else:
+                    # The slot was already handed to us; give it back
+                    self.in_flight -= 1
+                    self._wake_waiters()
+            raise
+        return self._generation
+
+    def release(self, generation: int, latency: float, error: BaseException | None = None) -> None:
+        """Free a slot and adapt the limit from the call's latency and outcome."""
+        with self._lock:
+            self.in_flight -= 1
+            self._observe(generation, latency, error)
+            self._wake_waiters()
+
+    # ---- AIMD ----
+
+    def _observe(self, generation: int, latency: float, error: BaseException | None) -> None:
+        overloaded = error is not None and is_overload_error(error)
+        spiked = (
+            error is None
+            and len(self._latencies) >= self.min_samples
+            and latency > self.latency_spike_factor * _percentile(list(self._latencies), 95)
+        )
+
+        self._outcomes.append(error is not None)
+        if error is None and not spiked:
+            self._latencies.append(latency)
+
+        if overloaded or spiked:
+            # One cut per generation: calls started before the last cut don't count
+            if generation == self._generation:
+                self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+                self._generation += 1
+                self.decreases += 1
+            return
+
+        if error is None and self.error_rate <= self.error_rate_threshold and self.limit < self.max_limit:
+            self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+            self.increases += 1
+
+    @property
+    def error_rate(self) -> float:
+        return sum(self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    # ---- Context managers ----
+
+    @contextmanager
+    def track(self):
+        generation = self.acquire()
+        started = time.monotonic()
+        error = None
+        try:
+            yield
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            self.release(generation, time.monotonic() - started, error)
+
+    @asynccontextmanager
+    async def atrack(self):
+        generation = await self.aacquire()
+        started = time.monotonic()
+        error = None
+        try:
+            yield
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            self.release(generation, time.monotonic() - started, error)
+
+    def stats(self) -> dict:
+        with self._lock:
+            latencies = list(self._latencies)
+            return {
+                "limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "queued": len(self._waiters),
+                "p95_latency": _percentile(latencies, 95) if latencies else None,
+                "error_rate": self.error_rate,
+                "increases": self.increases,
+                "decreases": self.decreases,
+            }
+
+
+# ---- Process-wide registry ----
+
+_limiters_lock = threading.Lock()
+_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+
+
+def set_adaptive_concurrency(provider: str, **kwargs) -> AdaptiveConcurrencyLimiter:
+    """Install an adaptive limiter for a provider, replacing its fixed concurrency cap."""
+    limiter = AdaptiveConcurrencyLimiter(**kwargs)
+    with _limiters_lock:
+        _limiters[provider] = limiter
+    return limiter
+
+
+def get_adaptive_limiter(provider: str) -> AdaptiveConcurrencyLimiter | None:
+    with _limiters_lock:
+        return _limiters.get(provider)
+
+
+def clear_adaptive_limiters() -> None:
+    with _limiters_lock:
+        _limiters.clear()
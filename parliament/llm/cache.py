@@ -0,0 +1,192 @@
+"""
+Persistent, content-addressed cache for LLM responses.
+
+Responses are keyed on a SHA-256 hash of everything that determines the
+model's output (provider, model, prompts and generation parameters) and
+stored in a local SQLite file, so re-running an unchanged bill skips the
+provider entirely.
+
+Eviction:
+- TTL: entries older than ``ttl_seconds`` are treated as misses and purged.
+- Size / LRU: once more than ``max_entries`` are stored, the least recently
+  used entries are removed.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+
+_DEFAULT_CACHE_PATH = Path("parliament_llm_cache.db")
+
+
+def make_cache_key(
+    provider: str,
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    params: dict | None = None,
+) -> str:
+    """Return a stable hex digest identifying one generation request."""
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "system": system_prompt,
+            "user": user_prompt,
+            "params": params or {},
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite-backed LLM response cache with LRU, size and TTL eviction.
+
+    Usage:
+        cache = ResponseCache("llm_cache.db", max_entries=10_000, ttl_seconds=86_400)
+        llm = LLMClient(cache=cache)
+        ...
+        cache.stats()  # {"hits": ..., "misses": ..., "entries": ..., ...}
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = _DEFAULT_CACHE_PATH,
+        max_entries: int = 10_000,
+        ttl_seconds: float | None = None,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer")
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._init_db()
+
+    # ---- Initialisation ----
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """A short-lived connection: commits on success, rolls back on error, always closes."""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    cache_key     TEXT PRIMARY KEY,
+                    response_json TEXT NOT NULL,
+                    created_at    REAL NOT NULL,
+                    last_accessed REAL NOT NULL
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_llm_responses_last_accessed
+                    ON llm_responses (last_accessed);
+            """)
+
+    # ---- Lookup / store ----
+
+    def get(self, key: str):
+        """Return the cached response for ``key`` or None on a miss."""
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT response_json, created_at FROM llm_responses WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is not None and self._expired(row[1], now):
+                conn.execute("DELETE FROM llm_responses WHERE cache_key = ?", (key,))
+                self.evictions += 1
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            conn.execute(
+                "UPDATE llm_responses SET last_accessed = ? WHERE cache_key = ?",
+                (now, key),
+            )
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, response) -> None:
+        """Store a JSON-serialisable response and evict entries over the size limit."""
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_responses
+                    (cache_key, response_json, created_at, last_accessed)
+                VALUES (?, ?, ?, ?)
+                """,
+                (key, json.dumps(response), now, now),
+            )
+            self._evict(conn, now)
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        if self.ttl_seconds is not None:
+            cursor = conn.execute(
+                "DELETE FROM llm_responses WHERE created_at < ?",
+                (now - self.ttl_seconds,),
+            )
+            self.evictions += max(cursor.rowcount, 0)
+
+        (count,) = conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            cursor = conn.execute(
+                """
+                DELETE FROM llm_responses WHERE cache_key IN (
+                    SELECT cache_key FROM llm_responses
+                    ORDER BY last_accessed ASC LIMIT ?
+                )
+                """,
+                (overflow,),
+            )
+            self.evictions += max(cursor.rowcount, 0)
+
+    # ---- Maintenance / reporting ----
+
+    def clear(self) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM llm_responses")
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+        return count
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the current entry count."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self),
+        }
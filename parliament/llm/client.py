@@ -1,100 +1,535 @@
+import asyncio
+import functools
+import hashlib
 import os
-import json
-import re
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, replace
+from typing import Any, AsyncIterator, Callable, Iterator
 from dotenv import load_dotenv
+from pydantic import ValidationError
+
+from parliament.llm.adaptive import get_adaptive_limiter
+from parliament.llm.cache import ResponseCache, make_cache_key
+from parliament.llm.context_cache import GeminiContextCache
+from parliament.llm.deadline import Deadline, LLMTimeoutError
+from parliament.llm.hedging import HedgePolicy
+from parliament.llm.profiles import DEFAULT_PROFILE, GenerationProfile
+from parliament.llm.prompts import PromptCacheStats, usage_tokens
+from parliament.llm.rate_limit import estimate_tokens, get_rate_limiter
+from parliament.llm.repair import JSONRepairError, ParseStats, parse_model_json, validate_schema
+from parliament.llm.singleflight import SingleFlight, default_flight
+from parliament.llm.streaming import aconsume_stream, consume_stream
+from parliament.llm.structured import gemini_config, openai_response_format, supports_structured_output
 
 load_dotenv()
 
-def get_client_from(provider: str = "cerebras"):
+# Maximum number of in-flight requests per provider, shared by every LLMClient
+DEFAULT_MAX_CONCURRENCY = 8
+_max_concurrency: dict[str, int] = {}
+
+# One asyncio.Semaphore per (event loop, provider); semaphores cannot be shared across loops
+_semaphores_lock = threading.Lock()
+_async_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+_JSON_INSTRUCTIONS = """
+IMPORTANT:
+- You must respond ONLY with valid JSON
+- No markdown
+- No ``` fences
+- No commentary
+- Output must be directly {parsable} by json.loads
+"""
+
+
+def set_max_concurrency(provider: str, limit: int) -> None:
+    """
+    Cap the number of concurrent ``agenerate_json`` requests sent to a provider.
+
+    The limit is process-wide and applies to every LLMClient for that provider.
+    """
+    if limit < 1:
+        raise ValueError("Concurrency limit must be a positive integer")
+    with _semaphores_lock:
+        _max_concurrency[provider] = limit
+        # Drop existing semaphores so the new limit applies to the next request
+        for per_loop in _async_semaphores.values():
+            per_loop.pop(provider, None)
+
+
+def get_max_concurrency(provider: str) -> int:
+    return _max_concurrency.get(provider, DEFAULT_MAX_CONCURRENCY)
+
+
+def _provider_semaphore(provider: str) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    with _semaphores_lock:
+        per_loop = _async_semaphores.setdefault(loop, {})
+        semaphore = per_loop.get(provider)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(get_max_concurrency(provider))
+            per_loop[provider] = semaphore
+        return semaphore
+
+
+DEFAULT_MODELS = {
+    "google": "gemini-2.0-flash",
+    "cerebras": "llama-3.3-70b",
+    "router": "router",
+}
+
+# Backends used by provider="router", fastest healthy first
+DEFAULT_ROUTER_PROVIDERS = ["cerebras", "google"]
+
+_API_KEY_ENV = {
+    "google": "GEMINI_API_KEY",
+    "cerebras": "CEREBRAS_API_KEY",
+}
+
+# Process-wide SDK clients, one per (provider, model, credentials)
+_registry_lock = threading.Lock()
+_client_registry: dict[tuple[str, str, str], tuple[object, str]] = {}
+_build_locks: dict[tuple[str, str, str], threading.Lock] = {}  # One in-progress build per key
+
+
+def _run_in_thread(fn: Callable[..., Any], *args) -> Future:
+    """
+    Run a blocking call on its own daemon thread so the caller can stop waiting at its deadline.
+
+    Each call gets a fresh thread rather than a slot in a bounded pool, so
+    abandoned calls can never starve later ones; the per-request SDK timeout
+    (see ``LLMRequest.deadline``) ends them shortly after their deadline.
+    """
+    future: Future = Future()
+
+    def run():
+        try:
+            future.set_result(fn(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=run, name="llm-deadline", daemon=True).start()
+    return future
+
+
+def _schema_name(schema) -> str:
+    """Stable name of a pydantic model or generic type such as ``list[AmendmentSchema]``."""
+    if isinstance(schema, type):
+        return f"{schema.__module__}.{schema.__qualname__}"
+    return repr(schema)
+
+
+def get_client_from(provider: str = "cerebras", model: str | None = None):
+    """Build a new provider SDK client. Prefer ``get_shared_client`` to reuse connections."""
     if provider == "google":
         from google import genai
-        return genai.Client(api_key=os.environ["GEMINI_API_KEY"]), "gemini-2.0-flash"
+        return genai.Client(api_key=os.environ["GEMINI_API_KEY"]), model or DEFAULT_MODELS["google"]
     elif provider == "cerebras":
         from langchain_cerebras import ChatCerebras
+        model = model or DEFAULT_MODELS["cerebras"]
         return ChatCerebras(
-            model="llama-3.3-70b",
+            model=model,
             api_key=os.environ.get("CEREBRAS_API_KEY")
-        ), "llama-3.3-70b"
+        ), model
+    elif provider == "router":
+        from parliament.llm.router import LLMRouter
+        backends = [LLMClient(provider=p) for p in DEFAULT_ROUTER_PROVIDERS]
+        return LLMRouter(backends), DEFAULT_MODELS["router"]
+    raise ValueError(f"Unknown LLM provider: {provider!r}")
+
+
+def _credentials_fingerprint(provider: str) -> str:
+    api_key = os.environ.get(_API_KEY_ENV.get(provider, ""), "")
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def get_shared_client(provider: str = "cerebras", model: str | None = None):
+    """
+    Return the process-wide ``(client, model)`` pair for a provider.
+
+    The SDK client is built once per provider, model and API key, so every
+    agent and Speaker reuses the same HTTP connection pool instead of paying
+    for a fresh client (and TLS handshake) each time.
+    """
+    model = model or DEFAULT_MODELS.get(provider, "")
+    key = (provider, model, _credentials_fingerprint(provider))
+    with _registry_lock:
+        entry = _client_registry.get(key)
+        if entry is not None:
+            return entry
+        build_lock = _build_locks.setdefault(key, threading.Lock())
+
+    # Build outside the registry lock: a router's backends fetch their own shared clients
+    with build_lock:
+        with _registry_lock:
+            entry = _client_registry.get(key)
+        if entry is None:
+            entry = get_client_from(provider, model)
+            with _registry_lock:
+                _client_registry[key] = entry
+        return entry
+
+
+def _preconnect(provider: str, client, model: str) -> None:
+    """Open the SDK client's HTTP connection with a cheap metadata request (best effort)."""
+    if provider == "router":
+        for backend in client.backends:
+            _preconnect(backend.client.provider, backend.client.client, backend.client.model)
+        return
+    try:
+        if provider == "google":
+            client.models.get(model=model)
+        elif provider == "cerebras":
+            # ChatCerebras wraps an OpenAI-compatible client that owns the connection pool
+            client.root_client.models.list()
+    except Exception:
+        # Warm-up is only an optimisation; the first real request reports any problem
+        pass
+
+
+def warm_up_clients(providers: list[str], connect: bool = True) -> None:
+    """
+    Build shared clients ahead of time and, with ``connect``, open their connections.
+
+    Each provider gets one metadata request (model lookup or listing) on its
+    shared client, so DNS, TCP and TLS setup happen before the first bill
+    and the pooled connection is reused by the blocking ``generate_json``
+    path. Providers are warmed concurrently; failures are ignored.
+    """
+    clients = [(provider, *get_shared_client(provider)) for provider in providers]
+    if not connect:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, len(clients))) as pool:
+        list(pool.map(lambda entry: _preconnect(*entry), clients))
+
+
+def clear_client_registry() -> None:
+    """Forget all shared clients (e.g. after rotating API keys)."""
+    with _registry_lock:
+        _client_registry.clear()
+        _build_locks.clear()
+
+
+@dataclass(frozen=True)
+class LLMRequest:
+    """One generation request as it travels through limits, hedging and routing."""
+
+    system_prompt: str
+    user_prompt: str
+    phase: str | None = None  # Call site; selects the generation profile
+    schema: Any = None  # Target pydantic model/type for structured output and validation
+    on_partial: Callable[[Any, bool], None] | None = None  # Streaming renderer hook
+    stable_prefix: int = 0  # Leading characters of user_prompt shared across phases (cacheable)
+    template: str | None = None  # Id of the prompt template(s) the prompts were rendered from
+    deadline: Deadline | None = None  # Sent to the provider as a per-request timeout
+
+    def with_user_prompt(self, user_prompt: str) -> "LLMRequest":
+        # A rewritten prompt no longer starts with the cacheable prefix
+        return replace(self, user_prompt=user_prompt, stable_prefix=0)
+
 
 class LLMClient:
-    def __init__(self, provider="cerebras"):
-        self.client, self.model = get_client_from(provider)
+    def __init__(
+        self,
+        provider="cerebras",
+        client=None,
+        model: str | None = None,
+        cache: ResponseCache | None = None,
+        single_flight: SingleFlight | None = default_flight,
+        hedge: HedgePolicy | None = None,
+        timeout: float | None = None,
+        structured_output: bool = False,
+        stream: bool = False,
+        on_partial: Callable[[str | None, object, bool], None] | None = None,
+        profiles: dict[str, GenerationProfile] | None = None,
+        context_cache: GeminiContextCache | None = None,
+    ):
+        if client is None:
+            client, model = get_shared_client(provider, model)
+        elif model is None:
+            model = DEFAULT_MODELS.get(provider)
+        self.client = client
+        self.model = model
         self.provider = provider
+        self.cache = cache  # Optional persistent response cache (opt-in)
+        self.single_flight = single_flight  # Coalesces identical in-flight requests; None disables
+        self.hedge = hedge  # Optional tail-latency hedging policy
+        self.timeout = timeout  # Default per-call deadline in seconds; None = unbounded
+        # Compile call-site schemas into provider-native structured output where supported
+        self.structured_output = structured_output
+        # Stream responses, stopping once the JSON value closes or can no longer be valid
+        self.stream = stream
+        self.on_partial = on_partial  # Renderer hook: on_partial(phase, partial_value, done)
+        self.parse_stats = ParseStats()  # How responses were parsed: clean, repaired or re-prompted
+        self.profiles = profiles or {}  # Per-phase model and generation parameters (see profiles.py)
+        self.context_cache = context_cache  # Explicit Gemini context caching of stable prefixes
+        self.prompt_cache_stats = PromptCacheStats()  # Cached-token ratios per phase
 
-    def _extract_json(self, text: str) -> str:
-        """
-        Extract JSON from model output.
-        Handles:
-        - raw JSON
-        - ```json ... ```
-        - ``` ... ```
-        """
-        text = text.strip()
+    def profile_for(self, phase: str | None) -> GenerationProfile:
+        """Model and generation parameters configured for a call site."""
+        return self.profiles.get(phase, DEFAULT_PROFILE)
 
-        # If wrapped in ```json ``` or ``` ```
-        fence_match = re.search(r"```(?:json)?\s*(.*?)```", text, re.DOTALL)
-        if fence_match:
-            return fence_match.group(1).strip()
+    def request_key(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        phase: str | None = None,
+        template: str | None = None,
+        schema=None,
+    ) -> str:
+        """
+        Content hash identifying a request to this provider/model with the phase's parameters.
 
-        # Otherwise assume it's raw JSON
-        return text
+        The target schema and the client's structured-output and streaming
+        modes are part of the key, since they change what a call returns.
+        """
+        profile = self.profile_for(phase)
+        params = profile.params()
+        if template is not None:
+            params["template"] = template
+        if schema is not None:
+            params["schema"] = _schema_name(schema)
+        if self.structured_output:
+            params["structured_output"] = True
+        if self.stream:
+            params["stream"] = True
+        return make_cache_key(self.provider, profile.model or self.model, system_prompt, user_prompt, params)
 
-    def generate_json(self, system_prompt: str, user_prompt: str, retries: int = 3) -> dict:
-        last_error = None
+    # ---- Provider request building ----
 
-        for attempt in range(retries + 1):
-            if self.provider == "google":
-                response = self.client.models.generate_content(
-                    model=self.model,
-                    contents=f"""
+    def _google_contents(self, system_prompt: str, user_prompt: str, native: bool = False) -> str:
+        # Native structured output enforces the shape, so the prose instructions are dropped
+        instructions = "" if native else _JSON_INSTRUCTIONS.format(parsable="parsable")
+        return f"""
 SYSTEM:
 {system_prompt}
 
 USER:
 {user_prompt}
+{instructions}"""
 
-IMPORTANT:
-- You must respond ONLY with valid JSON
-- No markdown
-- No ``` fences
-- No commentary
-- Output must be directly parsable by json.loads
-"""
-                )
-                raw_text = response.text.strip()
-                
-            elif self.provider == "cerebras":
-                # LangChain ChatCerebras uses messages format
-                messages = [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": f"""
+    def _cerebras_messages(self, system_prompt: str, user_prompt: str, native: bool = False) -> list[dict]:
+        # LangChain ChatCerebras uses messages format
+        instructions = "" if native else _JSON_INSTRUCTIONS.format(parsable="parseable")
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": f"""
 {user_prompt}
+{instructions}"""},
+        ]
 
-IMPORTANT:
-- You must respond ONLY with valid JSON
-- No markdown
-- No ``` fences
-- No commentary
-- Output must be directly parseable by json.loads
-"""}
-                ]
-                response = self.client.invoke(messages)
-                raw_text = response.content.strip()
+    def _native_schema(self, schema) -> bool:
+        return self.structured_output and supports_structured_output(self.provider, schema)
 
-            cleaned = self._extract_json(raw_text)
+    def _cached_prefix(self, request: LLMRequest) -> str | None:
+        """Name of the Gemini cached content holding the request's stable prefix, if any."""
+        if self.context_cache is None or not request.stable_prefix:
+            return None
+        model = self.profile_for(request.phase).model or self.model
+        return self.context_cache.lookup(model, request.system_prompt, request.user_prompt[:request.stable_prefix])
 
-            try:
-                return json.loads(cleaned)
+    async def _acached_prefix(self, request: LLMRequest) -> str | None:
+        if self.context_cache is None or not request.stable_prefix:
+            return None
+        model = self.profile_for(request.phase).model or self.model
+        return await self.context_cache.alookup(
+            model, request.system_prompt, request.user_prompt[:request.stable_prefix]
+        )
 
-            except json.JSONDecodeError as e:
-                last_error = f"Attempt {attempt + 1}: {e}\nRaw:\n{raw_text}"
+    def _google_request(self, request: LLMRequest, cache_name: str | None = None) -> dict:
+        """Keyword arguments for ``models.generate_content[_stream]``; ``cache_name`` holds the prefix."""
+        profile = self.profile_for(request.phase)
+        model = profile.model or self.model
+        native = self._native_schema(request.schema)
+        config = gemini_config(request.schema) if native else {}
+        if profile.max_tokens is not None:
+            config["max_output_tokens"] = profile.max_tokens
+        if profile.temperature is not None:
+            config["temperature"] = profile.temperature
+        if profile.stop:
+            config["stop_sequences"] = list(profile.stop)
+        if request.deadline is not None:
+            # The SDK stops waiting on the connection itself; genai timeouts are in milliseconds
+            config["http_options"] = {"timeout": max(1, int(request.deadline.remaining() * 1000))}
+
+        if cache_name is not None:
+            # System prompt and bill live in the cache; send only the suffix
+            config["cached_content"] = cache_name
+            instructions = "" if native else _JSON_INSTRUCTIONS.format(parsable="parsable")
+            contents = f"{request.user_prompt[request.stable_prefix:]}\n{instructions}"
+        else:
+            contents = self._google_contents(request.system_prompt, request.user_prompt, native)
 
-                # Strengthen instruction on retry
-                user_prompt = f"""
+        kwargs = {"model": model, "contents": contents}
+        if config:
+            kwargs["config"] = config
+        return kwargs
+
+    def _cerebras_request(self, request: LLMRequest) -> tuple[list[dict], dict]:
+        """Messages and per-call overrides for ``invoke``/``stream``."""
+        profile = self.profile_for(request.phase)
+        native = self._native_schema(request.schema)
+        kwargs = {}
+        if profile.model is not None and profile.model != self.model:
+            kwargs["model"] = profile.model
+        if profile.max_tokens is not None:
+            kwargs["max_tokens"] = profile.max_tokens
+        if profile.temperature is not None:
+            kwargs["temperature"] = profile.temperature
+        if profile.stop:
+            kwargs["stop"] = list(profile.stop)
+        if native:
+            kwargs["response_format"] = openai_response_format(request.schema)
+        if request.deadline is not None:
+            kwargs["timeout"] = request.deadline.remaining()
+        return self._cerebras_messages(request.system_prompt, request.user_prompt, native), kwargs
+
+    def _send(self, request: LLMRequest) -> str:
+        """
+        Send one blocking request to the provider and return the raw response text.
+
+        The phase's profile picks the model and generation parameters. With
+        ``structured_output`` enabled, the schema is sent as a native
+        constraint where the provider supports it; otherwise the prose JSON
+        instructions are used. With ``stream`` enabled the response is read
+        only until its JSON value closes or can no longer match the schema.
+        A router forwards the request to its backends, whose own settings apply.
+        """
+        if self.provider == "router":
+            return self.client.complete(request)
+        if self.stream:
+            return consume_stream(self._stream_chunks(request), request.schema, request.on_partial)
+
+        if self.provider == "google":
+            kwargs = self._google_request(request, self._cached_prefix(request))
+            response = self.client.models.generate_content(**kwargs)
+            self._record_usage(request, response)
+            return response.text.strip()
+        elif self.provider == "cerebras":
+            messages, kwargs = self._cerebras_request(request)
+            response = self.client.invoke(messages, **kwargs)
+            self._record_usage(request, response)
+            return response.content.strip()
+        raise ValueError(f"Unknown LLM provider: {self.provider!r}")
+
+    async def _asend(self, request: LLMRequest) -> str:
+        """Send one request to the provider without blocking the event loop."""
+        if self.provider == "router":
+            return await self.client.acomplete(request)
+        if self.stream:
+            return await aconsume_stream(self._astream_chunks(request), request.schema, request.on_partial)
+
+        if self.provider == "google":
+            kwargs = self._google_request(request, await self._acached_prefix(request))
+            response = await self.client.aio.models.generate_content(**kwargs)
+            self._record_usage(request, response)
+            return response.text.strip()
+        elif self.provider == "cerebras":
+            messages, kwargs = self._cerebras_request(request)
+            response = await self.client.ainvoke(messages, **kwargs)
+            self._record_usage(request, response)
+            return response.content.strip()
+        raise ValueError(f"Unknown LLM provider: {self.provider!r}")
+
+    def _record_usage(self, request: LLMRequest, response) -> None:
+        usage = usage_tokens(response)
+        if usage is not None:
+            self.prompt_cache_stats.record(request.phase, *usage)
+
+    def _stream_chunks(self, request: LLMRequest) -> Iterator[str]:
+        """Yield response text as the provider streams it."""
+        if self.provider == "google":
+            kwargs = self._google_request(request, self._cached_prefix(request))
+            for chunk in self.client.models.generate_content_stream(**kwargs):
+                yield chunk.text or ""
+        elif self.provider == "cerebras":
+            messages, kwargs = self._cerebras_request(request)
+            for chunk in self.client.stream(messages, **kwargs):
+                yield chunk.content
+        else:
+            raise ValueError(f"Streaming is not supported for provider {self.provider!r}")
+
+    async def _astream_chunks(self, request: LLMRequest) -> AsyncIterator[str]:
+        if self.provider == "google":
+            kwargs = self._google_request(request, await self._acached_prefix(request))
+            stream = await self.client.aio.models.generate_content_stream(**kwargs)
+            async for chunk in stream:
+                yield chunk.text or ""
+        elif self.provider == "cerebras":
+            messages, kwargs = self._cerebras_request(request)
+            async for chunk in self.client.astream(messages, **kwargs):
+                yield chunk.content
+        else:
+            raise ValueError(f"Streaming is not supported for provider {self.provider!r}")
+
+    def _estimated_tokens(self, request: LLMRequest) -> int:
+        return estimate_tokens(
+            request.system_prompt,
+            request.user_prompt,
+            max_output_tokens=self.profile_for(request.phase).max_tokens or 0,
+        )
+
+    def _complete(self, request: LLMRequest) -> str:
+        """Send one blocking request, subject to provider rate and concurrency limits."""
+        limiter = get_rate_limiter(self.provider)
+        if limiter is not None:
+            limiter.acquire(self._estimated_tokens(request))
+
+        adaptive = get_adaptive_limiter(self.provider)
+        if adaptive is None:
+            return self._send(request)
+        with adaptive.track():
+            return self._send(request)
+
+    async def _acomplete(self, request: LLMRequest) -> str:
+        """Async counterpart of ``_complete``."""
+        # Wait for rate-limit budget before taking a concurrency slot
+        limiter = get_rate_limiter(self.provider)
+        if limiter is not None:
+            await limiter.aacquire(self._estimated_tokens(request))
+
+        # An adaptive limiter, when installed, replaces the fixed per-provider cap
+        adaptive = get_adaptive_limiter(self.provider)
+        if adaptive is not None:
+            async with adaptive.atrack():
+                return await self._asend(request)
+        async with _provider_semaphore(self.provider):
+            return await self._asend(request)
+
+    def _attempt(self, request: LLMRequest) -> str:
+        """One request/response round-trip, hedged when the policy covers this phase."""
+        if self.hedge is None or not self.hedge.applies_to(request.phase):
+            return self._complete(request)
+        hedge_target = self.hedge.hedge_client or self
+        return self.hedge.run(
+            lambda: self._complete(request),
+            lambda: hedge_target._complete(request),
+        )
+
+    async def _aattempt(self, request: LLMRequest) -> str:
+        if self.hedge is None or not self.hedge.applies_to(request.phase):
+            return await self._acomplete(request)
+        hedge_target = self.hedge.hedge_client or self
+        return await self.hedge.arun(
+            lambda: self._acomplete(request),
+            lambda: hedge_target._acomplete(request),
+        )
+
+    # ---- Parsing and retry ----
+
+    @staticmethod
+    def _retry_prompt(error: Exception, user_prompt: str) -> str:
+        # Strengthen instruction on retry. Always built from the original task so
+        # repeated failures do not nest one preamble inside another.
+        return f"""
 Your previous response was INVALID JSON and could not be parsed.
 
 Error:
-{e}
+{error}
 
 You must now respond with ONLY valid JSON. No backticks. No markdown.
 
@@ -102,8 +537,229 @@ Original task:
 {user_prompt}
 """
 
+    def _parse_response(self, raw_text: str, schema, template: str | None = None) -> dict:
+        """
+        Parse a raw response, repairing malformed JSON locally before giving up.
+
+        Raises JSONRepairError or pydantic.ValidationError if the response is
+        unusable even after repair; the caller then re-prompts.
+        """
+        try:
+            value, repaired = parse_model_json(raw_text)
+            if schema is not None:
+                validate_schema(value, schema)
+        except (JSONRepairError, ValidationError):
+            self.parse_stats.record_response("invalid", template)
+            raise
+        self.parse_stats.record_response("repaired" if repaired else "clean", template)
+        return value
+
+    @staticmethod
+    def _exhausted(retries: int, last_error: str | None) -> ValueError:
         # After all retries fail → hard failure (but clean)
-        raise ValueError(
+        return ValueError(
             f"Model failed to produce valid JSON after {retries + 1} attempts.\n"
             f"Last error:\n{last_error}"
         )
+
+    def _effective_timeout(self, timeout: float | None) -> float | None:
+        if timeout is None:
+            return self.timeout
+        if self.timeout is None:
+            return timeout
+        return min(timeout, self.timeout)
+
+    def _request(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        phase: str | None,
+        schema,
+        stable_prefix: int,
+        template: str | None,
+    ) -> LLMRequest:
+        on_partial = functools.partial(self.on_partial, phase) if self.on_partial is not None else None
+        return LLMRequest(
+            system_prompt,
+            user_prompt,
+            phase=phase,
+            schema=schema,
+            on_partial=on_partial,
+            stable_prefix=stable_prefix,
+            template=template,
+        )
+
+    def generate_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        retries: int = 3,
+        phase: str | None = None,
+        timeout: float | None = None,
+        schema=None,
+        stable_prefix: int = 0,
+        template: str | None = None,
+    ) -> dict:
+        """
+        Generate and parse a JSON response.
+
+        ``phase`` names the call site (statement, debate, amendments, vote,
+        speaker_veto, speaker_order) so per-phase policies can apply,
+        including the model and generation parameters in ``profiles``.
+
+        Malformed JSON (prose around it, single quotes, trailing commas,
+        truncation) is repaired locally before spending a re-prompt. When
+        ``schema`` is given (a pydantic model or type such as
+        ``list[AmendmentSchema]``) the parsed value must also validate
+        against it, otherwise the model is re-prompted with the validation
+        error. With ``structured_output`` enabled the schema is also sent to
+        the provider as a native JSON-schema constraint where supported, and
+        with ``stream`` enabled it is used to abort hopeless responses early.
+
+        ``stable_prefix`` is the length of the leading part of ``user_prompt``
+        that every call on the same bill shares (see ``prompts.assemble``);
+        with a ``context_cache`` it is cached server-side with the system prompt.
+        ``template`` identifies the versioned prompt template(s) used; it is
+        part of the cache key and breaks down ``parse_stats`` per template.
+
+        ``timeout`` bounds the whole call, retries included (capped by the
+        client's default ``timeout``). The remaining time is also sent to the
+        provider SDK as a per-request timeout. A missed deadline raises
+        LLMTimeoutError immediately and stops further retries; a blocking
+        request already on the wire is abandoned and ends at its SDK timeout.
+        Identical in-flight requests are coalesced into one shared call that
+        runs without any caller's deadline; each caller only waits for it
+        until its own deadline, so one caller's timeout cannot fail another.
+        """
+        request = self._request(system_prompt, user_prompt, phase, schema, stable_prefix, template)
+        timeout = self._effective_timeout(timeout)
+        if timeout is None:
+            return self._generate_cached(request, retries, None)
+
+        deadline = Deadline(timeout)
+        deadline.check()
+        future = _run_in_thread(self._generate_cached, request, retries, deadline)
+        try:
+            return future.result(timeout=deadline.remaining())
+        except FutureTimeoutError:
+            deadline.cancel()
+            raise LLMTimeoutError(f"LLM call ({phase or 'unnamed'}) exceeded {timeout:.1f}s deadline")
+
+    async def agenerate_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        retries: int = 3,
+        phase: str | None = None,
+        timeout: float | None = None,
+        schema=None,
+        stable_prefix: int = 0,
+        template: str | None = None,
+    ) -> dict:
+        """
+        Async counterpart of ``generate_json``.
+
+        Requests are bounded per provider (see ``set_max_concurrency``), so
+        callers can ``asyncio.gather`` many of these without flooding the API.
+        A missed deadline cancels the in-flight request.
+        """
+        request = self._request(system_prompt, user_prompt, phase, schema, stable_prefix, template)
+        timeout = self._effective_timeout(timeout)
+        if timeout is None:
+            return await self._agenerate_cached(request, retries, None)
+
+        deadline = Deadline(timeout)
+        deadline.check()
+        try:
+            return await asyncio.wait_for(
+                self._agenerate_cached(request, retries, deadline),
+                timeout=deadline.remaining(),
+            )
+        except asyncio.TimeoutError:
+            deadline.cancel()
+            raise LLMTimeoutError(f"LLM call ({phase or 'unnamed'}) exceeded {timeout:.1f}s deadline")
+
+    def _request_key(self, request: LLMRequest) -> str:
+        return self.request_key(
+            request.system_prompt, request.user_prompt, request.phase, request.template, request.schema
+        )
+
+    def _generate_cached(self, request: LLMRequest, retries: int, deadline: Deadline | None) -> dict:
+        key = self._request_key(request)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        def generate(deadline: Deadline | None) -> dict:
+            result = self._generate_json(request, retries, deadline)
+            if self.cache is not None:
+                self.cache.put(key, result)
+            return result
+
+        if self.single_flight is None:
+            return generate(deadline)
+        # The shared call serves every waiter, so no single caller's deadline bounds it
+        return self.single_flight.do(key, lambda: generate(None), timeout=Deadline.remaining_of(deadline))
+
+    async def _agenerate_cached(self, request: LLMRequest, retries: int, deadline: Deadline | None) -> dict:
+        key = self._request_key(request)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        async def generate(deadline: Deadline | None) -> dict:
+            result = await self._agenerate_json(request, retries, deadline)
+            if self.cache is not None:
+                self.cache.put(key, result)
+            return result
+
+        if self.single_flight is None:
+            return await generate(deadline)
+        return await self.single_flight.ado(key, lambda: generate(None), timeout=Deadline.remaining_of(deadline))
+
+    def _generate_json(self, request: LLMRequest, retries: int, deadline: Deadline | None) -> dict:
+        request = replace(request, deadline=deadline)
+        last_error = None
+        attempt_request = request
+
+        for attempt in range(retries + 1):
+            # Cooperative cancellation: never start another round-trip past the deadline
+            if deadline is not None:
+                deadline.check()
+            raw_text = self._attempt(attempt_request)
+
+            try:
+                return self._parse_response(raw_text, request.schema, request.template)
+
+            except (JSONRepairError, ValidationError) as e:
+                last_error = f"Attempt {attempt + 1}: {e}\nRaw:\n{raw_text}"
+                if attempt < retries:
+                    self.parse_stats.record_reprompt()
+                    attempt_request = request.with_user_prompt(self._retry_prompt(e, request.user_prompt))
+
+        self.parse_stats.record_failure()
+        raise self._exhausted(retries, last_error)
+
+    async def _agenerate_json(self, request: LLMRequest, retries: int, deadline: Deadline | None) -> dict:
+        request = replace(request, deadline=deadline)
+        last_error = None
+        attempt_request = request
+
+        for attempt in range(retries + 1):
+            if deadline is not None:
+                deadline.check()
+            raw_text = await self._aattempt(attempt_request)
+
+            try:
+                return self._parse_response(raw_text, request.schema, request.template)
+
+            except (JSONRepairError, ValidationError) as e:
+                last_error = f"Attempt {attempt + 1}: {e}\nRaw:\n{raw_text}"
+                if attempt < retries:
+                    self.parse_stats.record_reprompt()
+                    attempt_request = request.with_user_prompt(self._retry_prompt(e, request.user_prompt))
+
+        self.parse_stats.record_failure()
+        raise self._exhausted(retries, last_error)
@@ -0,0 +1,146 @@
+"""
+Explicit context caching for Gemini.
+
+Gemini can store a prompt prefix server-side ("cached contents") and bill
+later requests only for the uncached suffix. The prefix here is the stable
+part of a prompt-layout prompt: the system prompt plus the bill section
+(see ``prompts.py``).
+
+Caches are created lazily and reused until shortly before their TTL
+expires. A prefix the provider refuses (for example one below the model's
+minimum cacheable size) is not tried again until a backoff period has
+passed; meanwhile its requests rely on the provider's implicit prefix caching.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+
+from parliament.llm.rate_limit import estimate_tokens
+
+
+class GeminiContextCache:
+    """
+    Creates and reuses Gemini cached contents keyed by (model, system prompt, prefix).
+
+    Args:
+        client: A ``google.genai.Client``.
+        ttl_seconds: Lifetime requested for each cached content.
+        min_tokens: Estimated prefix size below which no cache is created.
+            The default only skips trivial prefixes: a faction's system
+            prompt plus the bill is roughly 100-300 tokens here, and the
+            minimum the provider accepts depends on the model, so a prefix
+            it rejects is left to ``failure_backoff``.
+        failure_backoff: Seconds to wait before retrying a prefix whose
+            cache creation failed.
+    """
+
+    def __init__(
+        self,
+        client,
+        ttl_seconds: float = 600.0,
+        min_tokens: int = 64,
+        failure_backoff: float = 600.0,
+    ):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.min_tokens = min_tokens
+        self.failure_backoff = failure_backoff
+        self._entries: dict[str, tuple[str, float]] = {}  # key -> (cache name, expires_at)
+        self._failed: dict[str, float] = {}  # key -> time before which creation is not retried
+        self._lock = threading.Lock()
+        self._creating: dict[str, threading.Lock] = {}  # key -> lock held while its cache is created
+        self.created = 0
+        self.reused = 0
+        self.errors = 0
+        self.skipped = 0  # Lookups not attempted because the prefix failed recently
+
+    @staticmethod
+    def _key(model: str, system_prompt: str, prefix: str) -> str:
+        return hashlib.sha256("\x00".join((model, system_prompt, prefix)).encode("utf-8")).hexdigest()
+
+    def _reuse(self, key: str) -> str | None:
+        # Do not hand out a cache that may expire while the request is in flight
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] - time.monotonic() > 30.0:
+                self.reused += 1
+                return entry[0]
+            return None
+
+    def _backing_off(self, key: str) -> bool:
+        with self._lock:
+            retry_at = self._failed.get(key)
+            if retry_at is None:
+                return False
+            if retry_at > time.monotonic():
+                self.skipped += 1
+                return True
+            del self._failed[key]
+            return False
+
+    def lookup(self, model: str, system_prompt: str, prefix: str) -> str | None:
+        """
+        Name of a live cached content for this prefix, creating one if worthwhile.
+
+        Creation is a network call, so it runs outside the shared lock: only
+        callers waiting for the same prefix block on each other, and they
+        reuse the cache the first one created. A failed creation is
+        remembered, so the prefix goes out uncached without another attempt
+        until ``failure_backoff`` has passed.
+        """
+        if estimate_tokens(system_prompt, prefix) < self.min_tokens:
+            return None
+
+        key = self._key(model, system_prompt, prefix)
+        name = self._reuse(key)
+        if name is not None or self._backing_off(key):
+            return name
+        with self._lock:
+            creating = self._creating.setdefault(key, threading.Lock())
+
+        with creating:
+            name = self._reuse(key)
+            if name is not None or self._backing_off(key):
+                return name
+            try:
+                cached = self.client.caches.create(
+                    model=model,
+                    config={
+                        "system_instruction": system_prompt,
+                        "contents": [prefix],
+                        "ttl": f"{int(self.ttl_seconds)}s",
+                    },
+                )
+            except Exception:
+                # Caching is an optimisation; the request goes out uncached
+                with self._lock:
+                    self.errors += 1
+                    self._failed[key] = time.monotonic() + self.failure_backoff
+                return None
+
+            with self._lock:
+                self._entries[key] = (cached.name, time.monotonic() + self.ttl_seconds)
+                self.created += 1
+            return cached.name
+
+    async def alookup(self, model: str, system_prompt: str, prefix: str) -> str | None:
+        """Async ``lookup``; a cache creation runs in a worker thread, off the event loop."""
+        if estimate_tokens(system_prompt, prefix) < self.min_tokens:
+            return None
+        key = self._key(model, system_prompt, prefix)
+        name = self._reuse(key)
+        if name is not None or self._backing_off(key):
+            return name
+        return await asyncio.to_thread(self.lookup, model, system_prompt, prefix)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "created": self.created,
+                "reused": self.reused,
+                "errors": self.errors,
+                "skipped": self.skipped,
+                "live": sum(1 for _, expires_at in self._entries.values() if expires_at > time.monotonic()),
+            }
@@ -0,0 +1,57 @@
+"""
+Deadlines and cooperative cancellation for LLM calls.
+
+A Deadline is an absolute point in time. Sessions create one per phase and
+hand it to agents and the Speaker, which pass the remaining time to
+``LLMClient.generate_json(timeout=...)``. When the deadline passes, the
+call raises LLMTimeoutError and the caller's existing degradation path runs
+(ABSTAIN vote, pass on debate, default order).
+"""
+
+import threading
+import time
+
+
+class LLMTimeoutError(TimeoutError):
+    """Raised when an LLM call misses its deadline."""
+
+
+class Deadline:
+    """
+    An absolute deadline that can also be cancelled early.
+
+    Usage:
+        deadline = Deadline.after(30.0)   # None if no limit
+        llm.generate_json(system, user, timeout=Deadline.remaining_of(deadline))
+    """
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+        self._cancelled = threading.Event()
+
+    @classmethod
+    def after(cls, seconds: float | None) -> "Deadline | None":
+        return cls(seconds) if seconds is not None else None
+
+    @staticmethod
+    def remaining_of(deadline: "Deadline | None") -> float | None:
+        """Remaining seconds of an optional deadline (None means unbounded)."""
+        return deadline.remaining() if deadline is not None else None
+
+    def remaining(self) -> float:
+        if self._cancelled.is_set():
+            return 0.0
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def cancel(self) -> None:
+        """Stop any further work (e.g. retries) tied to this deadline."""
+        self._cancelled.set()
+
+    def check(self) -> None:
+        """Raise LLMTimeoutError if the deadline has passed or was cancelled."""
+        if self.expired:
+            raise LLMTimeoutError("LLM call deadline exceeded")
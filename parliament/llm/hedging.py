@@ -0,0 +1,180 @@
+"""
+Hedged LLM requests to cut tail latency.
+
+If a request has not completed by a percentile of recently observed
+latencies (p95 by default), a duplicate "hedge" request is sent —
+optionally to a second provider — and whichever finishes first wins.
+The loser is cancelled (async) or abandoned (sync; a blocking HTTP call
+cannot be interrupted, its result is simply discarded).
+
+Every answered call adds its elapsed time to the latency window, including
+calls the hedge won: the slow primary took at least that long, and leaving
+it out would teach the percentile only from fast calls and shrink the
+hedge delay over time.
+
+Hedges cost extra requests, so the policy counts how often it hedges and
+how often the hedge actually wins; tune ``percentile`` against those.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Awaitable, Callable
+
+
+class HedgePolicy:
+    """
+    When and where to send hedge requests.
+
+    Args:
+        percentile: Latency percentile after which a hedge is sent.
+        initial_delay: Hedge delay (seconds) until ``min_samples`` latencies are observed.
+        min_delay: Lower bound on the hedge delay, to avoid hedging every call.
+        min_samples: Observations needed before the percentile is trusted.
+        window: Number of recent latencies kept.
+        phases: Call sites to hedge (e.g. {"vote", "speaker_veto"}); None hedges all.
+        hedge_client: LLMClient to send hedges to (e.g. a second provider);
+            None re-sends to the same client.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 5.0,
+        min_delay: float = 0.05,
+        min_samples: int = 20,
+        window: int = 200,
+        phases: set[str] | None = None,
+        hedge_client=None,
+        max_workers: int = 32,
+    ):
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.phases = phases
+        self.hedge_client = hedge_client
+        self.max_workers = max_workers
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    # ---- Policy ----
+
+    def applies_to(self, phase: str | None) -> bool:
+        return self.phases is None or phase in self.phases
+
+    def delay(self) -> float:
+        """Seconds to wait for the primary before sending a hedge."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return self.initial_delay
+            ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, round(self.percentile / 100 * (len(ordered) - 1)))
+        return max(self.min_delay, ordered[index])
+
+    def _record(self, latency: float | None = None, hedged: bool = False, hedge_won: bool = False) -> None:
+        with self._lock:
+            self.calls += 1
+            self.hedged += hedged
+            self.hedge_wins += hedge_won
+            if latency is not None:
+                self._latencies.append(latency)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "hedge_rate": self.hedged / self.calls if self.calls else 0.0,
+                "hedge_win_rate": self.hedge_wins / self.hedged if self.hedged else 0.0,
+            }
+
+    # ---- Execution ----
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="llm-hedge"
+                )
+            return self._executor
+
+    def run(self, primary: Callable[[], str], hedge: Callable[[], str]) -> str:
+        """Run ``primary``; if it is slow, race it against ``hedge``."""
+        pool = self._pool()
+        started = time.monotonic()
+        primary_future = pool.submit(primary)
+        try:
+            result = primary_future.result(timeout=self.delay())
+        except FutureTimeoutError:
+            pass
+        else:
+            self._record(latency=time.monotonic() - started)
+            return result
+
+        hedge_future = pool.submit(hedge)
+        pending = {primary_future, hedge_future}
+        errors = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    # When the hedge wins, the primary took at least this long too
+                    self._record(
+                        latency=time.monotonic() - started,
+                        hedged=True,
+                        hedge_won=future is hedge_future,
+                    )
+                    return future.result()
+                errors.append(future.exception())
+        self._record(hedged=True)
+        raise errors[0]
+
+    async def arun(
+        self,
+        primary: Callable[[], Awaitable[str]],
+        hedge: Callable[[], Awaitable[str]],
+    ) -> str:
+        """Async counterpart of ``run``; the losing request is cancelled."""
+        started = time.monotonic()
+        primary_task = asyncio.ensure_future(primary())
+        pending = {primary_task}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.delay())
+            if done:
+                result = primary_task.result()
+                self._record(latency=time.monotonic() - started)
+                return result
+
+            hedge_task = asyncio.ensure_future(hedge())
+            pending = {primary_task, hedge_task}
+            errors = []
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self._record(
+                            latency=time.monotonic() - started,
+                            hedged=True,
+                            hedge_won=task is hedge_task,
+                        )
+                        return task.result()
+                    errors.append(task.exception())
+            self._record(hedged=True)
+            raise errors[0]
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,66 @@
+"""
+Per-phase model tiering and generation parameters.
+
+Each LLM call site (statement, debate, amendments, vote, speaker_veto,
+speaker_order) can run on its own model with its own output cap,
+temperature and stop sequences. High-volume, low-stakes phases can then use
+a fast small model with a tight cap, and only the binding decisions pay for
+the large model.
+
+Profiles are loaded per provider from YAML (see ``config/models.yaml``)::
+
+    cerebras:
+      default:   {max_tokens: 400}
+      statement: {model: llama3.1-8b, max_tokens: 150, temperature: 0.7}
+      vote:      {model: llama-3.3-70b, temperature: 0.0}
+
+``default`` fills in any setting a phase does not override. Unset values
+fall back to the client's model and the provider's defaults.
+"""
+
+from pathlib import Path
+
+import yaml
+from pydantic import BaseModel, ConfigDict
+
+
+PHASES = ("statement", "debate", "amendments", "vote", "speaker_veto", "speaker_order")
+
+
+class GenerationProfile(BaseModel):
+    """Model and generation parameters for one call site."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    model: str | None = None
+    max_tokens: int | None = None
+    temperature: float | None = None
+    stop: tuple[str, ...] | None = None
+
+    def params(self) -> dict:
+        """Generation parameters that are set (everything but the model)."""
+        return self.model_dump(exclude={"model"}, exclude_none=True)
+
+
+DEFAULT_PROFILE = GenerationProfile()
+
+
+def build_phase_profiles(table: dict) -> dict[str, GenerationProfile]:
+    """Validate one provider's routing table and resolve ``default`` into every phase."""
+    unknown = set(table) - set(PHASES) - {"default"}
+    if unknown:
+        raise ValueError(f"Unknown phase(s) in model routing table: {sorted(unknown)}")
+
+    default = table.get("default") or {}
+    return {
+        phase: GenerationProfile(**{**default, **(table.get(phase) or {})})
+        for phase in PHASES
+        if phase in table or default
+    }
+
+
+def load_phase_profiles(path: str | Path) -> dict[str, dict[str, GenerationProfile]]:
+    """Load ``{provider: {phase: GenerationProfile}}`` from a YAML file."""
+    with open(path, "r", encoding="utf-8") as fh:
+        data = yaml.safe_load(fh) or {}
+    return {provider: build_phase_profiles(table or {}) for provider, table in data.items()}
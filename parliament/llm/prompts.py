@@ -0,0 +1,199 @@
+"""
+Prefix-stable prompt assembly.
+
+Providers cache the longest previously seen prompt prefix (OpenAI-compatible
+prefix caching, Gemini implicit and explicit context caching). A prefix only
+hits if it is byte-identical, so every prompt is assembled in one canonical
+order, from most to least stable:
+
+    system: faction identity → ideology → precedents
+    user:   the bill → per-call suffix (task, round, amendments, ...)
+
+Everything a faction sends about one bill therefore shares the system
+prompt and the bill section, and only the suffix differs between phases.
+``stable_prefix`` marks how much of the user prompt is shared, so backends
+with explicit caching (Gemini cached contents) can cache exactly that part.
+
+Prompt text lives in versioned PromptTemplates. Static sections (a
+faction's identity and ideology) are rendered once per agent; every
+template carries a content hash, and the ids of the templates behind a
+request travel with it into cache keys and parse telemetry, so a prompt
+regression can be traced to the template version that caused it.
+"""
+
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from functools import cached_property
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """A named, versioned piece of prompt text with ``str.format`` placeholders."""
+
+    name: str
+    version: int
+    text: str
+
+    @cached_property
+    def hash(self) -> str:
+        """Stable content hash; changes whenever the wording or version changes."""
+        payload = f"{self.name}\x00{self.version}\x00{self.text}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    @property
+    def id(self) -> str:
+        return f"{self.name}@v{self.version}:{self.hash[:8]}"
+
+    def render(self, **fields) -> str:
+        return self.text.format(**fields)
+
+    def compile(self, compiled_name: str, **fields) -> "PromptTemplate":
+        """Render the static fields once, keeping this template's version."""
+        return PromptTemplate(name=compiled_name, version=self.version, text=self.render(**fields))
+
+
+_templates_lock = threading.Lock()
+_templates: dict[str, PromptTemplate] = {}
+
+
+def register_template(template: PromptTemplate) -> PromptTemplate:
+    """Add a template to the process-wide registry (e.g. for telemetry listings)."""
+    with _templates_lock:
+        _templates[template.name] = template
+    return template
+
+
+def template_hashes() -> dict[str, str]:
+    """``{template id: content hash}`` for every registered template."""
+    with _templates_lock:
+        return {t.id: t.hash for t in _templates.values()}
+
+
+IDEOLOGY_KEYS = ("goal", "priorities", "red_lines")  # Fields the identity template renders
+
+IDENTITY_TEMPLATE = register_template(PromptTemplate(
+    name="faction_identity",
+    version=1,
+    text=(
+        "You are the {name} faction in the AI Parliament.\n"
+        "\n"
+        "Goal: {goal}\n"
+        "Priorities: {priorities}\n"
+        "Red lines: {red_lines}\n"
+    ),
+))
+
+
+@dataclass(frozen=True)
+class LayoutPrompt:
+    system_prompt: str
+    user_prompt: str
+    stable_prefix: int  # Leading characters of user_prompt shared by every call on this bill
+    template_ids: tuple[str, ...] = field(default=())  # Templates the prompt was rendered from
+
+    @property
+    def template_id(self) -> str | None:
+        return "+".join(self.template_ids) or None
+
+
+def compile_identity(name: str, ideology: dict) -> PromptTemplate:
+    """
+    Faction identity and ideology, rendered once: the most stable part of every faction prompt.
+
+    Raises ValueError naming any of goal, priorities or red_lines the ideology lacks.
+    """
+    missing = [key for key in IDEOLOGY_KEYS if key not in ideology]
+    if missing:
+        raise ValueError(f"Ideology of faction {name!r} is missing required key(s): {', '.join(missing)}")
+    return IDENTITY_TEMPLATE.compile(
+        f"identity/{name}",
+        name=name,
+        goal=ideology["goal"],
+        priorities=ideology["priorities"],
+        red_lines=ideology["red_lines"],
+    )
+
+
+def bill_section(bill, details: bool = False) -> str:
+    """The bill under consideration; ``details`` adds title, risks and unknowns."""
+    if not details:
+        return f"Bill:\n{bill.proposal}\n"
+    return (
+        f"Bill: {bill.title}\n"
+        f"Proposal: {bill.proposal}\n"
+        f"\n"
+        f"Known Risks: {bill.known_risks}\n"
+        f"Unknowns: {bill.unknowns}\n"
+    )
+
+
+def assemble(
+    identity: PromptTemplate,
+    bill: str,
+    task: PromptTemplate,
+    precedents: str = "",
+    **fields,
+) -> LayoutPrompt:
+    """
+    Assemble a prompt in canonical order; only the rendered ``task`` may vary per call.
+
+    ``identity`` must already be fully rendered (see ``PromptTemplate.compile``);
+    ``fields`` fill the ``task`` template's placeholders.
+    """
+    system_prompt = identity.text
+    if precedents:
+        system_prompt += f"\n{precedents}\n"
+    return LayoutPrompt(
+        system_prompt=system_prompt,
+        user_prompt=f"{bill}\n{task.render(**fields)}",
+        stable_prefix=len(bill) + 1,
+        template_ids=(identity.id, task.id),
+    )
+
+
+# ---- Cached-token telemetry ----
+
+class PromptCacheStats:
+    """Per-phase prompt tokens and how many of them were served from a provider cache."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._phases: dict[str, list[int]] = {}  # phase -> [requests, prompt_tokens, cached_tokens]
+
+    def record(self, phase: str | None, prompt_tokens: int, cached_tokens: int) -> None:
+        with self._lock:
+            entry = self._phases.setdefault(phase or "unnamed", [0, 0, 0])
+            entry[0] += 1
+            entry[1] += prompt_tokens
+            entry[2] += cached_tokens
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                phase: {
+                    "requests": requests,
+                    "prompt_tokens": prompt_tokens,
+                    "cached_tokens": cached_tokens,
+                    "cached_ratio": cached_tokens / prompt_tokens if prompt_tokens else 0.0,
+                }
+                for phase, (requests, prompt_tokens, cached_tokens) in self._phases.items()
+            }
+
+
+def usage_tokens(response) -> tuple[int, int] | None:
+    """
+    (prompt_tokens, cached_tokens) reported by a provider response, or None.
+
+    Understands Gemini ``usage_metadata`` and LangChain ``AIMessage.usage_metadata``.
+    """
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return None
+    if isinstance(usage, dict):
+        details = usage.get("input_token_details") or {}
+        return usage.get("input_tokens") or 0, details.get("cache_read") or 0
+    prompt_tokens = getattr(usage, "prompt_token_count", None)
+    if prompt_tokens is None:
+        return None
+    return prompt_tokens, getattr(usage, "cached_content_token_count", None) or 0
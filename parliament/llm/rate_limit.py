@@ -0,0 +1,186 @@
+"""
+Provider-scoped token-bucket rate limiting for LLM requests.
+
+Each provider gets one limiter shared by every LLMClient in the process.
+A limiter holds two buckets — requests per minute and tokens per minute —
+and callers wait (rather than fail) until both have capacity. Token usage
+is estimated from prompt size, since the real count is only known after
+the response arrives.
+
+Queue depth and cumulative wait time are exposed via ``stats()`` so that
+throttling shows up in telemetry instead of as silent ABSTAIN votes.
+"""
+
+import asyncio
+import math
+import threading
+import time
+
+
+def estimate_tokens(*texts: str, max_output_tokens: int = 0) -> int:
+    """Rough token estimate (~4 characters per token) plus expected output."""
+    chars = sum(len(t) for t in texts)
+    return max(1, math.ceil(chars / 4)) + max_output_tokens
+
+
+class TokenBucket:
+    """
+    Classic token bucket refilled continuously at ``rate_per_minute``.
+
+    Not thread-safe on its own; RateLimiter serialises access.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: float | None = None):
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate_per_second)
+            self.updated_at = now
+
+    def time_until_available(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` tokens are available (0 if available now)."""
+        self._refill(now)
+        # A request larger than the bucket can never fit; let it through once the bucket is full
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate_per_second
+
+    def consume(self, amount: float) -> None:
+        self.tokens -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limiter that queues callers.
+
+    Usage:
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=100_000)
+        limiter.acquire(tokens=estimate_tokens(system, user))
+        await limiter.aacquire(tokens=...)
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+    ):
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._lock = threading.Lock()
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.total_wait_seconds = 0.0
+        self.throttled_requests = 0
+        self.granted_requests = 0
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Consume capacity and return 0, or return the seconds to wait before retrying."""
+        now = time.monotonic()
+        wait = 0.0
+        if self.request_bucket is not None:
+            wait = max(wait, self.request_bucket.time_until_available(1, now))
+        if self.token_bucket is not None:
+            wait = max(wait, self.token_bucket.time_until_available(tokens, now))
+        if wait == 0.0:
+            if self.request_bucket is not None:
+                self.request_bucket.consume(1)
+            if self.token_bucket is not None:
+                self.token_bucket.consume(tokens)
+        return wait
+
+    def _enqueue(self) -> None:
+        with self._lock:
+            self.queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+
+    def _dequeue(self, waited: float, throttled: bool) -> None:
+        with self._lock:
+            self.queue_depth -= 1
+            self.granted_requests += 1
+            if throttled:
+                self.throttled_requests += 1
+                self.total_wait_seconds += waited
+
+    def acquire(self, tokens: int = 1) -> float:
+        """Block until the request fits both budgets. Returns the time spent waiting."""
+        started = time.monotonic()
+        throttled = False
+        self._enqueue()
+        try:
+            while True:
+                with self._lock:
+                    wait = self._try_acquire(tokens)
+                if wait == 0.0:
+                    break
+                throttled = True
+                time.sleep(wait)
+        finally:
+            waited = time.monotonic() - started
+            self._dequeue(waited, throttled)
+        return waited if throttled else 0.0
+
+    async def aacquire(self, tokens: int = 1) -> float:
+        """Async counterpart of ``acquire``; waits without blocking the event loop."""
+        started = time.monotonic()
+        throttled = False
+        self._enqueue()
+        try:
+            while True:
+                with self._lock:
+                    wait = self._try_acquire(tokens)
+                if wait == 0.0:
+                    break
+                throttled = True
+                await asyncio.sleep(wait)
+        finally:
+            waited = time.monotonic() - started
+            self._dequeue(waited, throttled)
+        return waited if throttled else 0.0
+
+    def stats(self) -> dict:
+        granted = self.granted_requests
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "granted_requests": granted,
+            "throttled_requests": self.throttled_requests,
+            "total_wait_seconds": self.total_wait_seconds,
+            "mean_wait_seconds": self.total_wait_seconds / granted if granted else 0.0,
+        }
+
+
+# ---- Process-wide registry ----
+
+_limiters_lock = threading.Lock()
+_limiters: dict[str, RateLimiter] = {}
+
+
+def set_rate_limit(
+    provider: str,
+    requests_per_minute: float | None = None,
+    tokens_per_minute: float | None = None,
+) -> RateLimiter:
+    """Install (or replace) the shared limiter for a provider."""
+    limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+    with _limiters_lock:
+        _limiters[provider] = limiter
+    return limiter
+
+
+def get_rate_limiter(provider: str) -> RateLimiter | None:
+    """Return the shared limiter for a provider, or None if it is not rate limited."""
+    with _limiters_lock:
+        return _limiters.get(provider)
+
+
+def clear_rate_limits() -> None:
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,280 @@
+"""
+Local JSON repair for model output.
+
+Most malformed responses are nearly right: wrapped in prose, fenced with an
+unterminated ```, using single quotes or Python literals, carrying trailing
+commas, or cut off mid-object. Re-prompting costs a full round-trip; fixing
+these locally costs microseconds. ``parse_model_json`` tries, in order:
+
+1. strict ``json.loads`` on the (de-fenced) text;
+2. a single-pass normaliser that extracts the first top-level JSON value,
+   converts single-quoted strings and Python literals, drops trailing
+   commas and closes a truncated object;
+3. progressively shorter prefixes of a truncated object, cut at the last
+   complete member.
+
+Truncation is only repaired where nothing can be lost silently: a dangling
+key is dropped and the missing members of an object then fail schema
+validation. Output cut off inside a string value or inside an array (where
+any number of elements may be missing) is unrepairable and re-prompted.
+Previews of a value still being streamed pass ``partial=True`` to close
+those as well.
+
+The result can then be validated directly against the target pydantic
+schema (``validate_schema``) so a repaired-but-wrong value still triggers
+a re-prompt.
+"""
+
+import json
+import re
+import threading
+from typing import Any
+
+from pydantic import TypeAdapter
+
+
+_FENCE_RE = re.compile(r"```(?:json|JSON)?[ \t]*\n?")
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class JSONRepairError(ValueError):
+    """Raised when model output cannot be parsed even after local repair."""
+
+
+def strip_fences(text: str) -> str:
+    """Return the content of the first ``` fence, tolerating a missing closing fence."""
+    text = text.strip()
+    match = _FENCE_RE.search(text)
+    if not match:
+        return text
+    body = text[match.end():]
+    closing = body.find("```")
+    return (body[:closing] if closing != -1 else body).strip()
+
+
+def _strip_trailing_comma(out: list[str]) -> None:
+    while out and out[-1].isspace():
+        out.pop()
+    if out and out[-1] == ",":
+        out.pop()
+
+
+def _in_key_position(out: list[str], stack: list[str]) -> bool:
+    """Whether a string starting now would be an object key."""
+    if not stack or stack[-1] != "{":
+        return False
+    previous = next((c for c in reversed(out) if not c.isspace()), "")
+    return previous in "{,"
+
+
+def _normalise(text: str) -> tuple[str, list[str], list[tuple[int, tuple[str, ...]]], str | None]:
+    """
+    Scan ``text`` from its first ``{``/``[`` and rewrite it as strict JSON.
+
+    Returns (body, open_brackets, cut_points, open_string). ``body`` stops
+    where the first top-level value closes, so trailing prose is dropped. If
+    the value is truncated, ``open_brackets`` lists what still needs closing,
+    ``cut_points`` records (offset, open_brackets) after each complete
+    element, for progressively shorter fallbacks, and ``open_string`` is
+    "key" or "value" when the text ends inside a string.
+    """
+    start = min((i for i in (text.find("{"), text.find("[")) if i != -1), default=-1)
+    if start == -1:
+        raise JSONRepairError("No JSON object or array found in model output")
+
+    out: list[str] = []
+    stack: list[str] = []
+    cuts: list[tuple[int, tuple[str, ...]]] = []
+    quote: str | None = None
+    quote_is_key = False
+    i, n = start, len(text)
+
+    while i < n:
+        ch = text[i]
+
+        if quote is not None:
+            if ch == "\\" and i + 1 < n:
+                nxt = text[i + 1]
+                # \' is not a valid JSON escape
+                out.append("'" if nxt == "'" else ch + nxt)
+                i += 2
+                continue
+            if ch == quote:
+                out.append('"')
+                quote = None
+            elif ch == '"':
+                out.append('\\"')  # Only reachable inside a single-quoted string
+            elif ch == "\n":
+                out.append("\\n")
+            else:
+                out.append(ch)
+            i += 1
+            continue
+
+        if ch in "\"'":
+            quote = ch
+            quote_is_key = _in_key_position(out, stack)
+            out.append('"')
+        elif ch in "{[":
+            stack.append(ch)
+            out.append(ch)
+            cuts.append((len(out), tuple(stack)))
+        elif ch in "}]":
+            _strip_trailing_comma(out)
+            if stack:
+                stack.pop()
+            out.append(ch)
+            if not stack:
+                break
+        elif ch == ",":
+            cuts.append((len(out), tuple(stack)))
+            out.append(ch)
+        elif ch.isalpha() or ch == "_":
+            j = i
+            while j < n and (text[j].isalnum() or text[j] == "_"):
+                j += 1
+            word = text[i:j]
+            out.append(_PYTHON_LITERALS.get(word, word))
+            i = j
+            continue
+        else:
+            out.append(ch)
+        i += 1
+
+    open_string = None
+    if quote is not None:
+        out.append('"')
+        open_string = "key" if quote_is_key else "value"
+    return "".join(out), stack, cuts, open_string
+
+
+def _close(body: str, stack: list[str] | tuple[str, ...]) -> str:
+    chars = list(body)
+    _strip_trailing_comma(chars)
+    body = "".join(chars).rstrip()
+    if stack and stack[-1] == "{":
+        # A dangling key ("key" or "key":) cannot be completed; drop it
+        body = re.sub(r'(?:,|(?<={))\s*"(?:[^"\\]|\\.)*"\s*:?\s*$', "", body)
+    body = re.sub(r":\s*$", ": null", body)
+    return body + "".join(_CLOSERS[b] for b in reversed(stack))
+
+
+def repair_candidates(text: str, partial: bool = False) -> list[str]:
+    """
+    Repaired JSON texts to try, best first.
+
+    Raises JSONRepairError when the text is truncated where repair would
+    silently lose content (see the module docstring), unless ``partial``.
+    """
+    body, stack, cuts, open_string = _normalise(strip_fences(text))
+    if not stack:
+        return [body]
+    if not partial:
+        if "[" in stack:
+            raise JSONRepairError("Output was cut off inside an array; elements may be missing")
+        if open_string == "value":
+            raise JSONRepairError("Output was cut off inside a string value")
+        # Never fall back to a cut that would drop array elements
+        cuts = [(offset, open_at_cut) for offset, open_at_cut in cuts if "[" not in open_at_cut]
+    candidates = [_close(body, stack)]
+    for offset, open_at_cut in reversed(cuts):
+        candidates.append(_close(body[:offset], open_at_cut))
+    return candidates
+
+
+def parse_model_json(text: str, partial: bool = False) -> tuple[Any, bool]:
+    """
+    Parse model output, repairing it locally if needed.
+
+    Returns (value, repaired). Raises JSONRepairError if nothing parses.
+    With ``partial`` the text is an unfinished value being previewed, and
+    truncated strings and arrays are closed rather than rejected.
+    """
+    try:
+        return json.loads(strip_fences(text)), False
+    except json.JSONDecodeError as strict_error:
+        error: Exception = strict_error
+
+    try:
+        candidates = repair_candidates(text, partial)
+    except JSONRepairError as repair_error:
+        raise JSONRepairError(f"Unrepairable JSON: {repair_error} ({error})") from error
+
+    for candidate in candidates:
+        try:
+            return json.loads(candidate), True
+        except json.JSONDecodeError:
+            continue
+    raise JSONRepairError(f"Unrepairable JSON: {error}")
+
+
+_adapters: dict[Any, TypeAdapter] = {}
+_adapters_lock = threading.Lock()
+
+
+def _adapter(schema) -> TypeAdapter:
+    with _adapters_lock:
+        adapter = _adapters.get(schema)
+        if adapter is None:
+            adapter = TypeAdapter(schema)
+            _adapters[schema] = adapter
+        return adapter
+
+
+def validate_schema(value: Any, schema) -> None:
+    """
+    Validate a parsed value against a pydantic model or type (e.g. ``list[AmendmentSchema]``).
+
+    Raises pydantic.ValidationError on mismatch.
+    """
+    _adapter(schema).validate_python(value)
+
+
+class ParseStats:
+    """Thread-safe counters for how model output was turned into JSON."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.responses = 0  # Raw responses examined
+        self.clean = 0  # Parsed and valid as-is
+        self.repaired = 0  # Parsed and valid only after local repair
+        self.invalid = 0  # Unrepairable or failed schema validation
+        self.reprompts = 0  # Extra round-trips spent on invalid responses
+        self.failures = 0  # Calls that gave up after all retries
+        # template id -> {"clean": n, "repaired": n, "invalid": n}, to trace regressions to a prompt version
+        self.by_template: dict[str, dict[str, int]] = {}
+
+    def _bump(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def record_response(self, outcome: str, template: str | None = None) -> None:
+        """Record one response as "clean", "repaired" or "invalid"."""
+        with self._lock:
+            self.responses += 1
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            if template is not None:
+                counts = self.by_template.setdefault(template, {"clean": 0, "repaired": 0, "invalid": 0})
+                counts[outcome] += 1
+
+    def record_reprompt(self) -> None:
+        self._bump("reprompts")
+
+    def record_failure(self) -> None:
+        self._bump("failures")
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            responses = self.responses
+            return {
+                "responses": responses,
+                "clean": self.clean,
+                "repaired": self.repaired,
+                "invalid": self.invalid,
+                "reprompts": self.reprompts,
+                "failures": self.failures,
+                "repair_rate": self.repaired / responses if responses else 0.0,
+                "reprompt_rate": self.reprompts / responses if responses else 0.0,
+                "by_template": {template: dict(counts) for template, counts in self.by_template.items()},
+            }
@@ -0,0 +1,218 @@
+"""
+Latency-aware multi-provider routing with automatic failover.
+
+An LLMRouter holds several backends (LLMClient instances, typically one per
+provider). For every request it:
+
+- ranks backends by their rolling latency (EWMA), penalised by error rate;
+- skips backends whose circuit breaker is open;
+- tries the best backend and fails over to the next one on error.
+
+Circuit breaker semantics per backend:
+
+- CLOSED: requests flow normally; consecutive failures are counted.
+- OPEN: after ``failure_threshold`` consecutive failures the backend is
+  skipped for ``reset_timeout`` seconds.
+- HALF_OPEN: after the timeout one trial request is allowed; success closes
+  the breaker, failure opens it again.
+
+Use it through LLMClient::
+
+    llm = LLMClient(provider="router", client=LLMRouter([cerebras_llm, gemini_llm]))
+"""
+
+import threading
+import time
+from collections import deque
+from enum import Enum
+
+
+class BreakerState(str, Enum):
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = BreakerState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+
+    def available(self, now: float) -> bool:
+        """Whether a request could be sent now (does not claim a half-open trial)."""
+        if self.state == BreakerState.CLOSED:
+            return True
+        if self.state == BreakerState.OPEN:
+            return now - self.opened_at >= self.reset_timeout
+        return not self._trial_in_flight
+
+    def allow_request(self, now: float) -> bool:
+        """Claim permission to send a request, moving OPEN to HALF_OPEN when due."""
+        if self.state == BreakerState.CLOSED:
+            return True
+        if self.state == BreakerState.OPEN and now - self.opened_at >= self.reset_timeout:
+            self.state = BreakerState.HALF_OPEN
+            self._trial_in_flight = False
+        if self.state == BreakerState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.state = BreakerState.CLOSED
+        self.consecutive_failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self, now: float) -> None:
+        self.consecutive_failures += 1
+        self._trial_in_flight = False
+        if self.state == BreakerState.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.state = BreakerState.OPEN
+            self.opened_at = now
+
+
+class RouterBackend:
+    """One routed backend plus its health statistics."""
+
+    def __init__(self, client, breaker: CircuitBreaker, alpha: float = 0.3, window: int = 50):
+        self.client = client
+        self.name = f"{client.provider}:{client.model}"
+        self.breaker = breaker
+        self.alpha = alpha
+        self.latency_ewma: float | None = None
+        self._outcomes: deque[bool] = deque(maxlen=window)  # True = error
+        self.requests = 0
+        self.failures = 0
+
+    @property
+    def error_rate(self) -> float:
+        return sum(self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    def score(self) -> float:
+        """Expected cost of a request: latency inflated by the error rate. Lower is better."""
+        # Untried backends score 0 so they get explored
+        latency = self.latency_ewma if self.latency_ewma is not None else 0.0
+        return latency / max(1.0 - self.error_rate, 0.05)
+
+    def record(self, latency: float, error: BaseException | None, now: float) -> None:
+        self.requests += 1
+        self._outcomes.append(error is not None)
+        if error is None:
+            self.latency_ewma = (
+                latency if self.latency_ewma is None
+                else self.alpha * latency + (1 - self.alpha) * self.latency_ewma
+            )
+            self.breaker.record_success()
+        else:
+            self.failures += 1
+            self.breaker.record_failure(now)
+
+
+class AllBackendsFailed(RuntimeError):
+    """Raised when every routed backend failed for a request."""
+
+
+class LLMRouter:
+    """
+    Routes each request to the fastest healthy backend, failing over on errors.
+
+    Args:
+        backends: LLMClient instances to route between, in priority order.
+        failure_threshold: Consecutive failures before a backend's breaker opens.
+        reset_timeout: Seconds an open breaker waits before allowing a trial request.
+    """
+
+    def __init__(self, backends: list, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        if not backends:
+            raise ValueError("LLMRouter needs at least one backend")
+        self.backends = [
+            RouterBackend(client, CircuitBreaker(failure_threshold, reset_timeout))
+            for client in backends
+        ]
+        self._lock = threading.Lock()
+        self.failovers = 0
+
+    def _candidates(self) -> tuple[list[RouterBackend], bool]:
+        """
+        Backends ranked by score, plus whether breakers must be honoured.
+
+        If every breaker is open, all backends are tried anyway: a request
+        that might fail beats one that certainly will.
+        """
+        now = time.monotonic()
+        with self._lock:
+            ranked = sorted(self.backends, key=RouterBackend.score)
+            any_available = any(b.breaker.available(now) for b in ranked)
+        return ranked, any_available
+
+    def _claim(self, backend: RouterBackend, honour_breaker: bool) -> bool:
+        if not honour_breaker:
+            return True
+        with self._lock:
+            return backend.breaker.allow_request(time.monotonic())
+
+    def _record(self, backend: RouterBackend, started: float, error: BaseException | None) -> None:
+        now = time.monotonic()
+        with self._lock:
+            backend.record(now - started, error, now)
+
+    def _failed(self, errors: list[str]) -> AllBackendsFailed:
+        return AllBackendsFailed("All LLM backends failed: " + ("; ".join(errors) or "no backend available"))
+
+    def complete(self, request) -> str:
+        ranked, honour_breaker = self._candidates()
+        errors = []
+        for backend in ranked:
+            if not self._claim(backend, honour_breaker):
+                continue
+            if errors:
+                self.failovers += 1
+            started = time.monotonic()
+            try:
+                text = backend.client._complete(request)
+            except Exception as exc:
+                self._record(backend, started, exc)
+                errors.append(f"{backend.name}: {exc}")
+                continue
+            self._record(backend, started, None)
+            return text
+        raise self._failed(errors)
+
+    async def acomplete(self, request) -> str:
+        ranked, honour_breaker = self._candidates()
+        errors = []
+        for backend in ranked:
+            if not self._claim(backend, honour_breaker):
+                continue
+            if errors:
+                self.failovers += 1
+            started = time.monotonic()
+            try:
+                text = await backend.client._acomplete(request)
+            except Exception as exc:
+                self._record(backend, started, exc)
+                errors.append(f"{backend.name}: {exc}")
+                continue
+            self._record(backend, started, None)
+            return text
+        raise self._failed(errors)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "failovers": self.failovers,
+                "backends": {
+                    b.name: {
+                        "state": b.breaker.state.value,
+                        "latency_ewma": b.latency_ewma,
+                        "error_rate": b.error_rate,
+                        "requests": b.requests,
+                        "failures": b.failures,
+                    }
+                    for b in self.backends
+                },
+            }
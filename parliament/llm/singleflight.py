@@ -0,0 +1,103 @@
+"""
+In-process single-flight coalescing for LLM requests.
+
+When several callers issue the same request (same content hash) at the same
+time, only the first one — the leader — reaches the provider. Everyone else
+waits on the leader's result instead of sending a duplicate HTTP call.
+
+Followers receive a deep copy of the leader's parsed JSON, so no caller can
+mutate what another caller sees. The shared work is never bound to one
+caller's deadline: each caller passes its own ``timeout`` and stops waiting
+when it runs out, while the request carries on for everyone else.
+"""
+
+import asyncio
+import copy
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls, for both threads and coroutines.
+
+    Usage:
+        flight = SingleFlight()
+        result = flight.do(key, lambda: expensive_call())
+        result = await flight.ado(key, lambda: expensive_coroutine())
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future] = {}
+        self._async_calls: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Task]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.leaders = 0  # Calls that actually ran
+        self.coalesced = 0  # Calls that reused an in-flight result
+
+    def do(self, key: str, fn: Callable[[], Any], timeout: float | None = None) -> Any:
+        """
+        Run ``fn`` unless an identical call is already in flight, then share its result.
+
+        A follower waits at most ``timeout`` seconds and then raises
+        TimeoutError. The leader runs ``fn`` in its own thread, so callers
+        that need to bound it run ``do`` on a worker thread.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._calls[key] = future
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+
+        if not is_leader:
+            return copy.deepcopy(future.result(timeout=timeout))
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[Any]], timeout: float | None = None) -> Any:
+        """
+        Async counterpart of ``do``.
+
+        The shared work runs as its own task, so one waiter being cancelled
+        or running out of ``timeout`` (TimeoutError) does not cancel the
+        request for everyone else.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            calls = self._async_calls.setdefault(loop, {})
+            task = calls.get(key)
+            is_leader = task is None
+            if is_leader:
+                task = loop.create_task(fn())
+                calls[key] = task
+                task.add_done_callback(lambda _: calls.pop(key, None))
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+
+        result = await asyncio.wait_for(asyncio.shield(task), timeout)
+        return result if is_leader else copy.deepcopy(result)
+
+    def stats(self) -> dict:
+        return {"leaders": self.leaders, "coalesced": self.coalesced}
+
+
+# Process-wide group shared by every LLMClient
+default_flight = SingleFlight()
@@ -0,0 +1,293 @@
+"""
+Streaming generation with incremental JSON parsing.
+
+Tokens are fed into an IncrementalJSONParser as they arrive. The stream is
+consumed only until:
+
+- the top-level JSON value closes (trailing commentary is never generated
+  past that point, so no tokens are spent on it), or
+- the output can no longer be valid for the target schema, e.g. a vote
+  ``choice`` that is not a prefix of APPROVE/REJECT/ABSTAIN.
+
+In both cases the text received so far is returned; an aborted response
+fails schema validation in the client and is re-prompted as usual.
+Partial values are passed to an optional ``on_partial(partial, done)``
+callback so a renderer can show fields while they are being written.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Iterator
+
+from parliament.llm.repair import JSONRepairError, parse_model_json
+from parliament.llm.structured import compile_json_schema
+
+
+PartialCallback = Callable[[Any, bool], None]
+
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f"}
+
+
+def _decode_key(raw: str) -> str:
+    raw = raw.strip()
+    if len(raw) >= 2 and raw[0] in "\"'" and raw[-1] == raw[0]:
+        raw = raw[1:-1]
+        try:
+            return json.loads(f'"{raw}"')
+        except json.JSONDecodeError:
+            return raw
+    return raw
+
+
+class IncrementalJSONParser:
+    """
+    Tracks the structure of a JSON value fed to it chunk by chunk.
+
+    Text before the first ``{``/``[`` is skipped and text after the
+    top-level value closes is ignored. Single-quoted strings are tracked
+    like double-quoted ones, matching the repair normaliser.
+
+    The partial value is kept up to date as input arrives rather than
+    re-parsed from the whole buffer: each top-level member is parsed once,
+    when the ``,`` or closing bracket after it arrives, and a top-level
+    string value still being written is decoded character by character.
+    Feeding is therefore linear in the total input; ``partial()`` costs one
+    copy of the completed members plus the open string.
+    """
+
+    def __init__(self):
+        self._chars: list[str] = []
+        self._depth = 0
+        self._quote: str | None = None
+        self._escaped = False
+        self._unicode: str | None = None  # Hex digits of a \uXXXX escape being read
+        self._in_value = False  # After a top-level ':' and before the next ','
+        self._top: str | None = None  # "{" or "["
+        self._members: dict | list = {}  # Completed top-level members or elements
+        self._member_start = 0  # Offset in _chars where the current member begins
+        self._key: str | None = None  # Key of the object member being written
+        self._value_text: list[str] | None = None  # Decoded top-level string value being written
+        self.version = 0  # Bumped whenever the partial value changes
+        self.started = False
+        self.complete = False
+
+    @property
+    def text(self) -> str:
+        return "".join(self._chars)
+
+    @property
+    def in_top_level_string_value(self) -> bool:
+        """Whether the parser is inside a string value of a top-level object key."""
+        return self._quote is not None and self._depth == 1 and self._in_value
+
+    def _complete_member(self) -> None:
+        """Parse the top-level member that just ended (before the last character) once."""
+        end = len(self._chars) - 1
+        raw = "".join(self._chars[self._member_start:end])
+        self._member_start = end + 1
+        self._key = None
+        self._value_text = None
+        if not raw.strip():
+            return
+        closer = "}" if self._top == "{" else "]"
+        try:
+            value, _ = parse_model_json(self._top + raw + closer)
+        except JSONRepairError:
+            return
+        if isinstance(self._members, dict) and isinstance(value, dict):
+            self._members.update(value)
+        elif isinstance(self._members, list) and isinstance(value, list):
+            self._members.extend(value)
+        self.version += 1
+
+    def _read_string_char(self, ch: str) -> None:
+        """Advance through one character inside a string, decoding a top-level value."""
+        text = self._value_text if self._depth == 1 and self._in_value else None
+        if self._escaped:
+            self._escaped = False
+            if ch == "u":
+                self._unicode = ""
+            elif text is not None:
+                text.append(_ESCAPES.get(ch, ch))
+        elif self._unicode is not None:
+            self._unicode += ch
+            if len(self._unicode) == 4:
+                if text is not None:
+                    try:
+                        text.append(chr(int(self._unicode, 16)))
+                    except ValueError:
+                        pass
+                self._unicode = None
+        elif ch == "\\":
+            self._escaped = True
+            return
+        elif ch == self._quote:
+            self._quote = None
+            return
+        elif text is not None:
+            text.append(ch)
+        else:
+            return
+        if text is not None:
+            self.version += 1
+
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk of model output. Returns True once the top-level value is complete."""
+        for ch in chunk:
+            if self.complete:
+                break
+            if not self.started:
+                if ch not in "{[":
+                    continue
+                self.started = True
+                self._top = ch
+                self._members = {} if ch == "{" else []
+                self._member_start = 1
+            self._chars.append(ch)
+
+            if self._quote is not None:
+                self._read_string_char(ch)
+                continue
+
+            if ch in "\"'":
+                self._quote = ch
+                if self._depth == 1 and self._in_value and self._top == "{":
+                    self._value_text = []
+                    self.version += 1
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._complete_member()
+                    self.complete = True
+            elif self._depth == 1 and ch == ":":
+                self._in_value = True
+                if self._top == "{":
+                    self._key = _decode_key("".join(self._chars[self._member_start:-1]))
+            elif self._depth == 1 and ch == ",":
+                self._in_value = False
+                self._complete_member()
+        return self.complete
+
+    def partial(self) -> Any:
+        """The value so far: completed members plus any top-level string value being written."""
+        if not self.started:
+            return None
+        if isinstance(self._members, list):
+            return list(self._members)
+        value = dict(self._members)
+        if self._key is not None and self._value_text is not None:
+            value[self._key] = "".join(self._value_text)
+        return value
+
+
+class StreamValidator:
+    """Detects partial output that can no longer satisfy a schema's enumerated fields."""
+
+    def __init__(self, schema):
+        properties = compile_json_schema(schema).get("properties", {})
+        self.enums = {
+            name: prop["enum"] for name, prop in properties.items() if "enum" in prop
+        }
+
+    def violation(self, partial: Any, open_string: bool) -> str | None:
+        """
+        Describe why ``partial`` cannot become valid, or return None.
+
+        ``open_string`` means the last top-level value is a string still
+        being written, so only a prefix match is required for it.
+        """
+        if not self.enums or not isinstance(partial, dict) or not partial:
+            return None
+        last_key = next(reversed(partial))
+        for key, allowed in self.enums.items():
+            if key not in partial:
+                continue
+            value = partial[key]
+            if open_string and key == last_key and isinstance(value, str):
+                if not any(isinstance(option, str) and option.startswith(value) for option in allowed):
+                    return f"{key}={value!r} cannot become one of {allowed}"
+            elif value not in allowed:
+                return f"{key}={value!r} is not one of {allowed}"
+        return None
+
+
+@lru_cache(maxsize=None)
+def stream_validator(schema) -> StreamValidator:
+    return StreamValidator(schema)
+
+
+class _StreamState:
+    """Shared bookkeeping for the sync and async consumers."""
+
+    def __init__(self, schema, on_partial: PartialCallback | None):
+        self.parser = IncrementalJSONParser()
+        self.validator = stream_validator(schema) if schema is not None else None
+        self.on_partial = on_partial
+        self.aborted: str | None = None
+        self._last_version = 0
+        self._received: list[str] = []
+
+    def feed(self, chunk: str) -> bool:
+        """Feed a chunk; returns True when the stream should stop."""
+        self._received.append(chunk)
+        if self.parser.feed(chunk):
+            return True
+        if self.validator is None and self.on_partial is None:
+            return False
+        if self.parser.version == self._last_version:
+            return False
+        self._last_version = self.parser.version
+        partial = self.parser.partial()
+        if self.validator is not None:
+            self.aborted = self.validator.violation(partial, self.parser.in_top_level_string_value)
+            if self.aborted:
+                return True
+        if self.on_partial is not None:
+            self.on_partial(partial, False)
+        return False
+
+    def finish(self) -> str:
+        if self.on_partial is not None:
+            self.on_partial(self.parser.partial(), True)
+        # Without any JSON, return everything so the re-prompt can quote it
+        return self.parser.text if self.parser.started else "".join(self._received)
+
+
+def consume_stream(
+    chunks: Iterator[str],
+    schema=None,
+    on_partial: PartialCallback | None = None,
+) -> str:
+    """Read ``chunks`` until the JSON value completes or becomes invalid; return the text read."""
+    state = _StreamState(schema, on_partial)
+    try:
+        for chunk in chunks:
+            if chunk and state.feed(chunk):
+                break
+    finally:
+        # Closing the generator stops the underlying HTTP stream
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+    return state.finish()
+
+
+async def aconsume_stream(
+    chunks: AsyncIterator[str],
+    schema=None,
+    on_partial: PartialCallback | None = None,
+) -> str:
+    """Async counterpart of ``consume_stream``."""
+    state = _StreamState(schema, on_partial)
+    try:
+        async for chunk in chunks:
+            if chunk and state.feed(chunk):
+                break
+    finally:
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    return state.finish()
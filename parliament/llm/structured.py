@@ -0,0 +1,81 @@
+"""
+Provider-native structured output compiled from the pydantic schemas.
+
+The output shapes in ``schemas.py`` and ``speaker_schemas.py`` are turned
+into request parameters so the provider constrains decoding itself, instead
+of relying on prose instructions and parse-retry round-trips:
+
+- Gemini: ``response_mime_type="application/json"`` plus ``response_schema``
+  (the SDK accepts pydantic types, including ``list[Model]``, directly).
+- OpenAI-compatible backends (Cerebras): ``response_format`` with a strict
+  ``json_schema``. Strict mode only accepts an object at the top level, so
+  other shapes (e.g. the amendments list) keep the prose instructions.
+"""
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+
+def supports_structured_output(provider: str, schema) -> bool:
+    """Whether ``provider`` can enforce ``schema`` natively."""
+    if schema is None:
+        return False
+    if provider == "google":
+        return True
+    if provider == "cerebras":
+        return isinstance(schema, type) and issubclass(schema, BaseModel)
+    return False
+
+
+def _inline(node: Any, defs: dict) -> Any:
+    """Resolve local $refs and make every object strict (closed, all keys required)."""
+    if isinstance(node, list):
+        return [_inline(item, defs) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    if "$ref" in node:
+        return _inline(defs[node["$ref"].rsplit("/", 1)[-1]], defs)
+
+    compiled = {
+        key: _inline(value, defs)
+        for key, value in node.items()
+        if key not in ("$defs", "default")
+    }
+    if compiled.get("type") == "object" and "properties" in compiled:
+        compiled["required"] = list(compiled["properties"])
+        compiled["additionalProperties"] = False
+    return compiled
+
+
+@lru_cache(maxsize=None)
+def compile_json_schema(schema) -> dict:
+    """Self-contained strict JSON Schema for a pydantic model or type."""
+    raw = TypeAdapter(schema).json_schema()
+    return _inline(raw, raw.get("$defs", {}))
+
+
+def _schema_name(schema) -> str:
+    return getattr(schema, "__name__", "response")
+
+
+def openai_response_format(schema) -> dict:
+    """``response_format`` for OpenAI-compatible chat completion APIs."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": _schema_name(schema),
+            "strict": True,
+            "schema": compile_json_schema(schema),
+        },
+    }
+
+
+def gemini_config(schema) -> dict:
+    """``config`` for ``models.generate_content``."""
+    return {
+        "response_mime_type": "application/json",
+        "response_schema": schema,
+    }
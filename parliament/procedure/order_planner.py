@@ -0,0 +1,84 @@
+"""
+Local debate-order planning.
+
+An LLM call only to permute a handful of faction names is slow and not
+reproducible. The planner vectorises the faction statements (TF-IDF over
+stemmed terms), measures pairwise cosine similarity and orders speakers by
+one of several objectives:
+
+- ``opposed_adjacent``   each speaker is followed by the position least like
+                         theirs, so opposing views engage directly
+- ``similar_adjacent``   each speaker is followed by the closest position,
+                         so factions build on each other
+- ``distinctive_first``  the most distinctive positions frame the debate
+
+All objectives are O(n²) in the number of factions, and ties are broken by
+the input order, so the same statements always give the same order.
+"""
+
+import math
+from collections import Counter
+
+from parliament.procedure.veto_rules import tokens
+
+
+OBJECTIVES = ("opposed_adjacent", "similar_adjacent", "distinctive_first")
+
+
+def statement_vectors(statements: dict[str, str]) -> dict[str, dict[str, float]]:
+    """Unit-length TF-IDF vectors of each faction's statement."""
+    counts = {faction: Counter(tokens(text)) for faction, text in statements.items()}
+    document_frequency = Counter(term for tf in counts.values() for term in tf)
+    n = len(statements)
+
+    vectors = {}
+    for faction, tf in counts.items():
+        weights = {t: c * math.log(1 + n / document_frequency[t]) for t, c in tf.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        vectors[faction] = {t: w / norm for t, w in weights.items()}
+    return vectors
+
+
+def cosine(a: dict[str, float], b: dict[str, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(w * b.get(t, 0.0) for t, w in a.items())
+
+
+def _chain(names: list[str], similarity: dict[tuple[str, str], float], mean: dict[str, float], opposed: bool) -> list[str]:
+    """Greedy nearest/farthest-neighbour chain from the most distinctive position."""
+    start = min(names, key=lambda f: mean[f])
+    order = [start]
+    remaining = [f for f in names if f != start]
+    while remaining:
+        last = order[-1]
+        pick = (min if opposed else max)(remaining, key=lambda f: similarity[last, f])
+        order.append(pick)
+        remaining.remove(pick)
+    return order
+
+
+def plan_debate_order(
+    faction_names: list[str],
+    faction_statements: dict[str, str],
+    objective: str = "opposed_adjacent",
+) -> list[str]:
+    """Order ``faction_names`` by ``objective``; factions without a statement count as empty."""
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown debate-order objective {objective!r}; expected one of {OBJECTIVES}")
+    if len(faction_names) <= 2:
+        return list(faction_names)
+
+    vectors = statement_vectors({f: faction_statements.get(f, "") for f in faction_names})
+    similarity: dict[tuple[str, str], float] = {}
+    for i, a in enumerate(faction_names):
+        for b in faction_names[i + 1:]:
+            similarity[a, b] = similarity[b, a] = cosine(vectors[a], vectors[b])
+    mean = {
+        f: sum(similarity[f, g] for g in faction_names if g != f) / (len(faction_names) - 1)
+        for f in faction_names
+    }
+
+    if objective == "distinctive_first":
+        return sorted(faction_names, key=lambda f: mean[f])
+    return _chain(faction_names, similarity, mean, opposed=objective == "opposed_adjacent")
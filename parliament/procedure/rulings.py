@@ -0,0 +1,83 @@
+"""
+Memoized Speaker rulings.
+
+The Speaker's veto assignment and debate order depend on the bill and the
+faction roster. When the same bill comes back before the same factions
+(re-runs, Monte Carlo batches, resumed sessions), the earlier ruling can be
+reused instead of asking the LLM again.
+
+Rulings are keyed by a canonical hash of the bill content (title, proposal,
+known risks, unknowns) and the roster (faction names and ideologies). Only
+rulings the LLM actually produced are stored; fallbacks after a failure are
+not. A RulingCache keeps rulings in memory and can also persist them in the
+session database, so they survive across runs.
+"""
+
+import hashlib
+import json
+import threading
+
+from parliament.core.bill import Bill
+
+
+def ruling_key(kind: str, bill: Bill, faction_ideologies: dict[str, dict]) -> str:
+    """Stable hex digest identifying one kind of ruling on one bill before one roster."""
+    payload = json.dumps(
+        {
+            "kind": kind,
+            "bill": {
+                "title": bill.title,
+                "proposal": bill.proposal,
+                "known_risks": bill.known_risks,
+                "unknowns": bill.unknowns,
+            },
+            "roster": faction_ideologies,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RulingCache:
+    """
+    In-memory Speaker ruling cache, optionally backed by a SessionStore.
+
+    A ruling is ``(value, reasoning)``, where ``value`` is a JSON-serialisable
+    list of faction names.
+
+    Usage:
+        rulings = RulingCache(store=session_store)   # store=None: this process only
+        speaker = Speaker(bill, llm=llm, rulings=rulings)
+    """
+
+    def __init__(self, store=None):
+        self.store = store
+        self._entries: dict[str, tuple[list[str], str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> tuple[list[str], str] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self.store is not None:
+                entry = self.store.get_ruling(key)
+                if entry is not None:
+                    self._entries[key] = entry
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return entry
+
+    def put(self, key: str, kind: str, value: list[str], reasoning: str) -> None:
+        with self._lock:
+            self._entries[key] = (list(value), reasoning)
+            if self.store is not None:
+                self.store.save_ruling(key, kind, list(value), reasoning)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
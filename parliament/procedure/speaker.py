@@ -1,7 +1,16 @@
+import threading
+from contextlib import contextmanager
 from enum import Enum
 from parliament.core.bill import Bill, BillStatus
+from parliament.core.debate import DebateArgument
+from parliament.engine.convergence import ConvergenceDetector
 from parliament.llm.client import LLMClient
+from parliament.llm.deadline import Deadline
+from parliament.llm.prompts import PromptTemplate, assemble, bill_section, register_template
 from parliament.llm.speaker_schemas import DebateOrderSchema, VetoPowerSchema
+from parliament.procedure.order_planner import plan_debate_order
+from parliament.procedure.rulings import RulingCache, ruling_key
+from parliament.procedure.veto_rules import VetoAssessment
 
 
 # ANSI color codes for Speaker messages
@@ -10,6 +19,77 @@ RESET = '\033[0m'
 BOLD = '\033[1m'
 DIM = '\033[2m'
 
+# Shared by every Speaker prompt so the system prompt and bill form one cacheable prefix
+SPEAKER_IDENTITY = register_template(PromptTemplate(
+    name="speaker_identity",
+    version=1,
+    text="""
+You are the Parliamentary Speaker.
+You have NO policy opinion or preference, only procedural and institutional judgment.
+""",
+))
+
+DEBATE_ORDER_TEMPLATE = register_template(PromptTemplate(
+    name="speaker_order",
+    version=1,
+    text="""
+You have authority to determine debate order.
+
+Your role is PROCEDURAL and STRATEGIC:
+- You maintain order and fairness
+- You determine speaking order to maximize productive debate
+- You consider faction positions to arrange strategic discussion flow
+
+Consider:
+- Which factions should speak early to frame the debate?
+- Which opposing views should be adjacent for direct engagement?
+- Which factions might build on each other's arguments?
+
+Faction Statements:
+{faction_positions}
+
+Available factions: {faction_names}
+
+Determine the optimal speaking order for debate to maximize productive discussion.
+
+Return JSON:
+{{
+  "faction_order": ["Faction1", "Faction2", ...],
+  "reasoning": "brief explanation of speaking order strategy"
+}}
+""",
+))
+
+VETO_POWER_TEMPLATE = register_template(PromptTemplate(
+    name="speaker_veto",
+    version=1,
+    text="""
+You have authority to assign veto powers.
+
+Your role is PROCEDURAL and PROTECTIVE:
+- You determine which factions are FIT to hold veto power
+- Veto power should protect against catastrophic outcomes
+- Consider the bill's risks and which factions are best positioned to prevent harm
+
+Consider:
+- What are the serious risks in this bill?
+- Which factions have red lines that align with preventing catastrophic outcomes?
+- Which factions have the expertise/focus to recognize critical flaws?
+- Veto power is SERIOUS - grant it only when needed for institutional protection
+
+Available Factions:
+{faction_info}
+
+Determine which factions (if any) should have veto power to protect against catastrophic outcomes.
+
+Return JSON:
+{{
+  "factions_with_veto": ["Faction1", "Faction2"] or [],
+  "reasoning": "brief explanation of veto power assignments"
+}}
+""",
+))
+
 
 class Phase(str, Enum):
     INTRODUCTION = "INTRODUCTION"
@@ -26,7 +106,15 @@ class Speaker:
     Now backed by LLM for strategic decisions while maintaining procedural authority.
     """
 
-    def __init__(self, bill: Bill, max_debate_rounds: int = 2, max_rounds: int = 3, llm: LLMClient | None = None):
+    def __init__(
+        self,
+        bill: Bill,
+        max_debate_rounds: int = 2,
+        max_rounds: int = 3,
+        llm: LLMClient | None = None,
+        convergence: ConvergenceDetector | None = None,
+        rulings: RulingCache | None = None,
+    ):
         if bill.status != BillStatus.DRAFT:
             raise ValueError("Only draft bills may enter parliament")
 
@@ -37,9 +125,54 @@ class Speaker:
         self.max_debate_rounds = max_debate_rounds
         self.debate_round = 0
         self.debate_order: list[str] = []
+        self.convergence = convergence  # Optional early close when positions stop moving
+        self.debate_end_reason: str | None = None
+        self.rulings = rulings  # Optional memo of earlier veto/order rulings
+        self.rulings_used: dict[str, dict] = {}  # kind -> {"key", "reused"} for the audit trail
         self.veto_factions: set[str] = set()
         self.llm = llm if llm is not None else LLMClient()
 
+    # ---- Output ----
+
+    _collecting = threading.local()
+
+    def _say(self, message: str) -> None:
+        lines = getattr(self._collecting, "lines", None)
+        if lines is None:
+            print(message)
+        else:
+            lines.append(message)
+
+    @contextmanager
+    def collect_output(self):
+        """
+        Buffer this thread's Speaker messages instead of printing them.
+
+        Lets a session run Speaker decisions concurrently with other phases
+        and print their messages later, in procedural order.
+        """
+        lines: list[str] = []
+        previous = getattr(self._collecting, "lines", None)
+        self._collecting.lines = lines
+        try:
+            yield lines
+        finally:
+            self._collecting.lines = previous
+
+    # ---- Memoized rulings ----
+
+    def _recall_ruling(self, kind: str, roster: dict) -> tuple[str | None, tuple[list[str], str] | None]:
+        if self.rulings is None:
+            return None, None
+        key = ruling_key(kind, self.bill, roster)
+        return key, self.rulings.get(key)
+
+    def _remember_ruling(self, kind: str, key: str | None, value: list[str], reasoning: str) -> None:
+        if key is None:
+            return
+        self.rulings.put(key, kind, value, reasoning)
+        self.rulings_used[kind] = {"key": key[:16], "reused": False}
+
     # ---- Phase control ----
 
     def allow_action(self, action: str) -> bool:
@@ -99,83 +232,110 @@ class Speaker:
         
         self.debate_order = factions.copy()
 
-    def determine_debate_order(self, faction_names: list[str], faction_statements: dict[str, str]) -> list[str]:
+    def plan_debate_order(
+        self,
+        faction_names: list[str],
+        faction_statements: dict[str, str],
+        objective: str = "opposed_adjacent",
+    ) -> list[str]:
+        """
+        Local, reproducible debate order from statement dissimilarity (no LLM call).
+
+        See ``parliament.procedure.order_planner`` for the objectives.
+        """
+        order = plan_debate_order(faction_names, faction_statements, objective)
+        self.rulings_used["speaker_order"] = {"source": "local_planner", "objective": objective}
+        self._say(f"{SPEAKER_COLOR}{BOLD}[Speaker]{RESET} {DIM}Debate order planned locally ({objective}){RESET}")
+        return order
+
+    def determine_debate_order(
+        self,
+        faction_names: list[str],
+        faction_statements: dict[str, str],
+        deadline: Deadline | None = None,
+        faction_ideologies: dict[str, dict] | None = None,
+    ) -> list[str]:
         """
         LLM-powered strategic determination of debate speaking order.
         
         Args:
             faction_names: List of all faction names
             faction_statements: Dict of faction -> their initial statement
+            deadline: Optional deadline; when it passes the default order is used
+            faction_ideologies: Optional ideologies, used only to key memoized rulings
             
         Returns:
             Ordered list of faction names for debate
         """
-        try:
-            system = """
-You are the Parliamentary Speaker with authority to determine debate order.
-
-Your role is PROCEDURAL and STRATEGIC:
-- You maintain order and fairness
-- You determine speaking order to maximize productive debate
-- You consider faction positions to arrange strategic discussion flow
-- You have NO policy opinion, only procedural judgment
-
-Consider:
-- Which factions should speak early to frame the debate?
-- Which opposing views should be adjacent for direct engagement?
-- Which factions might build on each other's arguments?
-"""
+        roster = faction_ideologies if faction_ideologies is not None else dict.fromkeys(faction_names)
+        key, cached = self._recall_ruling("speaker_order", roster)
+        if cached is not None and set(cached[0]) == set(faction_names):
+            order, reasoning = cached
+            self.rulings_used["speaker_order"] = {"key": key[:16], "reused": True}
+            self._say(f"{SPEAKER_COLOR}{BOLD}[Speaker]{RESET} {DIM}Debate order reasoning (reused ruling): {reasoning}{RESET}")
+            return list(order)
 
+        try:
             faction_positions = "\n".join([
                 f"- {name}: {stmt}" 
                 for name, stmt in faction_statements.items()
             ])
 
-            user = f"""
-Bill: {self.bill.title}
-Proposal: {self.bill.proposal}
-
-Faction Statements:
-{faction_positions}
-
-Available factions: {faction_names}
-
-Determine the optimal speaking order for debate to maximize productive discussion.
-
-Return JSON:
-{{
-  "faction_order": ["Faction1", "Faction2", ...],
-  "reasoning": "brief explanation of speaking order strategy"
-}}
-"""
-
-            raw = self.llm.generate_json(system, user)
+            prompt = assemble(
+                SPEAKER_IDENTITY,
+                bill_section(self.bill, details=True),
+                DEBATE_ORDER_TEMPLATE,
+                faction_positions=faction_positions,
+                faction_names=faction_names,
+            )
+            raw = self.llm.generate_json(
+                prompt.system_prompt,
+                prompt.user_prompt,
+                phase="speaker_order",
+                timeout=Deadline.remaining_of(deadline),
+                schema=DebateOrderSchema,
+                stable_prefix=prompt.stable_prefix,
+                template=prompt.template_id,
+            )
             parsed = DebateOrderSchema(**raw)
             
             # Validate all factions are included
             if set(parsed.faction_order) != set(faction_names):
-                print(f"{DIM}[Speaker] LLM provided invalid faction order, using default{RESET}")
+                self._say(f"{DIM}[Speaker] LLM provided invalid faction order, using default{RESET}")
                 return faction_names
             
-            print(f"{SPEAKER_COLOR}{BOLD}[Speaker]{RESET} {DIM}Debate order reasoning: {parsed.reasoning}{RESET}")
+            self._say(f"{SPEAKER_COLOR}{BOLD}[Speaker]{RESET} {DIM}Debate order reasoning: {parsed.reasoning}{RESET}")
+            self._remember_ruling("speaker_order", key, parsed.faction_order, parsed.reasoning)
             return parsed.faction_order
             
         except Exception as e:
-            print(f"{DIM}[Speaker] LLM failed to determine debate order, using default: {e}{RESET}")
+            self._say(f"{DIM}[Speaker] LLM failed to determine debate order, using default: {e}{RESET}")
             return faction_names
 
-    def next_debate_round(self) -> bool:
+    def next_debate_round(self, round_arguments: list[DebateArgument] | None = None) -> bool:
         """
         Advances to the next debate round.
         Returns True if debate continues, False if debate should end.
+
+        ``round_arguments`` (the round just held) feed the convergence
+        detector, if any; the reason the debate ended is kept in
+        ``debate_end_reason``. Reaching the round limit takes precedence:
+        convergence only counts when it ends the debate early.
         """
         if self.phase != Phase.DEBATE:
             raise RuntimeError("Can only advance debate rounds during DEBATE phase")
         
         self.debate_round += 1
-        
+
         if self.debate_round >= self.max_debate_rounds:
+            self.debate_end_reason = f"maximum of {self.max_debate_rounds} debate round(s) reached"
             return False
+
+        if self.convergence is not None and round_arguments is not None:
+            reason = self.convergence.observe(round_arguments)
+            if reason is not None:
+                self.debate_end_reason = reason
+                return False
         
         return True
 
@@ -205,77 +365,86 @@ Return JSON:
         """
         return self.veto_factions.copy()
 
-    def determine_veto_powers(self, faction_names: list[str], faction_ideologies: dict[str, dict]) -> set[str]:
+    def apply_veto_assessment(self, assessment: VetoAssessment) -> set[str]:
+        """
+        Grants veto power from a clear-cut red-line assessment, without the LLM.
+
+        Callers should use this only when ``assessment.confident``; otherwise
+        call determine_veto_powers().
+        """
+        for faction in assessment.grants:
+            self.assign_veto_power(faction)
+        self.rulings_used["speaker_veto"] = {"source": "red_line_rules", "margin": round(assessment.margin, 3)}
+        self._say(f"{SPEAKER_COLOR}{BOLD}[Speaker]{RESET} {DIM}Veto power by red-line rules: {assessment.reasoning()}{RESET}")
+        return set(assessment.grants)
+
+    def determine_veto_powers(
+        self,
+        faction_names: list[str],
+        faction_ideologies: dict[str, dict],
+        deadline: Deadline | None = None,
+    ) -> set[str]:
         """
         LLM-powered strategic determination of which factions should have veto power.
         
         Args:
             faction_names: List of all faction names
             faction_ideologies: Dict of faction -> ideology (goal, priorities, red_lines)
+            deadline: Optional deadline; when it passes no veto powers are assigned
             
         Returns:
             Set of faction names that should have veto power
         """
-        try:
-            system = """
-You are the Parliamentary Speaker with authority to assign veto powers.
-
-Your role is PROCEDURAL and PROTECTIVE:
-- You determine which factions are FIT to hold veto power
-- Veto power should protect against catastrophic outcomes
-- Consider the bill's risks and which factions are best positioned to prevent harm
-- You have NO policy preference, only institutional judgment
-
-Consider:
-- What are the serious risks in this bill?
-- Which factions have red lines that align with preventing catastrophic outcomes?
-- Which factions have the expertise/focus to recognize critical flaws?
-- Veto power is SERIOUS - grant it only when needed for institutional protection
-"""
+        key, cached = self._recall_ruling("speaker_veto", faction_ideologies)
+        if cached is not None:
+            vetoes, reasoning = cached
+            valid_vetos = set(vetoes) & set(faction_names)
+            self.rulings_used["speaker_veto"] = {"key": key[:16], "reused": True}
+            self._say(f"{SPEAKER_COLOR}{BOLD}[Speaker]{RESET} {DIM}Veto power reasoning (reused ruling): {reasoning}{RESET}")
+            for faction in valid_vetos:
+                self.assign_veto_power(faction)
+            return valid_vetos
 
+        try:
             faction_info = "\n".join([
                 f"- {name}:\n  Goal: {ideology['goal']}\n  Red lines: {ideology['red_lines']}"
                 for name, ideology in faction_ideologies.items()
             ])
 
-            user = f"""
-Bill: {self.bill.title}
-Proposal: {self.bill.proposal}
-
-Known Risks: {self.bill.known_risks}
-Unknowns: {self.bill.unknowns}
-
-Available Factions:
-{faction_info}
-
-Determine which factions (if any) should have veto power to protect against catastrophic outcomes.
-
-Return JSON:
-{{
-  "factions_with_veto": ["Faction1", "Faction2"] or [],
-  "reasoning": "brief explanation of veto power assignments"
-}}
-"""
-
-            raw = self.llm.generate_json(system, user)
+            prompt = assemble(
+                SPEAKER_IDENTITY,
+                bill_section(self.bill, details=True),
+                VETO_POWER_TEMPLATE,
+                faction_info=faction_info,
+            )
+            raw = self.llm.generate_json(
+                prompt.system_prompt,
+                prompt.user_prompt,
+                phase="speaker_veto",
+                timeout=Deadline.remaining_of(deadline),
+                schema=VetoPowerSchema,
+                stable_prefix=prompt.stable_prefix,
+                template=prompt.template_id,
+            )
             parsed = VetoPowerSchema(**raw)
             
             # Validate factions exist
             invalid = set(parsed.factions_with_veto) - set(faction_names)
             if invalid:
-                print(f"{DIM}[Speaker] LLM suggested invalid factions for veto: {invalid}, ignoring{RESET}")
+                self._say(f"{DIM}[Speaker] LLM suggested invalid factions for veto: {invalid}, ignoring{RESET}")
                 valid_vetos = set(parsed.factions_with_veto) - invalid
             else:
                 valid_vetos = set(parsed.factions_with_veto)
             
-            print(f"{SPEAKER_COLOR}{BOLD}[Speaker]{RESET} {DIM}Veto power reasoning: {parsed.reasoning}{RESET}")
+            self._say(f"{SPEAKER_COLOR}{BOLD}[Speaker]{RESET} {DIM}Veto power reasoning: {parsed.reasoning}{RESET}")
             
             # Apply veto assignments
             for faction in valid_vetos:
                 self.assign_veto_power(faction)
-            
+
+            self._remember_ruling("speaker_veto", key, sorted(valid_vetos), parsed.reasoning)
             return valid_vetos
             
         except Exception as e:
-            print(f"{DIM}[Speaker] LLM failed to determine veto powers, assigning none: {e}{RESET}")
+            self._say(f"{DIM}[Speaker] LLM failed to determine veto powers, assigning none: {e}{RESET}")
             return set()
@@ -0,0 +1,141 @@
+"""
+Rule-based veto assignment.
+
+Most bills map obviously onto the factions' red lines: a bill whose known
+risks include "no rollback mechanism" concerns Safety, whatever the LLM
+says. RedLineIndex scores every faction locally by how much of its closest
+red line reappears in the bill's ``known_risks`` and ``unknowns``, and
+grants veto power without an LLM call when every score is clear of the
+cutoff by at least ``margin`` and at least one faction clearly reaches it.
+Ambiguous bills fall back to ``Speaker.determine_veto_powers``, and so do
+bills that match no red line: a lexical miss says nothing about whether a
+red line is semantically at stake, so "no veto for anyone" is never
+decided locally.
+
+The index is built once per faction configuration. Each red line is a
+document of stemmed terms, weighted by inverse document frequency so words
+shared by many red lines count for less. A faction's score is the weighted
+fraction of its best-matching red line found in the bill (0 to 1). Red
+lines are short phrases ("unbounded risk", "regulatory violation"), so the
+default cutoff grants a veto once about half of one is matched.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+
+from parliament.core.bill import Bill
+
+
+_WORD = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it may no not of on or our "
+    "over such that the their this to was will with without".split()
+)
+_SUFFIXES = ("ations", "ation", "ities", "ity", "ness", "ments", "ment", "ing", "ed", "es", "s")
+
+
+def _stem(word: str) -> str:
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[: -len(suffix)]
+    return word
+
+
+def tokens(text: str) -> list[str]:
+    """Stemmed content words of ``text``, in order and with repeats."""
+    return [_stem(w) for w in _WORD.findall(text.lower().replace("_", " ")) if w not in _STOPWORDS]
+
+
+def terms(text: str) -> set[str]:
+    """Distinct stemmed content words of ``text``."""
+    return set(tokens(text))
+
+
+@dataclass(frozen=True)
+class VetoAssessment:
+    """Outcome of scoring one bill against every faction's red lines."""
+
+    grants: frozenset[str]  # Factions at or above the cutoff
+    scores: dict[str, float]  # faction -> best red-line match (0-1)
+    margin: float  # Smallest distance of any score from the cutoff
+    confident: bool  # True when some faction is granted and the margin is wide enough to skip the LLM
+
+    def reasoning(self) -> str:
+        ranked = ", ".join(f"{f} {s:.2f}" for f, s in sorted(self.scores.items(), key=lambda kv: -kv[1]))
+        return f"red-line match scores: {ranked} (margin {self.margin:.2f})"
+
+
+class RedLineIndex:
+    """
+    Inverted index from red-line terms to the factions and red lines containing them.
+
+    Args:
+        faction_ideologies: Faction name -> ideology (``red_lines`` is used).
+        cutoff: Score at or above which a faction is granted veto power.
+            0.4 grants one of two equally weighted terms (0.5) and keeps
+            unmatched factions (0.0) well clear.
+        margin: Minimum distance of every score from ``cutoff`` for the
+            assessment to be trusted without the LLM. An assessment that
+            grants no faction is never trusted.
+    """
+
+    def __init__(self, faction_ideologies: dict[str, dict], cutoff: float = 0.4, margin: float = 0.1):
+        if not 0.0 < cutoff <= 1.0:
+            raise ValueError("cutoff must be in (0, 1]")
+        if margin < 0.0:
+            raise ValueError("margin must be non-negative")
+        self.cutoff = cutoff
+        self.margin = margin
+        self.factions = list(faction_ideologies)
+
+        lines: list[tuple[str, set[str]]] = []  # (faction, terms) per red line
+        for faction, ideology in faction_ideologies.items():
+            for red_line in ideology.get("red_lines") or []:
+                line_terms = terms(str(red_line))
+                if line_terms:
+                    lines.append((faction, line_terms))
+
+        document_frequency: dict[str, int] = {}
+        for _, line_terms in lines:
+            for term in line_terms:
+                document_frequency[term] = document_frequency.get(term, 0) + 1
+        idf = {t: math.log(1 + len(lines) / df) for t, df in document_frequency.items()}
+
+        self._postings: dict[str, list[tuple[int, float]]] = {}  # term -> [(line id, weight)]
+        self._line_faction: list[str] = []
+        self._line_mass: list[float] = []
+        for line_id, (faction, line_terms) in enumerate(lines):
+            self._line_faction.append(faction)
+            self._line_mass.append(sum(idf[t] for t in line_terms))
+            for term in line_terms:
+                self._postings.setdefault(term, []).append((line_id, idf[term]))
+
+    def scores(self, bill: Bill) -> dict[str, float]:
+        """Best red-line match per faction for the bill's risks and unknowns."""
+        bill_terms: set[str] = set()
+        for text in [*bill.known_risks, *bill.unknowns]:
+            bill_terms |= terms(text)
+
+        matched: dict[int, float] = {}
+        for term in bill_terms:
+            for line_id, weight in self._postings.get(term, ()):
+                matched[line_id] = matched.get(line_id, 0.0) + weight
+
+        scores = dict.fromkeys(self.factions, 0.0)
+        for line_id, mass in matched.items():
+            faction = self._line_faction[line_id]
+            scores[faction] = max(scores[faction], mass / self._line_mass[line_id])
+        return scores
+
+    def assess(self, bill: Bill) -> VetoAssessment:
+        scores = self.scores(bill)
+        # Rounded so a score exactly ``margin`` away is not lost to float error
+        margin = round(min((abs(s - self.cutoff) for s in scores.values()), default=1.0), 9)
+        grants = frozenset(f for f, s in scores.items() if s >= self.cutoff)
+        return VetoAssessment(
+            grants=grants,
+            scores=scores,
+            margin=margin,
+            confident=bool(grants) and margin >= self.margin,
+        )
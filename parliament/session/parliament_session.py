@@ -1,17 +1,42 @@
 """
 ParliamentSession — multi-bill orchestrator with precedent-aware agents.
 
-Runs a list of bills through the full parliamentary procedure sequentially.
-After each bill, the decision is stored as a precedent so later bills
-benefit from institutional memory.
+Runs a list of bills through the full parliamentary procedure, sequentially
+by default. After each bill, the decision is stored as a precedent so later
+bills benefit from institutional memory. ``run(bills, jobs=N)`` deliberates
+several bills at once, trading precedent freshness for throughput according
+to the selected consistency mode.
+
+Within a bill, the statement, amendment and voting phases can fan out
+across all factions concurrently (``max_workers > 1``); so can each debate
+round in ``simultaneous`` debate mode. The Speaker's veto decision runs
+alongside the statements, and the debate order is requested as soon as
+the statements are in. Results are always collected in agent order and
+printed in procedural order, so the transcript is identical to a
+sequential run.
 """
 
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Callable, TypeVar
+
 from parliament.agents.base import BaseFactionAgent
 from parliament.core.bill import Bill, BillStatus
 from parliament.core.decision import Decision
 from parliament.engine.amendments import accept_amendment, apply_accepted_amendments
-from parliament.engine.voting import VotingEngine
+from parliament.engine.convergence import ConvergenceDetector
+from parliament.engine.debate_context import DebateContext
+from parliament.core.vote import Vote
+from parliament.engine.voting import VoteTally, VotingEngine
+from parliament.llm.deadline import Deadline
+from parliament.procedure.order_planner import OBJECTIVES as ORDER_OBJECTIVES
+from parliament.procedure.rulings import RulingCache
 from parliament.procedure.speaker import Speaker
+from parliament.procedure.veto_rules import RedLineIndex
+from parliament.session.phase_graph import PhaseGraph
 from parliament.storage.precedent_store import PrecedentStore
 from parliament.storage.session_store import SessionStore
 from parliament.storage.audit_log import export_audit_log
@@ -20,6 +45,39 @@ from parliament.utils.colors import (
     colored, Colors,
 )
 
+T = TypeVar("T")
+
+CONSISTENCY_MODES = ("strict", "snapshot", "eventual")
+
+
+class _ThreadOutput(io.TextIOBase):
+    """
+    ``sys.stdout`` stand-in that buffers writes from threads inside ``capture()``.
+
+    Lets bills deliberated concurrently keep their transcripts separate;
+    writes from any other thread go straight to ``target``.
+    """
+
+    def __init__(self, target):
+        self.target = target
+        self._local = threading.local()
+
+    @contextmanager
+    def capture(self):
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            self._local.buffer = None
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer if buffer is not None else self.target).write(text)
+
+    def flush(self) -> None:
+        self.target.flush()
+
 
 class ParliamentSession:
     """
@@ -27,7 +85,26 @@ class ParliamentSession:
 
     Features
     --------
-    - Sequential bill processing with precedent injection.
+    - Sequential bill processing with precedent injection, or parallel
+      processing (``run(jobs=...)``) with strict, snapshot or eventual
+      precedent consistency.
+    - Optional concurrent fan-out of per-faction phases (``max_workers``).
+    - Veto determination overlaps the statements phase, and the debate order
+      is requested as soon as the last statement lands (see PhaseGraph).
+    - Optional per-phase deadlines (``phase_timeouts``) that bound bill latency.
+    - Bounded debate context (``debate_context``: full, last_n, targeted or budget).
+    - Optional simultaneous debate rounds (``debate_mode``) that fan out like
+      the other phases while keeping the Speaker's order for output and storage.
+    - Optional early close of the debate once positions converge
+      (``convergence_threshold``); the reason is stored with the session.
+    - Optional early exit from voting once the outcome is locked
+      (``vote_early_exit``); votes that were not needed are recorded as such.
+    - Optional memoized Speaker rulings (``speaker_rulings``), labelled as
+      reused in the session record.
+    - Optional rule-based veto fast path (``veto_rule_margin``) that only
+      asks the Speaker's LLM when red-line scores are ambiguous or no
+      faction's red lines clearly match.
+    - Optional local debate-order planning (``debate_order_strategy``).
     - Persists every session event to a SessionStore (SQLite by default).
     - Exports a JSON audit log after each bill.
     - Prints coloured terminal output.
@@ -49,6 +126,17 @@ class ParliamentSession:
         export_logs: bool = True,
         log_dir: str = ".",
         speaker_llm=None,
+        max_workers: int = 1,
+        phase_timeouts: dict[str, float] | None = None,
+        debate_context: str = "full",
+        debate_window: int = 1,
+        debate_token_budget: int = 600,
+        debate_mode: str = "sequential",
+        convergence_threshold: float | None = None,
+        vote_early_exit: str | None = None,
+        speaker_rulings: RulingCache | None = None,
+        veto_rule_margin: float | None = None,
+        debate_order_strategy: str = "llm",
     ):
         self.agents = agents
         self.store = store if store is not None else SessionStore()
@@ -57,42 +145,287 @@ class ParliamentSession:
         self.export_logs = export_logs
         self.log_dir = log_dir
         self._speaker_llm = speaker_llm  # Optional injectable LLM for Speaker (useful in tests)
+        self.max_workers = max_workers  # 1 = sequential; >1 = concurrent faction phases
+        # Seconds allowed per phase: speaker_veto, statement, speaker_order, debate, amendments, vote
+        self.phase_timeouts = phase_timeouts or {}
+        # What each debate speaker sees of the transcript (see engine.debate_context)
+        self.debate_context = debate_context
+        self.debate_window = debate_window
+        self.debate_token_budget = debate_token_budget
+        self._new_debate_context()  # Validate the mode up front
+        # "sequential": each speaker sees earlier turns of the same round;
+        # "simultaneous": a round sees only earlier rounds and runs in parallel
+        if debate_mode not in ("sequential", "simultaneous"):
+            raise ValueError(f"Unknown debate mode {debate_mode!r}; expected 'sequential' or 'simultaneous'")
+        self.debate_mode = debate_mode
+        # Close the debate once every faction's argument repeats its last one this closely
+        self.convergence_threshold = convergence_threshold
+        # Once the vote outcome is locked: None = collect every vote as usual,
+        # "cancel" = stop collecting, "mark" = collect but flag the rest as not needed
+        if vote_early_exit not in (None, "cancel", "mark"):
+            raise ValueError(f"Unknown vote early-exit policy {vote_early_exit!r}; expected 'cancel' or 'mark'")
+        self.vote_early_exit = vote_early_exit
+        # Optional memo of Speaker rulings, shared across bills and (if DB-backed) runs
+        self.speaker_rulings = speaker_rulings
+        # Grant vetoes from red lines locally when every faction's score clears the
+        # cutoff by this margin; the Speaker's LLM decides only ambiguous bills
+        self.veto_rules = (
+            RedLineIndex({a.name: a.ideology for a in agents}, margin=veto_rule_margin)
+            if veto_rule_margin is not None
+            else None
+        )
+        # "llm" asks the Speaker's LLM; any order_planner objective plans locally
+        if debate_order_strategy != "llm" and debate_order_strategy not in ORDER_OBJECTIVES:
+            raise ValueError(
+                f"Unknown debate order strategy {debate_order_strategy!r}; "
+                f"expected 'llm' or one of {ORDER_OBJECTIVES}"
+            )
+        self.debate_order_strategy = debate_order_strategy
 
     # ------------------------------------------------------------------ #
     # Public API
     # ------------------------------------------------------------------ #
 
-    def run(self, bills: list[Bill]) -> list[Decision]:
+    def run(self, bills: list[Bill], jobs: int = 1, consistency: str = "strict") -> list[Decision]:
         """
-        Process a list of bills in order and return their decisions.
+        Process a list of bills and return their decisions in bill order.
+
+        ``jobs`` bills may be deliberated at once, subject to ``consistency``:
+
+        - ``strict``: one bill at a time; every bill sees all earlier decisions.
+        - ``snapshot``: bills run in waves of ``jobs``; a wave shares the
+          precedents recorded before it started, and its decisions are
+          recorded in bill order once the whole wave is done.
+        - ``eventual``: up to ``jobs`` bills at once; each bill sees whatever
+          precedents had been recorded when it started.
+
+        Each bill's transcript is still printed whole and in bill order.
         """
+        if consistency not in CONSISTENCY_MODES:
+            raise ValueError(f"Unknown consistency mode {consistency!r}; expected one of {CONSISTENCY_MODES}")
+        if jobs <= 1 or consistency == "strict" or len(bills) <= 1:
+            return [self._run_bill(bill) for bill in bills]
+
+        if consistency == "eventual":
+            return self._run_concurrently(bills, jobs, self._run_bill)
+
         decisions: list[Decision] = []
-        for bill in bills:
-            decision = self._run_bill(bill)
-            decisions.append(decision)
+        for start in range(0, len(bills), jobs):
+            wave = bills[start:start + jobs]
+            snapshot = self.precedent_store.get_precedent_context()
+            results = self._run_concurrently(wave, jobs, lambda bill: self._deliberate(bill, snapshot))
+            for decision, final_bill in results:
+                self.precedent_store.record(final_bill.proposal, decision)
+                decisions.append(decision)
         return decisions
 
     # ------------------------------------------------------------------ #
     # Internal orchestration
     # ------------------------------------------------------------------ #
 
-    def _run_bill(self, bill: Bill) -> Decision:
+    def _run_concurrently(self, bills: list[Bill], jobs: int, fn: Callable[[Bill], T]) -> list[T]:
+        """
+        Call ``fn`` for each bill on ``jobs`` threads, returning results in bill order.
+
+        Each bill's printed output is buffered and written out whole, in bill
+        order, as soon as it and every bill before it have finished.
+        """
+        output = _ThreadOutput(sys.stdout)
+
+        def deliberate(bill: Bill) -> tuple[T, str]:
+            with output.capture() as buffer:
+                result = fn(bill)
+            return result, buffer.getvalue()
+
+        results: list[T] = []
+        sys.stdout = output
+        try:
+            with ThreadPoolExecutor(max_workers=min(jobs, len(bills))) as pool:
+                for future in [pool.submit(deliberate, bill) for bill in bills]:
+                    result, printed = future.result()
+                    output.target.write(printed)
+                    results.append(result)
+        finally:
+            sys.stdout = output.target
+        return results
+
+    def _phase_deadline(self, phase: str) -> Deadline | None:
+        return Deadline.after(self.phase_timeouts.get(phase))
+
+    def _new_debate_context(self) -> DebateContext:
+        return DebateContext(
+            mode=self.debate_context,
+            window=self.debate_window,
+            token_budget=self.debate_token_budget,
+        )
+
+    def _fan_out(
+        self,
+        fn: Callable[[BaseFactionAgent], T],
+        agents: list[BaseFactionAgent] | None = None,
+    ) -> list[T]:
+        """
+        Call ``fn`` for every agent and return the results in agent order.
+
+        ``agents`` defaults to all agents in seating order. Runs on a thread
+        pool when ``max_workers > 1``; the result order never depends on
+        which call finishes first.
+        """
+        agents = self.agents if agents is None else agents
+        if self.max_workers <= 1 or len(agents) <= 1:
+            return [fn(agent) for agent in agents]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(agents))) as pool:
+            return list(pool.map(fn, agents))
+
+    def _collect_votes(
+        self,
+        cast: Callable[[BaseFactionAgent], Vote],
+        veto_factions: set[str],
+    ) -> tuple[list[Vote], list[str], VoteTally | None]:
+        """
+        Collect votes and feed them to a VoteTally.
+
+        Returns the votes cast (in agent order), the factions whose votes were
+        not needed because the outcome was already locked (cancelled or cast
+        afterwards), and the tally. Without an early-exit policy every vote is
+        collected and no tally is kept. "cancel" tallies votes as they arrive
+        so outstanding calls can be dropped; "mark" collects every vote first
+        and tallies in agent order, so which votes count as decisive never
+        depends on which call finished first.
+        """
+        if self.vote_early_exit is None:
+            return self._fan_out(cast), [], None
+
+        cancel = self.vote_early_exit == "cancel"
+        tally = VoteTally({agent.name: agent.weight for agent in self.agents}, veto_factions)
+        cast_votes: dict[str, Vote] = {}
+        late: set[str] = set()
+
+        def count(vote: Vote) -> None:
+            if tally.decided:
+                late.add(vote.faction)
+            tally.add(vote)
+            cast_votes[vote.faction] = vote
+
+        if not cancel:
+            for vote in self._fan_out(cast):
+                count(vote)
+        elif self.max_workers <= 1 or len(self.agents) <= 1:
+            for agent in self.agents:
+                if tally.decided:
+                    break
+                count(cast(agent))
+        else:
+            pool = ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.agents)))
+            try:
+                futures = [pool.submit(cast, agent) for agent in self.agents]
+                for future in as_completed(futures):
+                    count(future.result())
+                    if tally.decided:
+                        break
+            finally:
+                # Calls already in flight finish in the background; their votes are discarded
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        votes = [cast_votes[a.name] for a in self.agents if a.name in cast_votes]
+        not_needed = [a.name for a in self.agents if a.name in late or a.name not in cast_votes]
+        return votes, not_needed, tally
+
+    def _record_argument(self, session_id, agent, argument, all_debate_arguments, debate_context) -> None:
+        """Store and print one debate turn (``argument`` is None when the faction passes)."""
+        label = faction_colored(agent.name, f"[{agent.name}]", bold=True)
+        if not argument:
+            print(label + colored(" passes this round.", Colors.DIM) + "\n")
+            return
+
+        all_debate_arguments.append(argument)
+        debate_context.add(argument)
+        self.store.save_debate_argument(session_id, argument)
+
+        if argument.targeted_factions:
+            targets = ", ".join([faction_colored(t, t) for t in argument.targeted_factions])
+            target_msg = colored(" → ", Colors.DIM) + f"[{targets}]"
+        else:
+            target_msg = colored(" → ", Colors.DIM) + colored("[All Factions]", Colors.WHITE)
+        print(f"{label}{target_msg}")
+        print(colored(f"  {argument.argument}", Colors.WHITE) + "\n")
+
+    def _run_bill(self, bill: Bill, precedent_context: str | None = None) -> Decision:
+        """Deliberate one bill and record its decision as a precedent."""
+        if precedent_context is None:
+            precedent_context = self.precedent_store.get_precedent_context()
+        decision, final_bill = self._deliberate(bill, precedent_context)
+        self.precedent_store.record(final_bill.proposal, decision)
+        return decision
+
+    def _deliberate(self, bill: Bill, precedent_context: str) -> tuple[Decision, Bill]:
+        """Run the full procedure on one bill; returns the decision and the amended bill."""
         print(header(f"🏛️  AI PARLIAMENT — {bill.title}  🏛️", style="main"))
         print(colored("📜 Bill on the Floor:", Colors.BRIGHT_WHITE, bold=True))
         print(colored(f"   {bill.title}", Colors.BRIGHT_CYAN, bold=True))
         print(colored("─" * 60, Colors.DIM))
 
         session_id = self.store.create_session(bill)
-        precedent_context = self.precedent_store.get_precedent_context()
 
         faction_names = [a.name for a in self.agents]
         faction_ideologies = {a.name: a.ideology for a in self.agents}
 
-        speaker = Speaker(bill, max_debate_rounds=self.max_debate_rounds, llm=self._speaker_llm)
+        convergence = (
+            ConvergenceDetector(threshold=self.convergence_threshold)
+            if self.convergence_threshold is not None
+            else None
+        )
+        speaker = Speaker(
+            bill,
+            max_debate_rounds=self.max_debate_rounds,
+            llm=self._speaker_llm,
+            convergence=convergence,
+            rulings=self.speaker_rulings,
+        )
+
+        # ---- Opening phases as a dependency graph ----
+        # Veto determination needs only the bill and ideologies, so it runs
+        # alongside the statements; the debate order starts as soon as the
+        # last statement lands. Output is printed below in procedural order.
+        def determine_veto():
+            with speaker.collect_output() as lines:
+                if self.veto_rules is not None:
+                    assessment = self.veto_rules.assess(bill)
+                    if assessment.confident:
+                        return speaker.apply_veto_assessment(assessment), lines
+                return speaker.determine_veto_powers(
+                    faction_names, faction_ideologies, deadline=self._phase_deadline("speaker_veto")
+                ), lines
+
+        def collect_statements():
+            deadline = self._phase_deadline("statement")
+            return self._fan_out(
+                lambda agent: agent.statement(bill, precedent_context=precedent_context, deadline=deadline)
+            )
+
+        def determine_order(agent_statements):
+            statements = {agent.name: stmt for agent, stmt in zip(self.agents, agent_statements)}
+            with speaker.collect_output() as lines:
+                if self.debate_order_strategy != "llm":
+                    return speaker.plan_debate_order(faction_names, statements, self.debate_order_strategy), lines
+                return speaker.determine_debate_order(
+                    faction_names,
+                    statements,
+                    deadline=self._phase_deadline("speaker_order"),
+                    faction_ideologies=faction_ideologies,
+                ), lines
+
+        graph = PhaseGraph()
+        graph.add("speaker_veto", determine_veto)
+        graph.add("statement", collect_statements)
+        graph.add("speaker_order", determine_order, after=("statement",))
+        opening = graph.run()
 
         # ---- Veto determination ----
         print(header("⚖️  SPEAKER AUTHORITY (LLM-Backed)", style="section"))
-        veto_factions = speaker.determine_veto_powers(faction_names, faction_ideologies)
+        veto_factions, speaker_lines = opening["speaker_veto"]
+        for line in speaker_lines:
+            print(line)
         if veto_factions:
             veto_display = ", ".join([faction_colored(f, f, bold=True) for f in veto_factions])
             print(f"🔨 Speaker grants veto power to: {veto_display}\n")
@@ -103,10 +436,7 @@ class ParliamentSession:
         print(header("💬 FACTION STATEMENTS", style="section"))
         speaker.advance_phase()
 
-        statements: dict[str, str] = {}
-        for agent in self.agents:
-            stmt = agent.statement(bill, precedent_context=precedent_context)
-            statements[agent.name] = stmt
+        for agent, stmt in zip(self.agents, opening["statement"]):
             label = faction_colored(agent.name, f"[{agent.name}]", bold=True)
             print(f"{label} {stmt}\n")
 
@@ -114,53 +444,67 @@ class ParliamentSession:
         print(header("🗣️  DEBATE PHASE", style="section"))
         speaker.advance_phase()
 
-        debate_order = speaker.determine_debate_order(faction_names, statements)
+        debate_order, speaker_lines = opening["speaker_order"]
+        for line in speaker_lines:
+            print(line)
         speaker.set_debate_order(debate_order)
+        if speaker.rulings_used:
+            self.store.record_speaker_rulings(session_id, speaker.rulings_used)
 
         all_debate_arguments = []
+        debate_context = self._new_debate_context()
+        deadline = self._phase_deadline("debate")
 
         for debate_round in range(1, self.max_debate_rounds + 1):
             print(header(f"Debate Round {debate_round}", style="subsection"))
             order_display = " → ".join([faction_colored(f, f, bold=True) for f in speaker.debate_order])
             print(colored("Speaker mediates turn order: ", Colors.BRIGHT_WHITE) + order_display + "\n")
 
-            for faction_name in speaker.debate_order:
-                agent = next(a for a in self.agents if a.name == faction_name)
-                argument = agent.debate(
+            order = [next(a for a in self.agents if a.name == f) for f in speaker.debate_order]
+
+            def speak(agent):
+                return agent.debate(
                     bill=bill,
                     round_number=debate_round,
                     all_factions=faction_names,
-                    previous_arguments=all_debate_arguments,
+                    previous_arguments=list(all_debate_arguments),
                     precedent_context=precedent_context,
+                    deadline=deadline,
+                    debate_context=debate_context,
                 )
 
-                if argument:
-                    all_debate_arguments.append(argument)
-                    self.store.save_debate_argument(session_id, argument)
-
-                    label = faction_colored(agent.name, f"[{agent.name}]", bold=True)
-                    if argument.targeted_factions:
-                        targets = ", ".join([faction_colored(t, t) for t in argument.targeted_factions])
-                        target_msg = colored(" → ", Colors.DIM) + f"[{targets}]"
-                    else:
-                        target_msg = colored(" → ", Colors.DIM) + colored("[All Factions]", Colors.WHITE)
-                    print(f"{label}{target_msg}")
-                    print(colored(f"  {argument.argument}", Colors.WHITE) + "\n")
-                else:
-                    label = faction_colored(agent.name, f"[{agent.name}]", bold=True)
-                    print(label + colored(" passes this round.", Colors.DIM) + "\n")
-
-            if debate_round < self.max_debate_rounds:
-                if not speaker.next_debate_round():
-                    break
+            if self.debate_mode == "simultaneous":
+                # Every speaker sees the same snapshot of earlier rounds; this
+                # round's arguments are only added once all of them are in
+                arguments = self._fan_out(speak, order)
+                for agent, argument in zip(order, arguments):
+                    self._record_argument(session_id, agent, argument, all_debate_arguments, debate_context)
+            else:
+                for agent in order:
+                    argument = speak(agent)
+                    self._record_argument(session_id, agent, argument, all_debate_arguments, debate_context)
+
+            # Summarise the round once; every speaker in the next round shares it
+            debate_context.end_round()
+
+            round_arguments = [a for a in all_debate_arguments if a.round_number == debate_round]
+            if not speaker.next_debate_round(round_arguments):
+                if debate_round < self.max_debate_rounds:
+                    print(colored(f"🔔 Speaker closes the debate early: {speaker.debate_end_reason}", Colors.BRIGHT_WHITE) + "\n")
+                break
+
+        self.store.record_debate_outcome(session_id, speaker.debate_round, speaker.debate_end_reason)
 
         # ---- Phase: Amendments ----
         print(header("✏️  AMENDMENTS", style="section"))
         speaker.advance_phase()
 
         all_amendments = []
-        for agent in self.agents:
-            amendments = agent.propose_amendments(bill, precedent_context=precedent_context)
+        deadline = self._phase_deadline("amendments")
+        proposals = self._fan_out(
+            lambda agent: agent.propose_amendments(bill, precedent_context=precedent_context, deadline=deadline)
+        )
+        for agent, amendments in zip(self.agents, proposals):
             label = faction_colored(agent.name, f"[{agent.name}]", bold=True)
             if amendments:
                 for a in amendments:
@@ -193,17 +537,32 @@ class ParliamentSession:
         print(header("🗳️  VOTING", style="section"))
         speaker.advance_phase()
 
-        votes = []
-        for agent in self.agents:
-            vote = agent.vote(current_bill, accepted_amendments, precedent_context=precedent_context)
-            votes.append(vote)
-            self.store.save_vote(session_id, vote)
+        deadline = self._phase_deadline("vote")
+        votes, not_needed, tally = self._collect_votes(
+            lambda agent: agent.vote(
+                current_bill, accepted_amendments, precedent_context=precedent_context, deadline=deadline
+            ),
+            speaker.get_veto_factions(),
+        )
+        for vote in votes:
+            decisive = vote.faction not in not_needed
+            self.store.save_vote(session_id, vote, decisive=decisive)
 
-            label = faction_colored(agent.name, f"[{agent.name}]", bold=True)
+            label = faction_colored(vote.faction, f"[{vote.faction}]", bold=True)
             vote_display = vote_colored(vote.choice.value)
-            print(f"{label} votes: {vote_display}")
+            suffix = "" if decisive else colored(" (not needed)", Colors.DIM)
+            print(f"{label} votes: {vote_display}{suffix}")
             print(colored(f"  Justification: {vote.justification}", Colors.DIM) + "\n")
 
+        if tally is not None and not_needed:
+            self.store.record_vote_early_exit(session_id, tally.reason, not_needed)
+            cast = {v.faction for v in votes}
+            skipped = [f for f in not_needed if f not in cast]
+            print(colored(f"🔒 Outcome locked after {tally.decided_after} vote(s): {tally.reason}", Colors.BRIGHT_WHITE))
+            if skipped:
+                print(colored(f"   Vote(s) not collected: {', '.join(skipped)}", Colors.DIM))
+            print()
+
         # ---- Final Decision ----
         print(header("⚖️  FINAL DECISION", style="section"))
         engine = VotingEngine(veto_factions=speaker.get_veto_factions())
@@ -212,9 +571,6 @@ class ParliamentSession:
         self.store.save_decision(session_id, decision)
         self.store.conclude_session(session_id)
 
-        # Update precedent store
-        self.precedent_store.record(current_bill.proposal, decision)
-
         # Print decision
         print(colored("Bill Status: ", Colors.BRIGHT_WHITE, bold=True) + decision_colored(decision.passed))
         print(colored("Approve Weight: ", Colors.GREEN) + colored(str(decision.total_approve_weight), Colors.BRIGHT_GREEN, bold=True))
@@ -242,4 +598,4 @@ class ParliamentSession:
                 print(colored(f"\n⚠️  Audit log export failed: {exc}", Colors.BRIGHT_YELLOW))
 
         print(header("SESSION CONCLUDED", style="main"))
-        return decision
+        return decision, current_bill
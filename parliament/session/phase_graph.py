@@ -0,0 +1,68 @@
+"""
+PhaseGraph — run procedural phases as a small dependency graph.
+
+Some phases of a bill only depend on part of what came before: the Speaker's
+veto decision needs the bill and the ideologies but not the statements, and
+the debate order needs the statements but not the veto decision. Declaring
+those dependencies lets independent phases overlap and starts each phase the
+moment its inputs are ready, instead of waiting for the slowest predecessor.
+
+Tasks must not print; callers present the results in procedural order once
+the graph has finished.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable
+
+
+class PhaseGraph:
+    """
+    A set of named tasks, each started as soon as the tasks it depends on finish.
+
+    Dependencies must be added before their dependants, so the graph is
+    acyclic by construction. Each task receives its dependencies' results as
+    positional arguments, in the order they were listed.
+
+    Usage::
+
+        graph = PhaseGraph()
+        graph.add("statements", collect_statements)
+        graph.add("order", decide_order, after=("statements",))
+        results = graph.run()
+    """
+
+    def __init__(self):
+        self._tasks: dict[str, tuple[Callable[..., Any], tuple[str, ...]]] = {}
+        self.timings: dict[str, tuple[float, float]] = {}  # name -> (started, finished), monotonic
+
+    def add(self, name: str, fn: Callable[..., Any], after: tuple[str, ...] = ()) -> None:
+        if name in self._tasks:
+            raise ValueError(f"Duplicate phase task {name!r}")
+        unknown = [dep for dep in after if dep not in self._tasks]
+        if unknown:
+            raise ValueError(f"Phase task {name!r} depends on unknown task(s) {unknown}")
+        self._tasks[name] = (fn, tuple(after))
+
+    def _timed(self, name: str, fn: Callable[..., Any], *args) -> Any:
+        started = time.monotonic()
+        try:
+            return fn(*args)
+        finally:
+            self.timings[name] = (started, time.monotonic())
+
+    def run(self) -> dict[str, Any]:
+        """Run every task and return ``{name: result}``; the first task error is re-raised."""
+        results: dict[str, Any] = {}
+        pending = dict(self._tasks)
+        running = {}
+        with ThreadPoolExecutor(max_workers=max(1, len(self._tasks))) as pool:
+            while pending or running:
+                ready = [name for name, (_, deps) in pending.items() if all(d in results for d in deps)]
+                for name in ready:
+                    fn, deps = pending.pop(name)
+                    running[pool.submit(self._timed, name, fn, *(results[d] for d in deps))] = name
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+        return results
@@ -5,6 +5,7 @@ Stores decision summaries so that faction agents can reason about
 past parliamentary outcomes when debating and voting on new bills.
 """
 
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -51,11 +52,14 @@ class PrecedentStore:
     After each session, call ``record(bill_proposal, decision)`` to log the outcome.
     Use ``get_precedent_context()`` to retrieve a formatted string ready for
     injection into agent LLM prompts.
+
+    Safe to share between bills deliberated concurrently.
     """
 
     def __init__(self, max_entries: int = 20):
         self._entries: list[PrecedentEntry] = []
         self.max_entries = max_entries
+        self._lock = threading.Lock()
 
     def record(self, bill_proposal: str, decision: Decision) -> None:
         """Record a completed decision as a precedent entry."""
@@ -76,11 +80,12 @@ class PrecedentStore:
             decided_at=decision.decided_at.isoformat(),
         )
 
-        self._entries.append(entry)
+        with self._lock:
+            self._entries.append(entry)
 
-        # Trim to max_entries (keep most recent)
-        if len(self._entries) > self.max_entries:
-            self._entries = self._entries[-self.max_entries :]
+            # Trim to max_entries (keep most recent)
+            if len(self._entries) > self.max_entries:
+                self._entries = self._entries[-self.max_entries :]
 
     def get_precedent_context(self, max_recent: int = 5) -> str:
         """
@@ -88,10 +93,11 @@ class PrecedentStore:
 
         Returns an empty string if no precedents are recorded.
         """
-        if not self._entries:
+        with self._lock:
+            recent = self._entries[-max_recent:]
+        if not recent:
             return ""
 
-        recent = self._entries[-max_recent:]
         lines = ["=== Parliamentary Precedents (most recent first) ==="]
         for entry in reversed(recent):
             lines.append(entry.to_context_string())
@@ -99,4 +105,5 @@ class PrecedentStore:
         return "\n".join(lines).strip()
 
     def __len__(self) -> int:
-        return len(self._entries)
+        with self._lock:
+            return len(self._entries)
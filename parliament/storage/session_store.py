@@ -8,8 +8,10 @@ so that sessions are auditable and replayable.
 import json
 import sqlite3
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 from parliament.core.bill import Bill, BillStatus
 from parliament.core.amendment import Amendment, AmendmentStatus
@@ -19,6 +21,17 @@ from parliament.core.decision import Decision
 
 
 _DEFAULT_DB_PATH = Path("parliament_sessions.db")
+_BUSY_TIMEOUT_SECONDS = 30.0
+
+# (table, column, definition) added after the first release; migrated in place
+_ADDED_COLUMNS = [
+    ("sessions", "debate_rounds", "INTEGER"),
+    ("sessions", "debate_end_reason", "TEXT"),
+    ("sessions", "vote_decided_reason", "TEXT"),
+    ("sessions", "votes_not_needed", "TEXT"),
+    ("sessions", "speaker_rulings", "TEXT"),
+    ("votes", "decisive", "INTEGER NOT NULL DEFAULT 1"),
+]
 
 
 class SessionStore:
@@ -33,6 +46,8 @@ class SessionStore:
         store.save_vote(session_id, vote)
         store.save_decision(session_id, decision)
         sessions = store.list_sessions()
+
+    Safe for concurrent writers: every operation uses its own connection.
     """
 
     def __init__(self, db_path: str | Path = _DEFAULT_DB_PATH):
@@ -41,12 +56,23 @@ class SessionStore:
 
     # ---- Initialisation ----
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA foreign_keys=ON")
-        return conn
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        A short-lived connection: commits on success, rolls back on error, always closes.
+
+        WAL mode plus a busy timeout lets concurrent sessions (and processes)
+        write to the same database; writers wait for the lock instead of failing.
+        """
+        conn = sqlite3.connect(str(self.db_path), timeout=_BUSY_TIMEOUT_SECONDS)
+        try:
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
 
     def _init_db(self) -> None:
         with self._connect() as conn:
@@ -57,7 +83,12 @@ class SessionStore:
                     bill_title   TEXT NOT NULL,
                     bill_json    TEXT NOT NULL,
                     created_at   TEXT NOT NULL,
-                    concluded_at TEXT
+                    concluded_at TEXT,
+                    debate_rounds     INTEGER,
+                    debate_end_reason TEXT,
+                    vote_decided_reason TEXT,
+                    votes_not_needed  TEXT,
+                    speaker_rulings   TEXT
                 );
 
                 CREATE TABLE IF NOT EXISTS debate_arguments (
@@ -90,7 +121,8 @@ class SessionStore:
                     choice       TEXT NOT NULL,
                     weight       REAL NOT NULL,
                     justification TEXT NOT NULL,
-                    recorded_at  TEXT NOT NULL
+                    recorded_at  TEXT NOT NULL,
+                    decisive     INTEGER NOT NULL DEFAULT 1
                 );
 
                 CREATE TABLE IF NOT EXISTS decisions (
@@ -106,7 +138,25 @@ class SessionStore:
                     decision_summary      TEXT NOT NULL,
                     decided_at            TEXT NOT NULL
                 );
+
+                CREATE TABLE IF NOT EXISTS speaker_rulings (
+                    ruling_key   TEXT PRIMARY KEY,
+                    kind         TEXT NOT NULL,
+                    value_json   TEXT NOT NULL,
+                    reasoning    TEXT NOT NULL,
+                    created_at   TEXT NOT NULL
+                );
             """)
+            # Databases created by earlier versions lack the newer columns
+            for table, column, definition in _ADDED_COLUMNS:
+                columns = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+                if column not in columns:
+                    try:
+                        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+                    except sqlite3.OperationalError as exc:
+                        # Another store opened on the same file migrated it first
+                        if "duplicate column" not in str(exc):
+                            raise
 
     # ---- Session management ----
 
@@ -137,6 +187,30 @@ class SessionStore:
                 (datetime.now().isoformat(), session_id),
             )
 
+    def record_debate_outcome(self, session_id: str, rounds: int, reason: str | None) -> None:
+        """Record how many debate rounds were held and why the debate ended."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE sessions SET debate_rounds = ?, debate_end_reason = ? WHERE session_id = ?",
+                (rounds, reason, session_id),
+            )
+
+    def record_vote_early_exit(self, session_id: str, reason: str, not_needed: list[str]) -> None:
+        """Record why the vote was decided early and whose votes were not needed."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE sessions SET vote_decided_reason = ?, votes_not_needed = ? WHERE session_id = ?",
+                (reason, json.dumps(not_needed), session_id),
+            )
+
+    def record_speaker_rulings(self, session_id: str, rulings: dict[str, dict]) -> None:
+        """Record which Speaker rulings were made fresh and which were reused."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE sessions SET speaker_rulings = ? WHERE session_id = ?",
+                (json.dumps(rulings), session_id),
+            )
+
     def list_sessions(self) -> list[dict]:
         """Return a list of all sessions with basic metadata."""
         with self._connect() as conn:
@@ -217,14 +291,15 @@ class SessionStore:
 
     # ---- Votes ----
 
-    def save_vote(self, session_id: str, vote: Vote) -> None:
+    def save_vote(self, session_id: str, vote: Vote, decisive: bool = True) -> None:
+        """Store a vote; ``decisive=False`` marks one cast after the outcome was locked."""
         with self._connect() as conn:
             conn.execute(
                 """
                 INSERT INTO votes
                     (id, session_id, bill_version, faction, choice,
-                     weight, justification, recorded_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                     weight, justification, recorded_at, decisive)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     str(vote.id),
@@ -235,6 +310,7 @@ class SessionStore:
                     vote.weight,
                     vote.justification,
                     datetime.now().isoformat(),
+                    int(decisive),
                 ),
             )
 
@@ -281,6 +357,28 @@ class SessionStore:
             ).fetchall()
         return [dict(r) for r in rows]
 
+    # ---- Speaker rulings ----
+
+    def save_ruling(self, ruling_key: str, kind: str, value: list[str], reasoning: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO speaker_rulings
+                    (ruling_key, kind, value_json, reasoning, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (ruling_key, kind, json.dumps(value), reasoning, datetime.now().isoformat()),
+            )
+
+    def get_ruling(self, ruling_key: str) -> tuple[list[str], str] | None:
+        """Return ``(value, reasoning)`` of a stored ruling, or None."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value_json, reasoning FROM speaker_rulings WHERE ruling_key = ?",
+                (ruling_key,),
+            ).fetchone()
+        return (json.loads(row["value_json"]), row["reasoning"]) if row else None
+
     # ---- Full session export ----
 
     def export_session(self, session_id: str) -> dict:
@@ -2,6 +2,9 @@
 Terminal color utilities for parliament output
 """
 
+import sys
+
+
 class Colors:
     """ANSI color codes for terminal output"""
     # Basic colors
@@ -136,3 +139,33 @@ def decision_colored(passed: bool) -> str:
         return colored("✓ PASSED", Colors.BRIGHT_GREEN, bold=True)
     else:
         return colored("✗ REJECTED", Colors.BRIGHT_RED, bold=True)
+
+
+class PartialRenderer:
+    """
+    Single-line live view of a streaming LLM response.
+
+    Install as ``LLMClient(on_partial=PartialRenderer())``. Each update
+    overwrites the status line with the fields written so far; the line is
+    cleared once the response completes, before the transcript is printed.
+    """
+
+    def __init__(self, stream=None, width: int = 100):
+        self.stream = stream
+        self.width = width
+
+    def _write(self, text: str) -> None:
+        out = self.stream or sys.stdout
+        out.write(text)
+        out.flush()
+
+    def __call__(self, phase: str | None, partial, done: bool) -> None:
+        if done:
+            self._write("\r\033[K")
+            return
+        if isinstance(partial, dict):
+            fields = " ".join(f"{key}={value}" for key, value in partial.items())
+        else:
+            fields = str(partial)
+        line = f"… {phase or 'llm'}: {fields}".replace("\n", " ")
+        self._write("\r\033[K" + colored(line[: self.width], Colors.DIM))
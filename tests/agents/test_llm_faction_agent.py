@@ -187,3 +187,35 @@ def test_vote_includes_amendment_context_in_prompt():
     call_kwargs = mock_llm.generate_json.call_args
     user_prompt = call_kwargs[0][1]
     assert "Add safety checks" in user_prompt
+
+
+# ---- Deadlines ----
+
+def test_vote_abstains_immediately_when_deadline_is_missed():
+    import time
+    from types import SimpleNamespace
+    from parliament.llm.client import LLMClient
+    from parliament.llm.deadline import Deadline
+
+    class HungClient:
+        def invoke(self, messages):
+            time.sleep(1.0)
+            return SimpleNamespace(content='{"choice": "APPROVE", "justification": "late"}')
+
+    llm = LLMClient(provider="cerebras", client=HungClient(), model="m", single_flight=None)
+    agent = EfficiencyAgent(IDEOLOGY, llm=llm)
+    started = time.monotonic()
+    vote = agent.vote(make_bill(), [], deadline=Deadline(0.05))
+    assert time.monotonic() - started < 0.5
+    assert vote.choice == VoteChoice.ABSTAIN
+    assert "deadline" in vote.justification
+
+
+def test_deadline_is_propagated_as_timeout():
+    from parliament.llm.deadline import Deadline
+
+    mock_llm = make_mock_llm({"summary": "ok"})
+    agent = EfficiencyAgent(IDEOLOGY, llm=mock_llm)
+    agent.statement(make_bill(), deadline=Deadline(30))
+    timeout = mock_llm.generate_json.call_args.kwargs["timeout"]
+    assert 0 < timeout <= 30
@@ -0,0 +1,85 @@
+"""
+Unit tests for debate convergence detection.
+"""
+
+import pytest
+from uuid import uuid4
+
+from parliament.core.debate import DebateArgument
+from parliament.engine.convergence import ConvergenceDetector, shingles, similarity
+
+
+# ---- Helpers ----
+
+BILL_ID = uuid4()
+
+
+def make_round(round_number: int, arguments: dict[str, str]) -> list[DebateArgument]:
+    return [
+        DebateArgument(
+            id=uuid4(),
+            bill_id=BILL_ID,
+            bill_version=1,
+            speaker_faction=faction,
+            round_number=round_number,
+            argument=text,
+        )
+        for faction, text in arguments.items()
+    ]
+
+
+# ---- Similarity ----
+
+def test_shingles_ignore_case_and_punctuation():
+    assert shingles("Cut the budget, now!") == shingles("cut THE budget now")
+
+
+def test_similarity_bounds():
+    text = "Audits must precede any rollout of the system."
+    assert similarity(text, text) == 1.0
+    assert similarity(text, "Fund the pilot in rural districts first.") == 0.0
+
+
+def test_short_texts_compare_as_single_shingle():
+    assert similarity("No.", "no") == 1.0
+
+
+# ---- Detector ----
+
+def test_restated_positions_converge():
+    detector = ConvergenceDetector(threshold=0.6)
+    positions = {
+        "Safety": "The rollout must pause until independent audits are complete.",
+        "Efficiency": "The budget overrun makes this proposal too costly to approve.",
+    }
+    assert detector.observe(make_round(1, positions)) is None
+    restated = {
+        "Safety": "The rollout must pause until independent audits are complete!",
+        "Efficiency": "Again, the budget overrun makes this proposal too costly to approve.",
+    }
+    reason = detector.observe(make_round(2, restated))
+    assert reason is not None and "round 2" in reason
+    assert min(detector.last_similarities.values()) >= 0.6
+
+
+def test_one_moving_faction_keeps_debate_open():
+    detector = ConvergenceDetector(threshold=0.6)
+    detector.observe(make_round(1, {"Safety": "Pause the rollout now.", "Equity": "Fairness first for all."}))
+    reason = detector.observe(make_round(2, {
+        "Safety": "Pause the rollout now.",
+        "Equity": "We could accept it with a rural subsidy clause.",
+    }))
+    assert reason is None
+
+
+def test_patience_requires_consecutive_converged_rounds():
+    detector = ConvergenceDetector(threshold=0.9, patience=2)
+    same = {"Safety": "Pause the rollout until audits finish."}
+    assert detector.observe(make_round(1, same)) is None
+    assert detector.observe(make_round(2, same)) is None
+    assert detector.observe(make_round(3, same)) is not None
+
+
+def test_invalid_threshold_rejected():
+    with pytest.raises(ValueError):
+        ConvergenceDetector(threshold=0.0)
@@ -0,0 +1,116 @@
+"""
+Unit tests for bounded debate context and the rolling round summary.
+"""
+
+import pytest
+from uuid import uuid4
+
+from parliament.core.debate import DebateArgument
+from parliament.engine.debate_context import DebateContext
+
+
+# ---- Helpers ----
+
+BILL_ID = uuid4()
+FACTIONS = ["Efficiency", "Safety", "Equity", "Innovation"]
+
+
+def make_argument(faction: str, round_number: int, text: str | None = None, targets=None) -> DebateArgument:
+    return DebateArgument(
+        id=uuid4(),
+        bill_id=BILL_ID,
+        bill_version=1,
+        speaker_faction=faction,
+        round_number=round_number,
+        argument=text or f"{faction} argues in round {round_number}. More detail follows here.",
+        targeted_factions=targets or [],
+    )
+
+
+def run_rounds(context: DebateContext, rounds: int) -> None:
+    for round_number in range(1, rounds + 1):
+        for faction in FACTIONS:
+            context.add(make_argument(faction, round_number))
+        context.end_round()
+
+
+# ---- Modes ----
+
+def test_full_mode_matches_legacy_transcript():
+    context = DebateContext()
+    context.add(make_argument("Safety", 1, "Too risky."))
+    context.add(make_argument("Equity", 1, "Unfair."))
+    assert context.render("Efficiency", 2) == (
+        "\nPrevious debate arguments:\n[Safety]: Too risky.\n[Equity]: Unfair.\n"
+    )
+
+
+def test_first_round_has_no_context():
+    context = DebateContext(mode="last_n")
+    context.add(make_argument("Safety", 1))
+    assert context.render("Efficiency", 1) == ""
+
+
+def test_last_n_keeps_only_recent_rounds():
+    context = DebateContext(mode="last_n", window=1)
+    run_rounds(context, 3)
+    rendered = context.render("Efficiency", 4)
+    assert "argues in round 3" in rendered
+    assert "[Safety]: Safety argues in round 2" not in rendered
+
+
+def test_targeted_mode_keeps_arguments_aimed_at_faction():
+    context = DebateContext(mode="targeted")
+    context.add(make_argument("Safety", 1, "Efficiency ignores risk.", targets=["Efficiency"]))
+    context.add(make_argument("Equity", 1, "Innovation ignores fairness.", targets=["Innovation"]))
+    context.end_round()
+    rendered = context.render("Efficiency", 2)
+    assert "[Safety]: Efficiency ignores risk." in rendered
+    assert "[Equity]: Innovation ignores fairness." not in rendered
+
+
+def test_budget_mode_keeps_newest_arguments_within_budget():
+    context = DebateContext(mode="budget", token_budget=40)
+    run_rounds(context, 3)
+    rendered = context.render("Efficiency", 4)
+    verbatim = rendered.split("Recent debate arguments:\n", 1)[1]
+    assert "round 3" in verbatim
+    assert "round 1" not in verbatim
+
+
+def test_unknown_mode_rejected():
+    with pytest.raises(ValueError):
+        DebateContext(mode="everything")
+
+
+# ---- Rolling summary ----
+
+def test_summary_keeps_latest_stance_per_faction():
+    context = DebateContext(mode="last_n")
+    run_rounds(context, 2)
+    summary = context.summary
+    assert summary.count("\n") == len(FACTIONS)
+    assert "(round 2) Safety argues in round 2." in summary
+    assert "More detail" not in summary
+
+
+def test_summary_computed_once_per_round():
+    context = DebateContext(mode="budget")
+    run_rounds(context, 3)
+    for faction in FACTIONS:
+        context.render(faction, 4)
+    context.end_round()  # Nothing new since the last round
+    assert context.summary_updates == 3
+
+
+def test_bounded_prompt_size_flat_across_rounds():
+    sizes = {}
+    for rounds in (3, 8):
+        context = DebateContext(mode="last_n", window=1)
+        run_rounds(context, rounds)
+        sizes[rounds] = len(context.render("Efficiency", rounds + 1))
+    assert sizes[8] == sizes[3]
+
+    full = DebateContext()
+    run_rounds(full, 8)
+    assert len(full.render("Efficiency", 9)) > 2 * sizes[8]
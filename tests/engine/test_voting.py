@@ -9,7 +9,7 @@ from datetime import datetime
 from parliament.core.bill import Bill, BillStatus
 from parliament.core.vote import Vote, VoteChoice
 from parliament.core.decision import Decision
-from parliament.engine.voting import VotingEngine
+from parliament.engine.voting import VoteTally, VotingEngine
 
 
 # ---- Fixtures ----
@@ -212,3 +212,57 @@ def test_decision_is_immutable():
     decision = engine.evaluate(bill, votes)
     with pytest.raises((TypeError, ValidationError)):
         decision.passed = False
+
+
+# ---- Incremental tally ----
+
+WEIGHTS = {"Efficiency": 1.0, "Safety": 1.0, "Equity": 1.0, "Innovation": 1.0}
+
+
+def test_tally_decides_on_veto_reject():
+    bill = make_bill()
+    tally = VoteTally(WEIGHTS, veto_factions={"Safety"})
+    assert tally.add(make_vote(bill, "Safety", VoteChoice.REJECT)) is True
+    assert tally.passed is False
+    assert tally.decided_after == 1
+    assert "vetoed by Safety" in tally.reason
+
+
+def test_tally_decides_rejection_when_approve_cannot_catch_up():
+    bill = make_bill()
+    tally = VoteTally(WEIGHTS)
+    assert tally.add(make_vote(bill, "Efficiency", VoteChoice.REJECT)) is False
+    # 2 reject vs at most 2 approve: a tie still fails
+    assert tally.add(make_vote(bill, "Safety", VoteChoice.REJECT)) is True
+    assert tally.passed is False
+
+
+def test_tally_pass_waits_for_outstanding_veto_faction():
+    bill = make_bill()
+    weights = {**WEIGHTS, "Efficiency": 5.0}
+    tally = VoteTally(weights, veto_factions={"Innovation"})
+    assert tally.add(make_vote(bill, "Efficiency", VoteChoice.APPROVE, weight=5.0)) is False
+    assert tally.add(make_vote(bill, "Innovation", VoteChoice.APPROVE)) is True
+    assert tally.passed is True
+
+
+def test_tally_agrees_with_engine_when_complete():
+    bill = make_bill()
+    votes = [
+        make_vote(bill, "Efficiency", VoteChoice.APPROVE),
+        make_vote(bill, "Safety", VoteChoice.ABSTAIN),
+        make_vote(bill, "Equity", VoteChoice.REJECT),
+        make_vote(bill, "Innovation", VoteChoice.APPROVE),
+    ]
+    tally = VoteTally(WEIGHTS)
+    for vote in votes:
+        tally.add(vote)
+    assert tally.passed == VotingEngine().evaluate(bill, votes).passed
+
+
+def test_tally_rejects_duplicate_vote():
+    bill = make_bill()
+    tally = VoteTally(WEIGHTS)
+    tally.add(make_vote(bill, "Efficiency", VoteChoice.APPROVE))
+    with pytest.raises(ValueError, match="duplicate"):
+        tally.add(make_vote(bill, "Efficiency", VoteChoice.APPROVE))
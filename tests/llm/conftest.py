@@ -0,0 +1,142 @@
+"""
+Shared fakes and fixtures for the LLM client tests.
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from parliament.llm.client import LLMClient
+
+
+class FakeCerebras:
+    """
+    Configurable stand-in for LangChain's ChatCerebras (invoke/ainvoke/stream/astream).
+
+    Args:
+        responses: Response text, or one text per call; the last one repeats.
+        delays: Seconds each call takes, or one value per call; the last one repeats.
+        error: Exception raised by every call after its delay.
+        usage: ``usage_metadata`` attached to each response.
+        chunk_size: Characters per streamed chunk.
+
+    Every call is recorded: ``calls`` counts them, ``prompts`` holds the
+    user messages, ``messages`` the full message lists and ``kwargs`` the
+    extra request parameters. ``in_flight``/``max_in_flight`` track async
+    overlap, ``cancelled`` counts async calls cancelled mid-flight and
+    ``chunks_sent`` counts streamed chunks.
+    """
+
+    def __init__(
+        self,
+        responses: str | list[str] = '{"summary": "ok"}',
+        delays: float | list[float] = 0.0,
+        error: Exception | None = None,
+        usage: dict | None = None,
+        chunk_size: int = 3,
+    ):
+        self.responses = [responses] if isinstance(responses, str) else list(responses)
+        self.delays = [delays] if isinstance(delays, (int, float)) else list(delays)
+        self.error = error
+        self.usage = usage
+        self.chunk_size = chunk_size
+        self.calls = 0
+        self.prompts: list[str] = []
+        self.messages: list[list[dict]] = []
+        self.kwargs: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = 0
+        self.chunks_sent = 0
+        self._lock = threading.Lock()
+
+    def _begin(self, messages, kwargs) -> tuple[str, float]:
+        """Record a call; return its response text and delay."""
+        with self._lock:
+            index = self.calls
+            self.calls += 1
+            self.messages.append(messages)
+            self.prompts.append(messages[-1]["content"])
+            self.kwargs.append(kwargs)
+        text = self.responses[min(index, len(self.responses) - 1)]
+        delay = self.delays[min(index, len(self.delays) - 1)]
+        return text, delay
+
+    def _response(self, text: str) -> SimpleNamespace:
+        if self.error is not None:
+            raise self.error
+        if self.usage is not None:
+            return SimpleNamespace(content=text, usage_metadata=self.usage)
+        return SimpleNamespace(content=text)
+
+    def invoke(self, messages, **kwargs):
+        text, delay = self._begin(messages, kwargs)
+        time.sleep(delay)
+        return self._response(text)
+
+    async def ainvoke(self, messages, **kwargs):
+        text, delay = self._begin(messages, kwargs)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        return self._response(text)
+
+    def _chunks(self, text: str) -> list[str]:
+        return [text[i:i + self.chunk_size] for i in range(0, len(text), self.chunk_size)]
+
+    def stream(self, messages, **kwargs):
+        text, _ = self._begin(messages, kwargs)
+        for piece in self._chunks(text):
+            self.chunks_sent += 1
+            yield SimpleNamespace(content=piece)
+
+    async def astream(self, messages, **kwargs):
+        text, _ = self._begin(messages, kwargs)
+        for piece in self._chunks(text):
+            self.chunks_sent += 1
+            yield SimpleNamespace(content=piece)
+
+
+class FakeGeminiModels:
+    """Stand-in for ``genai.Client().models``; records the keyword arguments of each call."""
+
+    def __init__(self, text: str = '{"summary": "ok"}'):
+        self.text = text
+        self.calls = 0
+        self.kwargs: list[dict] = []
+
+    def generate_content(self, **kwargs):
+        self.calls += 1
+        self.kwargs.append(kwargs)
+        return SimpleNamespace(text=self.text)
+
+
+class FakeAsyncGeminiModels(FakeGeminiModels):
+    async def generate_content(self, **kwargs):
+        return FakeGeminiModels.generate_content(self, **kwargs)
+
+
+def fake_gemini(text: str = '{"summary": "ok"}') -> SimpleNamespace:
+    """A ``genai.Client``-shaped fake with sync ``models`` and async ``aio.models``."""
+    return SimpleNamespace(models=FakeGeminiModels(text), aio=SimpleNamespace(models=FakeAsyncGeminiModels(text)))
+
+
+@pytest.fixture
+def make_llm():
+    """Factory for an LLMClient around a fake SDK client, with coalescing off by default."""
+
+    def factory(fake=None, provider: str = "cerebras", **kwargs) -> LLMClient:
+        kwargs.setdefault("model", "test-model")
+        kwargs.setdefault("single_flight", None)
+        return LLMClient(provider=provider, client=fake if fake is not None else FakeCerebras(), **kwargs)
+
+    return factory
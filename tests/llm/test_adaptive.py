@@ -0,0 +1,144 @@
+"""
+Unit tests for the adaptive (AIMD) concurrency limiter.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from types import SimpleNamespace
+
+from parliament.llm.adaptive import (
+    AdaptiveConcurrencyLimiter,
+    is_overload_error,
+    set_adaptive_concurrency,
+    clear_adaptive_limiters,
+)
+from parliament.llm.client import LLMClient
+
+
+@pytest.fixture(autouse=True)
+def reset_limiters():
+    clear_adaptive_limiters()
+    yield
+    clear_adaptive_limiters()
+
+
+class HTTPError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+# ---- Error classification ----
+
+def test_overload_errors_are_recognised():
+    assert is_overload_error(HTTPError(429))
+    assert is_overload_error(HTTPError(503))
+    assert not is_overload_error(HTTPError(400))
+    assert is_overload_error(RuntimeError("Rate limit exceeded"))
+    assert not is_overload_error(ValueError("bad json"))
+
+
+# ---- AIMD behaviour ----
+
+def test_limit_grows_additively_when_healthy():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=10)
+    for _ in range(20):
+        generation = limiter.acquire()
+        limiter.release(generation, latency=0.1)
+    assert 4 <= limiter.stats()["limit"] <= 10
+    assert limiter.increases == 20
+
+
+def test_limit_is_capped_at_max():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3)
+    for _ in range(100):
+        limiter.release(limiter.acquire(), latency=0.1)
+    assert limiter.stats()["limit"] == 3
+
+
+def test_429_cuts_limit_once_per_generation():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+    generations = [limiter.acquire() for _ in range(4)]
+    for generation in generations:
+        limiter.release(generation, latency=0.1, error=HTTPError(429))
+    assert limiter.stats()["limit"] == 4
+    assert limiter.decreases == 1
+
+
+def test_limit_never_drops_below_min():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=1)
+    for _ in range(5):
+        limiter.release(limiter.acquire(), latency=0.1, error=HTTPError(500))
+    assert limiter.stats()["limit"] == 1
+
+
+def test_latency_spike_cuts_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_samples=5)
+    for _ in range(10):
+        limiter.release(limiter.acquire(), latency=0.1)
+    before = limiter.limit
+    limiter.release(limiter.acquire(), latency=5.0)
+    assert limiter.limit < before
+
+
+def test_non_overload_errors_do_not_cut_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+    limiter.release(limiter.acquire(), latency=0.1, error=ValueError("bad json"))
+    assert limiter.stats()["limit"] == 4
+    assert limiter.decreases == 0
+
+
+# ---- Slot enforcement ----
+
+def test_sync_callers_queue_beyond_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    generation = limiter.acquire()
+    acquired = threading.Event()
+
+    def waiter():
+        limiter.release(limiter.acquire(), latency=0.01)
+        acquired.set()
+
+    t = threading.Thread(target=waiter)
+    t.start()
+    time.sleep(0.02)
+    assert not acquired.is_set()
+    assert limiter.stats()["queued"] == 1
+    limiter.release(generation, latency=0.01)
+    t.join(timeout=1)
+    assert acquired.is_set()
+
+
+def test_async_in_flight_never_exceeds_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    peak = {"value": 0}
+
+    async def call():
+        async with limiter.atrack():
+            peak["value"] = max(peak["value"], limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def run_all():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(run_all())
+    assert peak["value"] == 2
+    assert limiter.in_flight == 0
+
+
+# ---- LLMClient integration ----
+
+def test_llm_client_reports_provider_overload_to_limiter():
+    limiter = set_adaptive_concurrency("cerebras", initial_limit=4)
+
+    class Overloaded:
+        def invoke(self, messages):
+            raise HTTPError(429)
+
+    llm = LLMClient(provider="cerebras", client=Overloaded(), model="m", single_flight=None)
+    with pytest.raises(HTTPError):
+        llm.generate_json("sys", "user")
+    assert limiter.stats()["limit"] == 2
+    assert limiter.in_flight == 0
@@ -0,0 +1,110 @@
+"""
+Unit tests for the persistent LLM response cache.
+"""
+
+import sqlite3
+import time
+import pytest
+
+from parliament.llm.cache import ResponseCache, make_cache_key
+from tests.llm.conftest import FakeCerebras
+
+
+# ---- Helpers ----
+
+def make_cache(tmp_path, **kwargs) -> ResponseCache:
+    return ResponseCache(db_path=tmp_path / "cache.db", **kwargs)
+
+
+# ---- Keys ----
+
+def test_cache_key_is_stable_and_content_addressed():
+    a = make_cache_key("cerebras", "m", "sys", "user", {"temperature": 0.2})
+    b = make_cache_key("cerebras", "m", "sys", "user", {"temperature": 0.2})
+    assert a == b
+    assert a != make_cache_key("cerebras", "m", "sys", "user", {"temperature": 0.3})
+    assert a != make_cache_key("google", "m", "sys", "user", {"temperature": 0.2})
+    assert a != make_cache_key("cerebras", "m", "sys", "other", {"temperature": 0.2})
+
+
+# ---- ResponseCache ----
+
+class TestResponseCache:
+    def test_miss_then_hit(self, tmp_path):
+        cache = make_cache(tmp_path)
+        assert cache.get("k") is None
+        cache.put("k", {"summary": "ok"})
+        assert cache.get("k") == {"summary": "ok"}
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        make_cache(tmp_path).put("k", [1, 2])
+        assert make_cache(tmp_path).get("k") == [1, 2]
+
+    def test_lru_eviction_keeps_recently_used(self, tmp_path):
+        cache = make_cache(tmp_path, max_entries=2)
+        cache.put("a", 1)
+        time.sleep(0.01)
+        cache.put("b", 2)
+        time.sleep(0.01)
+        cache.get("a")  # "b" is now least recently used
+        time.sleep(0.01)
+        cache.put("c", 3)
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = make_cache(tmp_path, ttl_seconds=0.01)
+        cache.put("k", {"v": 1})
+        time.sleep(0.02)
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_rejects_non_positive_size(self, tmp_path):
+        with pytest.raises(ValueError):
+            make_cache(tmp_path, max_entries=0)
+
+
+# ---- LLMClient integration ----
+
+def test_llm_client_serves_repeat_requests_from_cache(tmp_path, make_llm):
+    fake = FakeCerebras('{"summary": "cached"}')
+    cache = make_cache(tmp_path)
+    llm = make_llm(fake, cache=cache)
+
+    assert llm.generate_json("sys", "user") == {"summary": "cached"}
+    assert llm.generate_json("sys", "user") == {"summary": "cached"}
+    assert fake.calls == 1
+
+    llm.generate_json("sys", "different user prompt")
+    assert fake.calls == 2
+
+
+def test_llm_client_without_cache_always_calls_provider(make_llm):
+    fake = FakeCerebras('{"summary": "fresh"}')
+    llm = make_llm(fake)
+    llm.generate_json("sys", "user")
+    llm.generate_json("sys", "user")
+    assert fake.calls == 2
+
+
+def test_connections_are_closed_after_each_operation(tmp_path, monkeypatch):
+    opened = []
+    real_connect = sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        conn = real_connect(*args, **kwargs)
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(sqlite3, "connect", tracking_connect)
+    cache = ResponseCache(tmp_path / "cache.db")
+    cache.put("k", {"a": 1})
+    assert cache.get("k") == {"a": 1}
+    assert len(cache) == 1
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
@@ -0,0 +1,173 @@
+"""
+Unit tests for LLMClient with stubbed provider SDK clients.
+"""
+
+import asyncio
+import threading
+import pytest
+from types import SimpleNamespace
+
+from parliament.llm import client as client_module
+from parliament.llm.client import LLMClient, set_max_concurrency, get_max_concurrency
+from tests.llm.conftest import FakeCerebras, fake_gemini
+
+
+# ---- Helpers ----
+
+@pytest.fixture(autouse=True)
+def reset_concurrency_limits():
+    yield
+    client_module._max_concurrency.clear()
+
+
+# ---- Sync path ----
+
+def test_generate_json_parses_fenced_output(make_llm):
+    fake = FakeCerebras(['```json\n{"summary": "ok"}\n```'])
+    llm = make_llm(fake)
+    assert llm.generate_json("sys", "user") == {"summary": "ok"}
+
+
+def test_generate_json_retries_then_fails(make_llm):
+    fake = FakeCerebras(["not json"])
+    llm = make_llm(fake)
+    with pytest.raises(ValueError, match="after 2 attempts"):
+        llm.generate_json("sys", "user", retries=1)
+    assert fake.calls == 2
+
+
+def test_generate_json_google_path(make_llm):
+    llm = make_llm(fake_gemini('{"choice": "APPROVE"}'), provider="google", model="gemini")
+    assert llm.generate_json("sys", "user") == {"choice": "APPROVE"}
+
+
+def test_unknown_provider_raises():
+    with pytest.raises(ValueError, match="Unknown LLM provider"):
+        LLMClient(provider="nope")
+
+
+# ---- Async path ----
+
+def test_agenerate_json_cerebras_path(make_llm):
+    fake = FakeCerebras(['{"summary": "async"}'])
+    llm = make_llm(fake)
+    assert asyncio.run(llm.agenerate_json("sys", "user")) == {"summary": "async"}
+
+
+def test_agenerate_json_google_path(make_llm):
+    gemini = fake_gemini('{"summary": "async"}')
+    llm = make_llm(gemini, provider="google", model="gemini")
+    assert asyncio.run(llm.agenerate_json("sys", "user")) == {"summary": "async"}
+    assert gemini.aio.models.calls == 1
+    assert gemini.models.calls == 0
+
+
+def test_agenerate_json_retries_on_invalid_json(make_llm):
+    fake = FakeCerebras(["oops", '{"summary": "fixed"}'])
+    llm = make_llm(fake)
+    assert asyncio.run(llm.agenerate_json("sys", "user")) == {"summary": "fixed"}
+    assert fake.calls == 2
+
+
+def test_agenerate_json_runs_concurrently_within_provider_limit(make_llm):
+    set_max_concurrency("cerebras", 2)
+    fake = FakeCerebras(['{"summary": "ok"}'], delays=0.01)
+    llm = make_llm(fake)
+
+    async def run_all():
+        return await asyncio.gather(*(llm.agenerate_json("sys", f"user {i}") for i in range(6)))
+
+    results = asyncio.run(run_all())
+    assert len(results) == 6
+    assert fake.max_in_flight == 2
+
+
+def test_set_max_concurrency_rejects_non_positive():
+    with pytest.raises(ValueError):
+        set_max_concurrency("cerebras", 0)
+    assert get_max_concurrency("cerebras") == client_module.DEFAULT_MAX_CONCURRENCY
+
+
+# ---- Shared client registry ----
+
+@pytest.fixture
+def counting_factory(monkeypatch):
+    built = []
+
+    def factory(provider="cerebras", model=None):
+        built.append((provider, model))
+        return object(), model
+
+    client_module.clear_client_registry()
+    monkeypatch.setattr(client_module, "get_client_from", factory)
+    yield built
+    client_module.clear_client_registry()
+
+
+def test_clients_share_one_sdk_client_per_provider(counting_factory):
+    a = LLMClient(provider="cerebras")
+    b = LLMClient(provider="cerebras")
+    assert a.client is b.client
+    assert counting_factory == [("cerebras", "llama-3.3-70b")]
+
+
+def test_registry_separates_models_and_credentials(counting_factory, monkeypatch):
+    LLMClient(provider="cerebras")
+    LLMClient(provider="cerebras", model="llama3.1-8b")
+    monkeypatch.setenv("CEREBRAS_API_KEY", "rotated-key")
+    LLMClient(provider="cerebras")
+    assert len(counting_factory) == 3
+
+
+def test_warm_up_prebuilds_clients(counting_factory):
+    client_module.warm_up_clients(["cerebras", "google"])
+    assert len(counting_factory) == 2
+    LLMClient(provider="google")
+    assert len(counting_factory) == 2
+
+
+def test_router_client_builds_shared_backends(monkeypatch):
+    real_factory = client_module.get_client_from
+
+    def factory(provider="cerebras", model=None):
+        if provider == "router":
+            return real_factory(provider, model)
+        return FakeCerebras('{"ok": true}'), model
+
+    client_module.clear_client_registry()
+    monkeypatch.setattr(client_module, "get_client_from", factory)
+    built = []
+    worker = threading.Thread(target=lambda: built.append(LLMClient(provider="router")), daemon=True)
+    worker.start()
+    worker.join(timeout=5)
+    assert not worker.is_alive(), "building the router client deadlocked"
+    try:
+        router = built[0].client
+        assert [b.client.provider for b in router.backends] == client_module.DEFAULT_ROUTER_PROVIDERS
+        assert router.backends[0].client.client is LLMClient(provider="cerebras").client
+        assert LLMClient(provider="router").client is router
+    finally:
+        client_module.clear_client_registry()
+
+
+def test_warm_up_opens_connections(monkeypatch):
+    opened = []
+    google = SimpleNamespace(models=SimpleNamespace(get=lambda model: opened.append(("google", model))))
+    cerebras = SimpleNamespace(
+        root_client=SimpleNamespace(models=SimpleNamespace(list=lambda: opened.append(("cerebras", None))))
+    )
+    sdk = {"google": google, "cerebras": cerebras}
+
+    client_module.clear_client_registry()
+    monkeypatch.setattr(client_module, "get_client_from", lambda provider, model=None: (sdk[provider], model))
+    try:
+        client_module.warm_up_clients(["cerebras", "google"])
+    finally:
+        client_module.clear_client_registry()
+    assert sorted(opened) == [("cerebras", None), ("google", "gemini-2.0-flash")]
+
+
+def test_warm_up_ignores_connection_errors(counting_factory):
+    # object() has no metadata endpoints; warm-up must not fail the run
+    client_module.warm_up_clients(["cerebras"])
+    assert len(counting_factory) == 1
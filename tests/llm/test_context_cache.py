@@ -0,0 +1,174 @@
+"""
+Unit tests for Gemini explicit context caching.
+"""
+
+import asyncio
+import threading
+import time
+import yaml
+from pathlib import Path
+from types import SimpleNamespace
+
+from parliament.llm.context_cache import GeminiContextCache
+from parliament.llm.prompts import bill_section, compile_identity
+from parliament.utils.bill_loader import load_bill_from_yaml
+from tests.llm.conftest import FakeGeminiModels
+
+
+# ---- Helpers ----
+
+ROOT = Path(__file__).resolve().parents[2]
+SHIPPED_BILLS = ["ai_teaching_assistant", "open_source_llm_grants"]
+
+
+class FakeCaches:
+    def __init__(self, fail: bool = False, delay: float = 0.0):
+        self.attempts = 0
+        self.created: list[dict] = []
+        self.fail = fail
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def create(self, model, config):
+        with self._lock:
+            self.attempts += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+            if self.fail:
+                raise RuntimeError("too small")
+            self.created.append({"model": model, **config})
+            return SimpleNamespace(name=f"cachedContents/{len(self.created)}")
+
+
+def make_gemini(fail: bool = False, delay: float = 0.0) -> SimpleNamespace:
+    return SimpleNamespace(caches=FakeCaches(fail, delay), models=FakeGeminiModels())
+
+
+def lookup_in_threads(cache: GeminiContextCache, prefixes: list[str]) -> list:
+    results = [None] * len(prefixes)
+
+    def worker(i):
+        results[i] = cache.lookup("m", "sys", prefixes[i])
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(prefixes))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+# ---- Cache ----
+
+def test_cache_is_created_once_and_reused():
+    gemini = make_gemini()
+    cache = GeminiContextCache(gemini, min_tokens=0)
+    assert cache.lookup("m", "sys", "bill") == "cachedContents/1"
+    assert cache.lookup("m", "sys", "bill") == "cachedContents/1"
+    assert cache.lookup("m", "sys", "other bill") == "cachedContents/2"
+    assert cache.stats()["created"] == 2
+    assert cache.stats()["reused"] == 1
+
+
+def test_small_prefixes_are_not_cached():
+    gemini = make_gemini()
+    cache = GeminiContextCache(gemini, min_tokens=4096)
+    assert cache.lookup("m", "sys", "bill") is None
+    assert gemini.caches.created == []
+
+
+def test_creation_errors_fall_back_to_uncached():
+    cache = GeminiContextCache(make_gemini(fail=True), min_tokens=0)
+    assert cache.lookup("m", "sys", "bill") is None
+    assert cache.stats()["errors"] == 1
+
+
+def test_failed_prefix_is_not_retried_during_backoff():
+    gemini = make_gemini(fail=True)
+    cache = GeminiContextCache(gemini, min_tokens=0)
+    assert cache.lookup("m", "sys", "bill") is None
+    assert cache.lookup("m", "sys", "bill") is None
+    assert asyncio.run(cache.alookup("m", "sys", "bill")) is None
+    assert gemini.caches.attempts == 1
+    assert cache.stats()["skipped"] == 2
+
+
+def test_failed_prefix_is_retried_after_backoff():
+    gemini = make_gemini(fail=True)
+    cache = GeminiContextCache(gemini, min_tokens=0, failure_backoff=0.0)
+    cache.lookup("m", "sys", "bill")
+    gemini.caches.fail = False
+    assert cache.lookup("m", "sys", "bill") == "cachedContents/1"
+    assert gemini.caches.attempts == 2
+
+
+def test_default_threshold_admits_shipped_prompt_prefixes():
+    factions = yaml.safe_load((ROOT / "parliament" / "config" / "factions.yaml").read_text())
+    bills = [load_bill_from_yaml(ROOT / "bills" / f"{name}.yaml") for name in SHIPPED_BILLS]
+    cache = GeminiContextCache(make_gemini())
+    for name, ideology in factions.items():
+        for bill in bills:
+            assert cache.lookup("m", compile_identity(name, ideology).text, bill_section(bill)) is not None
+
+
+def test_distinct_prefixes_are_created_concurrently():
+    gemini = make_gemini(delay=0.1)
+    cache = GeminiContextCache(gemini, min_tokens=0)
+    lookup_in_threads(cache, ["bill a", "bill b", "bill c"])
+    assert gemini.caches.max_in_flight == 3
+    assert cache.stats()["created"] == 3
+
+
+def test_same_prefix_is_created_once_under_concurrency():
+    gemini = make_gemini(delay=0.05)
+    cache = GeminiContextCache(gemini, min_tokens=0)
+    results = lookup_in_threads(cache, ["bill"] * 4)
+    assert set(results) == {"cachedContents/1"}
+    assert cache.stats() == {"created": 1, "reused": 3, "errors": 0, "skipped": 0, "live": 1}
+
+
+def test_async_lookup_does_not_block_event_loop():
+    gemini = make_gemini(delay=0.2)
+    cache = GeminiContextCache(gemini, min_tokens=0)
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def run_all():
+        name, _ = await asyncio.gather(cache.alookup("m", "sys", "bill"), ticker())
+        return name
+
+    assert asyncio.run(run_all()) == "cachedContents/1"
+    assert len(ticks) == 5 and ticks[-1] - ticks[0] < 0.15
+
+
+# ---- Client ----
+
+def test_google_request_sends_only_suffix_with_cached_content(make_llm):
+    gemini = make_gemini()
+    llm = make_llm(gemini, provider="google", model="m", context_cache=GeminiContextCache(gemini, min_tokens=0))
+    user = "Bill:\nProposal\n\nTASK"
+    llm.generate_json("SYSTEM PROMPT", user, stable_prefix=len("Bill:\nProposal\n\n"))
+
+    call = gemini.models.kwargs[0]
+    assert call["config"]["cached_content"] == "cachedContents/1"
+    assert "SYSTEM PROMPT" not in call["contents"]
+    assert "Proposal" not in call["contents"]
+    assert call["contents"].startswith("TASK")
+    assert gemini.caches.created[0]["system_instruction"] == "SYSTEM PROMPT"
+
+
+def test_no_stable_prefix_means_no_cache(make_llm):
+    gemini = make_gemini()
+    llm = make_llm(gemini, provider="google", model="m", context_cache=GeminiContextCache(gemini, min_tokens=0))
+    llm.generate_json("sys", "user")
+    assert gemini.caches.created == []
+    assert "config" not in gemini.models.kwargs[0]
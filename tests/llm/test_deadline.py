@@ -0,0 +1,104 @@
+"""
+Unit tests for per-call deadlines and cooperative cancellation.
+"""
+
+import asyncio
+import time
+import pytest
+
+from parliament.llm.deadline import Deadline, LLMTimeoutError
+from tests.llm.conftest import FakeCerebras, fake_gemini
+
+
+# ---- Deadline ----
+
+def test_deadline_remaining_and_cancel():
+    deadline = Deadline(10)
+    assert 9 < deadline.remaining() <= 10
+    deadline.cancel()
+    assert deadline.expired
+    with pytest.raises(LLMTimeoutError):
+        deadline.check()
+
+
+def test_optional_deadline_helpers():
+    assert Deadline.after(None) is None
+    assert Deadline.remaining_of(None) is None
+    assert Deadline.remaining_of(Deadline(5)) > 4
+
+
+# ---- Sync ----
+
+def test_sync_call_returns_at_deadline_on_hung_connection(make_llm):
+    fake = FakeCerebras('{\"late\": true}', delays=1.0)
+    llm = make_llm(fake)
+    started = time.monotonic()
+    with pytest.raises(LLMTimeoutError):
+        llm.generate_json("sys", "user", phase="vote", timeout=0.05)
+    assert time.monotonic() - started < 0.5
+
+
+def test_client_default_timeout_applies_and_is_capped_by_call_timeout(make_llm):
+    llm = make_llm(FakeCerebras('{\"late\": true}', delays=1.0), timeout=0.05)
+    started = time.monotonic()
+    with pytest.raises(LLMTimeoutError):
+        llm.generate_json("sys", "user", timeout=30)
+    assert time.monotonic() - started < 0.5
+
+
+def test_expired_deadline_stops_retries(make_llm):
+    fake = FakeCerebras("not json", delays=0.04)
+    llm = make_llm(fake)
+    with pytest.raises(LLMTimeoutError):
+        llm.generate_json("sys", "user", retries=10, timeout=0.06)
+    time.sleep(0.15)  # let the abandoned worker notice the cancelled deadline
+    assert fake.calls <= 3
+
+
+def test_zero_timeout_fails_immediately_without_calling_provider(make_llm):
+    fake = FakeCerebras('{"late": true}', delays=1.0)
+    with pytest.raises(LLMTimeoutError):
+        make_llm(fake).generate_json("sys", "user", timeout=0)
+    assert fake.calls == 0
+
+
+def test_abandoned_calls_do_not_starve_later_calls(make_llm):
+    hung = 65  # More than any fixed worker pool would hold
+    fake = FakeCerebras(['{"late": true}'] * hung + ['{"ok": true}'], delays=[0.5] * hung + [0.0])
+    llm = make_llm(fake)
+    for _ in range(hung):
+        with pytest.raises(LLMTimeoutError):
+            llm.generate_json("sys", "user", timeout=0.005)
+    assert llm.generate_json("sys", "user", timeout=1.0) == {"ok": True}
+
+
+# ---- Per-request timeout ----
+
+def test_remaining_deadline_is_sent_to_cerebras(make_llm):
+    fake = FakeCerebras()
+    make_llm(fake).generate_json("sys", "user", timeout=2.0)
+    assert 0 < fake.kwargs[0]["timeout"] <= 2.0
+
+
+def test_remaining_deadline_is_sent_to_gemini_in_milliseconds(make_llm):
+    gemini = fake_gemini()
+    make_llm(gemini, provider="google").generate_json("sys", "user", timeout=2.0)
+    assert 0 < gemini.models.kwargs[0]["config"]["http_options"]["timeout"] <= 2000
+
+
+def test_unbounded_call_sends_no_timeout(make_llm):
+    fake = FakeCerebras()
+    make_llm(fake).generate_json("sys", "user")
+    assert "timeout" not in fake.kwargs[0]
+
+
+# ---- Async ----
+
+def test_async_deadline_cancels_in_flight_request(make_llm):
+    fake = FakeCerebras('{\"late\": true}', delays=1.0)
+    llm = make_llm(fake)
+    started = time.monotonic()
+    with pytest.raises(LLMTimeoutError):
+        asyncio.run(llm.agenerate_json("sys", "user", timeout=0.05))
+    assert time.monotonic() - started < 0.5
+    assert fake.cancelled == 1
@@ -0,0 +1,97 @@
+"""
+Unit tests for hedged LLM requests.
+"""
+
+import asyncio
+import time
+import pytest
+
+from parliament.llm.hedging import HedgePolicy
+from tests.llm.conftest import FakeCerebras
+
+
+# ---- Policy ----
+
+def test_delay_uses_initial_value_until_enough_samples():
+    policy = HedgePolicy(initial_delay=2.0, min_samples=3, min_delay=0.0)
+    assert policy.delay() == 2.0
+    for latency in (0.1, 0.2, 0.3):
+        policy._record(latency=latency)
+    assert policy.delay() == pytest.approx(0.3)
+
+
+def test_policy_phase_filter():
+    policy = HedgePolicy(phases={"vote", "speaker_veto"})
+    assert policy.applies_to("vote")
+    assert not policy.applies_to("statement")
+    assert HedgePolicy().applies_to("statement")
+
+
+# ---- Sync ----
+
+def test_fast_primary_is_not_hedged(make_llm):
+    fake = FakeCerebras('{"choice": "APPROVE"}', delays=[0.0])
+    policy = HedgePolicy(initial_delay=0.5)
+    llm = make_llm(fake, hedge=policy)
+    assert llm.generate_json("sys", "user", phase="vote") == {"choice": "APPROVE"}
+    assert fake.calls == 1
+    assert policy.stats()["hedged"] == 0
+
+
+def test_slow_primary_is_hedged_and_hedge_wins(make_llm):
+    fake = FakeCerebras('{"choice": "REJECT"}', delays=[0.5, 0.0])
+    policy = HedgePolicy(initial_delay=0.02)
+    llm = make_llm(fake, hedge=policy)
+
+    started = time.monotonic()
+    assert llm.generate_json("sys", "user", phase="vote") == {"choice": "REJECT"}
+    assert time.monotonic() - started < 0.4
+    assert fake.calls == 2
+    assert policy.stats()["hedged"] == 1
+    assert policy.stats()["hedge_wins"] == 1
+
+
+def test_hedge_win_records_primary_tail_latency(make_llm):
+    fake = FakeCerebras('{"choice": "REJECT"}', delays=[0.5, 0.0])
+    policy = HedgePolicy(initial_delay=0.05, min_samples=1, min_delay=0.0)
+    llm = make_llm(fake, hedge=policy)
+    llm.generate_json("sys", "user", phase="vote")
+    # The primary was still running after the hedge delay, so the estimate must not drop below it
+    assert policy.delay() >= 0.05
+
+
+def test_hedge_can_target_second_provider(make_llm):
+    primary = FakeCerebras('{"from": "primary"}', delays=[0.5])
+    secondary = make_llm(FakeCerebras('{"from": "secondary"}'), model="other")
+    policy = HedgePolicy(initial_delay=0.02, hedge_client=secondary)
+    llm = make_llm(primary, hedge=policy)
+    assert llm.generate_json("sys", "user") == {"from": "secondary"}
+
+
+def test_unhedged_phase_waits_for_primary(make_llm):
+    fake = FakeCerebras('{"summary": "slow"}', delays=[0.05, 0.0])
+    policy = HedgePolicy(initial_delay=0.01, phases={"vote"})
+    llm = make_llm(fake, hedge=policy)
+    assert llm.generate_json("sys", "user", phase="statement") == {"summary": "slow"}
+    assert fake.calls == 1
+
+
+# ---- Async ----
+
+def test_async_hedge_cancels_losing_request(make_llm):
+    fake = FakeCerebras('{"choice": "APPROVE"}', delays=[1.0, 0.0])
+    policy = HedgePolicy(initial_delay=0.02)
+    llm = make_llm(fake, hedge=policy)
+
+    result = asyncio.run(llm.agenerate_json("sys", "user", phase="speaker_veto"))
+    assert result == {"choice": "APPROVE"}
+    assert fake.cancelled == 1
+    assert policy.stats()["hedge_win_rate"] == 1.0
+
+
+def test_async_hedge_win_records_primary_tail_latency(make_llm):
+    fake = FakeCerebras('{"choice": "APPROVE"}', delays=[1.0, 0.0])
+    policy = HedgePolicy(initial_delay=0.05, min_samples=1, min_delay=0.0)
+    llm = make_llm(fake, hedge=policy)
+    asyncio.run(llm.agenerate_json("sys", "user", phase="speaker_veto"))
+    assert policy.delay() >= 0.05
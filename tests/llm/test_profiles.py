@@ -0,0 +1,72 @@
+"""
+Unit tests for per-phase model tiering and generation profiles.
+"""
+
+import pytest
+from pathlib import Path
+
+from parliament.llm.profiles import GenerationProfile, build_phase_profiles, load_phase_profiles
+from tests.llm.conftest import FakeCerebras, fake_gemini
+
+
+# ---- Helpers ----
+
+TABLE = {
+    "default": {"max_tokens": 400},
+    "statement": {"model": "small", "max_tokens": 100, "temperature": 0.7, "stop": ["\n\n\n"]},
+    "vote": {"model": "large", "temperature": 0.0},
+}
+
+
+# ---- Profiles ----
+
+def test_default_fills_every_phase():
+    profiles = build_phase_profiles(TABLE)
+    assert profiles["statement"].max_tokens == 100
+    assert profiles["vote"].max_tokens == 400
+    assert profiles["debate"] == GenerationProfile(max_tokens=400)
+
+
+def test_unknown_phase_rejected():
+    with pytest.raises(ValueError, match="Unknown phase"):
+        build_phase_profiles({"filibuster": {"model": "x"}})
+
+
+def test_shipped_routing_table_loads():
+    config = Path(__file__).resolve().parents[2] / "parliament" / "config" / "models.yaml"
+    profiles = load_phase_profiles(config)
+    assert set(profiles) == {"cerebras", "google"}
+    assert profiles["cerebras"]["vote"].temperature == 0.0
+
+
+# ---- Client ----
+
+def test_cerebras_call_uses_phase_profile(make_llm):
+    fake = FakeCerebras()
+    llm = make_llm(fake, model="large", profiles=build_phase_profiles(TABLE))
+    llm.generate_json("sys", "user", phase="statement")
+    llm.generate_json("sys", "user", phase="vote")
+    assert fake.kwargs[0] == {"model": "small", "max_tokens": 100, "temperature": 0.7, "stop": ["\n\n\n"]}
+    # The vote runs on the client's own model, so no override is sent
+    assert fake.kwargs[1] == {"max_tokens": 400, "temperature": 0.0}
+
+
+def test_gemini_call_uses_phase_profile(make_llm):
+    gemini = fake_gemini()
+    llm = make_llm(gemini, provider="google", model="large", profiles=build_phase_profiles(TABLE))
+    llm.generate_json("sys", "user", phase="statement")
+    call = gemini.models.kwargs[0]
+    assert call["model"] == "small"
+    assert call["config"] == {"max_output_tokens": 100, "temperature": 0.7, "stop_sequences": ["\n\n\n"]}
+
+
+def test_no_profiles_sends_no_overrides(make_llm):
+    fake = FakeCerebras()
+    make_llm(fake, model="large").generate_json("sys", "user", phase="vote")
+    assert fake.kwargs[0] == {}
+
+
+def test_cache_key_depends_on_phase_profile(make_llm):
+    llm = make_llm(model="large", profiles=build_phase_profiles(TABLE))
+    assert llm.request_key("s", "u", "statement") != llm.request_key("s", "u", "vote")
+    assert llm.request_key("s", "u", "debate") == llm.request_key("s", "u", "amendments")
@@ -0,0 +1,165 @@
+"""
+Unit tests for prefix-stable prompt assembly and cached-token telemetry.
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from parliament.agents.efficiency import EfficiencyAgent
+from parliament.core.bill import Bill, BillStatus
+from parliament.llm.prompts import (
+    PromptCacheStats,
+    PromptTemplate,
+    assemble,
+    compile_identity,
+    template_hashes,
+    usage_tokens,
+)
+from tests.llm.conftest import FakeCerebras
+
+
+# ---- Helpers ----
+
+IDEOLOGY = {
+    "goal": "Minimize cost",
+    "priorities": ["speed", "cost"],
+    "red_lines": ["unnecessary complexity"],
+}
+
+
+def make_bill() -> Bill:
+    return Bill(
+        id=uuid4(),
+        title="Test Bill",
+        proposal="A test proposal",
+        assumptions=["a"],
+        intended_outcomes=["b"],
+        known_risks=["c"],
+        unknowns=["d"],
+        status=BillStatus.DRAFT,
+    )
+
+
+# ---- Layout ----
+
+def test_assemble_orders_stable_material_first():
+    identity = PromptTemplate("identity", 1, "IDENTITY\n")
+    task = PromptTemplate("task", 1, "TASK {n}")
+    prompt = assemble(identity, "BILL\n", task, precedents="PRECEDENTS", n=3)
+    assert prompt.system_prompt.index("IDENTITY") < prompt.system_prompt.index("PRECEDENTS")
+    assert prompt.user_prompt.startswith("BILL\n")
+    assert prompt.user_prompt[prompt.stable_prefix:] == "TASK 3"
+    assert prompt.template_id == f"{identity.id}+{task.id}"
+
+
+def test_agent_phases_share_system_prompt_and_bill_prefix():
+    llm = MagicMock()
+    llm.generate_json.side_effect = [
+        {"summary": "s"},
+        {"argument": "a", "targeted_factions": []},
+        [],
+        {"choice": "APPROVE", "justification": "j"},
+    ]
+    agent = EfficiencyAgent(IDEOLOGY, llm=llm)
+    bill = make_bill()
+    agent.statement(bill, precedent_context="Past: X")
+    agent.debate(bill, 1, ["Efficiency", "Safety"], precedent_context="Past: X")
+    agent.propose_amendments(bill, precedent_context="Past: X")
+    agent.vote(bill, [], precedent_context="Past: X")
+
+    calls = llm.generate_json.call_args_list
+    systems = {call.args[0] for call in calls}
+    prefixes = {call.args[1][:call.kwargs["stable_prefix"]] for call in calls}
+    assert len(systems) == 1
+    assert len(prefixes) == 1
+    assert "A test proposal" in prefixes.pop()
+
+
+# ---- Templates ----
+
+def test_template_hash_tracks_wording_and_version():
+    base = PromptTemplate("vote", 1, "Vote now")
+    assert base.hash == PromptTemplate("vote", 1, "Vote now").hash
+    assert base.hash != PromptTemplate("vote", 1, "Vote now!").hash
+    assert base.hash != PromptTemplate("vote", 2, "Vote now").hash
+    assert base.id.startswith("vote@v1:")
+
+
+def test_identity_is_compiled_once_and_recompiled_on_ideology_change():
+    agent = EfficiencyAgent(IDEOLOGY, llm=MagicMock())
+    compiled = agent.identity_template
+    assert "Minimize cost" in compiled.text
+    assert agent.identity_template is compiled
+
+    agent.ideology = {**IDEOLOGY, "goal": "Maximize throughput"}
+    assert "Maximize throughput" in agent.identity_template.text
+    assert agent.identity_template.hash != compiled.hash
+    assert compile_identity("Efficiency", IDEOLOGY).hash == compiled.hash
+
+
+def test_incomplete_ideology_names_the_missing_key():
+    with pytest.raises(ValueError, match="'Efficiency' is missing required key\\(s\\): red_lines"):
+        EfficiencyAgent({"goal": "Minimize cost", "priorities": ["speed"]}, llm=MagicMock())
+    agent = EfficiencyAgent(IDEOLOGY, llm=MagicMock())
+    with pytest.raises(ValueError, match="goal, priorities"):
+        agent.ideology = {"red_lines": []}
+
+
+def test_agent_requests_carry_template_ids():
+    llm = MagicMock()
+    llm.generate_json.return_value = {"choice": "APPROVE", "justification": "j"}
+    EfficiencyAgent(IDEOLOGY, llm=llm).vote(make_bill(), [])
+    template = llm.generate_json.call_args.kwargs["template"]
+    assert template.startswith("identity/Efficiency@v1:")
+    assert "+vote@v1:" in template
+
+
+def test_registered_templates_are_listed():
+    # Importing the modules registers their templates
+    import parliament.agents.llm_base  # noqa: F401
+    import parliament.procedure.speaker  # noqa: F401
+
+    names = {template_id.split("@")[0] for template_id in template_hashes()}
+    assert {"faction_identity", "statement", "debate", "amendments", "vote"} <= names
+    assert {"speaker_identity", "speaker_order", "speaker_veto"} <= names
+
+
+def test_template_is_part_of_cache_key_and_telemetry(make_llm):
+    llm = make_llm()
+    assert llm.request_key("s", "u", template="vote@v1:aa") != llm.request_key("s", "u", template="vote@v2:bb")
+    assert llm.request_key("s", "u") == llm.request_key("s", "u", template=None)
+
+    llm.generate_json("s", "u", template="statement@v1:cc")
+    assert llm.parse_stats.as_dict()["by_template"] == {
+        "statement@v1:cc": {"clean": 1, "repaired": 0, "invalid": 0}
+    }
+
+
+# ---- Telemetry ----
+
+def test_usage_tokens_reads_gemini_and_langchain_shapes():
+    gemini = SimpleNamespace(
+        usage_metadata=SimpleNamespace(prompt_token_count=100, cached_content_token_count=60)
+    )
+    langchain = SimpleNamespace(
+        usage_metadata={"input_tokens": 80, "input_token_details": {"cache_read": 20}}
+    )
+    assert usage_tokens(gemini) == (100, 60)
+    assert usage_tokens(langchain) == (80, 20)
+    assert usage_tokens(SimpleNamespace(content="x")) is None
+
+
+def test_client_reports_cached_ratio_per_phase(make_llm):
+    fake = FakeCerebras(usage={"input_tokens": 200, "input_token_details": {"cache_read": 150}})
+    llm = make_llm(fake)
+    llm.generate_json("sys", "user", phase="statement")
+    stats = llm.prompt_cache_stats.as_dict()
+    assert stats["statement"]["cached_ratio"] == 0.75
+
+
+def test_prompt_cache_stats_without_tokens():
+    stats = PromptCacheStats()
+    stats.record("vote", 0, 0)
+    assert stats.as_dict()["vote"]["cached_ratio"] == 0.0
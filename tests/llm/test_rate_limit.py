@@ -0,0 +1,97 @@
+"""
+Unit tests for the provider-scoped token-bucket rate limiter.
+"""
+
+import asyncio
+import time
+import pytest
+
+from parliament.llm.rate_limit import (
+    RateLimiter,
+    TokenBucket,
+    estimate_tokens,
+    set_rate_limit,
+    get_rate_limiter,
+    clear_rate_limits,
+)
+from tests.llm.conftest import FakeCerebras
+
+
+@pytest.fixture(autouse=True)
+def reset_limiters():
+    clear_rate_limits()
+    yield
+    clear_rate_limits()
+
+
+# ---- Token estimates ----
+
+def test_estimate_tokens_scales_with_prompt_size():
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("a" * 400) == 100
+    assert estimate_tokens("a" * 400, max_output_tokens=50) == 150
+
+
+# ---- TokenBucket ----
+
+def test_bucket_reports_wait_when_empty():
+    bucket = TokenBucket(rate_per_minute=60)  # 1 token/second, capacity 60
+    now = time.monotonic()
+    bucket.consume(60)
+    assert bucket.time_until_available(1, now) == pytest.approx(1.0, abs=0.05)
+
+
+def test_oversized_request_is_clamped_to_capacity():
+    bucket = TokenBucket(rate_per_minute=10)
+    assert bucket.time_until_available(1_000, time.monotonic()) == 0.0
+
+
+# ---- RateLimiter ----
+
+def test_requests_queue_instead_of_failing():
+    limiter = RateLimiter(requests_per_minute=600)  # 10 requests/second, burst 600
+    limiter.request_bucket.tokens = 1
+    assert limiter.acquire() == 0.0
+    waited = limiter.acquire()
+    assert waited > 0.05
+    stats = limiter.stats()
+    assert stats["granted_requests"] == 2
+    assert stats["throttled_requests"] == 1
+    assert stats["queue_depth"] == 0
+    assert stats["total_wait_seconds"] == pytest.approx(waited)
+
+
+def test_token_budget_throttles_large_prompts():
+    limiter = RateLimiter(tokens_per_minute=6_000)  # 100 tokens/second
+    limiter.token_bucket.tokens = 10
+    waited = limiter.acquire(tokens=20)
+    assert waited == pytest.approx(0.1, abs=0.05)
+
+
+def test_async_acquire_reports_queue_depth():
+    limiter = RateLimiter(requests_per_minute=1200)  # 20 requests/second
+    limiter.request_bucket.tokens = 0
+
+    async def run_all():
+        return await asyncio.gather(*(limiter.aacquire() for _ in range(3)))
+
+    waits = asyncio.run(run_all())
+    assert all(w > 0 for w in waits)
+    assert limiter.stats()["max_queue_depth"] == 3
+
+
+# ---- Shared across clients ----
+
+def test_limiter_is_shared_by_all_clients_of_a_provider(make_llm):
+    limiter = set_rate_limit("cerebras", requests_per_minute=6_000)
+    assert get_rate_limiter("cerebras") is limiter
+    assert get_rate_limiter("google") is None
+
+    fake = FakeCerebras()
+    a = make_llm(fake)
+    b = make_llm(fake)
+    a.generate_json("sys", "one")
+    b.generate_json("sys", "two")
+
+    assert fake.calls == 2
+    assert limiter.stats()["granted_requests"] == 2
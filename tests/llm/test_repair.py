@@ -0,0 +1,166 @@
+"""
+Unit tests for local JSON repair and its use in LLMClient.
+"""
+
+import asyncio
+import pytest
+from pydantic import ValidationError
+
+from parliament.llm.repair import JSONRepairError, ParseStats, parse_model_json, validate_schema
+from parliament.llm.schemas import AmendmentSchema, VoteSchema
+from tests.llm.conftest import FakeCerebras
+
+
+# ---- Repair ----
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"summary": "ok"}', {"summary": "ok"}),
+        ('Sure! Here is the JSON:\n{"summary": "ok"}\nHope this helps.', {"summary": "ok"}),
+        ("{'summary': 'ok', 'flag': True, 'none': None}", {"summary": "ok", "flag": True, "none": None}),
+        ('{"items": [1, 2, 3,], "x": 1,}', {"items": [1, 2, 3], "x": 1}),
+        ('```json\n{"summary": "ok"}', {"summary": "ok"}),
+        ('```\n[{"change_summary": "a", "rationale": "b"}]\n```', [{"change_summary": "a", "rationale": "b"}]),
+        ('{"summary": "line one\nline two"}', {"summary": "line one\nline two"}),
+        ("{'summary': 'it\\'s fine'}", {"summary": "it's fine"}),
+    ],
+)
+def test_parse_model_json_repairs_common_defects(text, expected):
+    value, _ = parse_model_json(text)
+    assert value == expected
+
+
+def test_clean_json_is_not_reported_as_repaired():
+    assert parse_model_json('{"a": 1}') == ({"a": 1}, False)
+    assert parse_model_json("{'a': 1}") == ({"a": 1}, True)
+
+
+def test_truncated_object_is_closed():
+    value, repaired = parse_model_json('{"choice": "APPROVE", "confidence": 0.8')
+    assert repaired
+    assert value == {"choice": "APPROVE", "confidence": 0.8}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"choice": "APPROVE", "justification":',
+        '{"choice": "APPROVE", "justification"',
+        '{"choice": "APPROVE", "justif',
+    ],
+)
+def test_truncated_after_key_drops_dangling_key(text):
+    value, _ = parse_model_json(text)
+    assert value == {"choice": "APPROVE"}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"choice": "APPROVE", "justification": "Because the bill',
+        '{"argument": "We back this bec',
+    ],
+)
+def test_truncated_string_value_is_unrepairable(text):
+    with pytest.raises(JSONRepairError):
+        parse_model_json(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"factions_with_veto": ["Safety", "Equ',
+        '{"factions_with_veto": ["Safety", ',
+        '[{"change_summary": "a", "rationale": "b"}, {"change_summary": "c", "rat',
+    ],
+)
+def test_truncated_array_is_unrepairable(text):
+    with pytest.raises(JSONRepairError):
+        parse_model_json(text)
+
+
+def test_partial_preview_closes_truncated_strings_and_arrays():
+    value, _ = parse_model_json('{"factions_with_veto": ["Safety", "Equ', partial=True)
+    assert value == {"factions_with_veto": ["Safety", "Equ"]}
+
+
+def test_unrepairable_output_raises():
+    with pytest.raises(JSONRepairError):
+        parse_model_json("I cannot help with that.")
+
+
+def test_validate_schema_accepts_types_and_models():
+    validate_schema([{"change_summary": "a", "rationale": "b"}], list[AmendmentSchema])
+    with pytest.raises(ValidationError):
+        validate_schema({"choice": "MAYBE", "justification": "x"}, VoteSchema)
+
+
+def test_parse_stats_rates():
+    stats = ParseStats()
+    stats.record_response("clean")
+    stats.record_response("repaired")
+    stats.record_response("invalid")
+    stats.record_reprompt()
+    stats.record_response("clean")
+    snapshot = stats.as_dict()
+    assert snapshot["responses"] == 4
+    assert snapshot["repair_rate"] == 0.25
+    assert snapshot["reprompt_rate"] == 0.25
+
+
+# ---- Client integration ----
+
+def test_repairable_output_avoids_reprompt(make_llm):
+    fake = FakeCerebras(["Here you go: {'summary': 'ok',}"])
+    llm = make_llm(fake)
+    assert llm.generate_json("sys", "user") == {"summary": "ok"}
+    assert len(fake.prompts) == 1
+    stats = llm.parse_stats.as_dict()
+    assert stats["repaired"] == 1
+    assert stats["reprompts"] == 0
+
+
+def test_schema_violation_triggers_reprompt(make_llm):
+    fake = FakeCerebras([
+        '{"choice": "MAYBE", "justification": "unsure"}',
+        '{"choice": "ABSTAIN", "justification": "unsure"}',
+    ])
+    llm = make_llm(fake)
+    result = llm.generate_json("sys", "user", schema=VoteSchema)
+    assert result["choice"] == "ABSTAIN"
+    assert len(fake.prompts) == 2
+    assert "choice" in fake.prompts[1]
+    assert llm.parse_stats.as_dict()["reprompts"] == 1
+
+
+def test_truncated_veto_list_triggers_reprompt(make_llm):
+    fake = FakeCerebras([
+        '{"factions_with_veto": ["Safety", "Equ',
+        '{"factions_with_veto": ["Safety", "Equity"], "reasoning": "both red lines"}',
+    ])
+    llm = make_llm(fake)
+    result = llm.generate_json("sys", "user")
+    assert result["factions_with_veto"] == ["Safety", "Equity"]
+    assert len(fake.prompts) == 2
+    assert llm.parse_stats.as_dict()["repaired"] == 0
+
+
+def test_retry_prompts_do_not_nest(make_llm):
+    fake = FakeCerebras(["no json", "still no json", "nothing"])
+    llm = make_llm(fake)
+    with pytest.raises(ValueError, match="after 3 attempts"):
+        llm.generate_json("sys", "the task", retries=2)
+    for prompt in fake.prompts[1:]:
+        assert prompt.count("Original task:") == 1
+        assert prompt.count("the task") == 1
+    stats = llm.parse_stats.as_dict()
+    assert stats["reprompts"] == 2
+    assert stats["failures"] == 1
+
+
+def test_async_path_repairs_and_validates(make_llm):
+    fake = FakeCerebras(['{"change_summary": "a", "rationale": "b"}]', '[{"change_summary": "a", "rationale": "b"}]'])
+    llm = make_llm(fake)
+    result = asyncio.run(llm.agenerate_json("sys", "user", schema=list[AmendmentSchema]))
+    assert result == [{"change_summary": "a", "rationale": "b"}]
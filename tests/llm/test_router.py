@@ -0,0 +1,102 @@
+"""
+Unit tests for the multi-provider router with stub backends.
+"""
+
+import asyncio
+import pytest
+
+from parliament.llm.client import LLMClient
+from parliament.llm.router import (
+    AllBackendsFailed,
+    BreakerState,
+    CircuitBreaker,
+    LLMRouter,
+)
+from tests.llm.conftest import FakeCerebras
+
+
+# ---- Helpers ----
+
+OUTAGE = ConnectionError("provider outage")
+
+
+def make_router_llm(*clients, **kwargs) -> tuple[LLMClient, LLMRouter]:
+    router = LLMRouter(list(clients), **kwargs)
+    return LLMClient(provider="router", client=router, single_flight=None), router
+
+
+# ---- CircuitBreaker ----
+
+def test_breaker_opens_after_threshold_and_half_opens_after_timeout():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    breaker.record_failure(now=0)
+    assert breaker.state == BreakerState.CLOSED
+    breaker.record_failure(now=0)
+    assert breaker.state == BreakerState.OPEN
+    assert not breaker.allow_request(now=5)
+    assert breaker.allow_request(now=11)
+    assert breaker.state == BreakerState.HALF_OPEN
+    assert not breaker.allow_request(now=11)  # only one trial at a time
+    breaker.record_success()
+    assert breaker.state == BreakerState.CLOSED
+
+
+def test_half_open_failure_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=1)
+    breaker.record_failure(now=0)
+    assert breaker.allow_request(now=2)
+    breaker.record_failure(now=2)
+    assert breaker.state == BreakerState.OPEN
+
+
+# ---- Routing ----
+
+def test_router_prefers_fastest_backend(make_llm):
+    slow = FakeCerebras('{"who": "slow"}', delays=0.03)
+    fast = FakeCerebras('{"who": "fast"}')
+    llm, router = make_router_llm(make_llm(slow, model="slow"), make_llm(fast, model="fast"))
+
+    # Each backend is explored once, then the fast one wins every request
+    for i in range(6):
+        llm.generate_json("sys", f"user {i}")
+    assert llm.generate_json("sys", "final") == {"who": "fast"}
+    assert slow.calls == 1
+    assert router.stats()["backends"]["cerebras:fast"]["requests"] == 6
+
+
+def test_router_fails_over_and_opens_breaker(make_llm):
+    broken = FakeCerebras("unused", error=OUTAGE)
+    healthy = FakeCerebras('{"who": "healthy"}', delays=0.01)
+    llm, router = make_router_llm(
+        make_llm(broken, model="broken"), make_llm(healthy, model="healthy"), failure_threshold=2
+    )
+
+    for i in range(4):
+        assert llm.generate_json("sys", f"user {i}") == {"who": "healthy"}
+
+    stats = router.stats()
+    assert stats["backends"]["cerebras:broken"]["state"] == "OPEN"
+    assert stats["failovers"] >= 1
+    assert broken.calls == 2  # skipped once its breaker opened
+
+
+def test_router_raises_when_all_backends_fail(make_llm):
+    llm, _ = make_router_llm(
+        make_llm(FakeCerebras("x", error=OUTAGE), model="a"),
+        make_llm(FakeCerebras("x", error=OUTAGE), model="b"),
+    )
+    with pytest.raises(AllBackendsFailed, match="provider outage"):
+        llm.generate_json("sys", "user")
+
+
+def test_router_requires_backends():
+    with pytest.raises(ValueError):
+        LLMRouter([])
+
+
+def test_async_router_fails_over(make_llm):
+    llm, _ = make_router_llm(
+        make_llm(FakeCerebras("x", error=OUTAGE), model="broken"),
+        make_llm(FakeCerebras('{"who": "async"}'), model="healthy"),
+    )
+    assert asyncio.run(llm.agenerate_json("sys", "user")) == {"who": "async"}
@@ -0,0 +1,189 @@
+"""
+Unit tests for single-flight coalescing of identical LLM requests.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+
+from parliament.llm.deadline import LLMTimeoutError
+from parliament.llm.schemas import AmendmentSchema, VoteSchema
+from parliament.llm.singleflight import SingleFlight
+from tests.llm.conftest import FakeCerebras
+
+
+# ---- Helpers ----
+
+def run_in_threads(fn, n: int) -> list:
+    results = [None] * n
+    barrier = threading.Barrier(n)
+
+    def worker(i):
+        barrier.wait()
+        results[i] = fn()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+# ---- Sync ----
+
+def test_concurrent_identical_requests_share_one_call(make_llm):
+    fake = FakeCerebras('{"summary": "shared"}', delays=0.05)
+    flight = SingleFlight()
+    llm = make_llm(fake, single_flight=flight)
+
+    results = run_in_threads(lambda: llm.generate_json("sys", "user"), 4)
+
+    assert fake.calls == 1
+    assert all(r == {"summary": "shared"} for r in results)
+    assert flight.stats() == {"leaders": 1, "coalesced": 3}
+
+
+def test_followers_receive_independent_copies(make_llm):
+    fake = FakeCerebras('{"targeted_factions": ["Safety"]}', delays=0.05)
+    llm = make_llm(fake, single_flight=SingleFlight())
+    results = run_in_threads(lambda: llm.generate_json("sys", "user"), 3)
+    results[0]["targeted_factions"].append("Intruder")
+    assert all(r["targeted_factions"] == ["Safety"] for r in results[1:])
+
+
+def test_distinct_requests_are_not_coalesced(make_llm):
+    fake = FakeCerebras('{"summary": "x"}', delays=0.01)
+    llm = make_llm(fake, single_flight=SingleFlight())
+    counter = iter(range(100))
+    run_in_threads(lambda: llm.generate_json("sys", f"user {next(counter)}"), 3)
+    assert fake.calls == 3
+
+
+def test_leader_failure_propagates_to_followers():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        time.sleep(0.05)
+        raise RuntimeError("provider down")
+
+    errors = []
+
+    def follower():
+        started.wait()
+        try:
+            flight.do("k", lambda: "unused")
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    t = threading.Thread(target=follower)
+    t.start()
+    with pytest.raises(RuntimeError):
+        flight.do("k", failing)
+    t.join()
+    assert len(errors) == 1
+
+
+def test_single_flight_can_be_disabled(make_llm):
+    fake = FakeCerebras('{"summary": "x"}', delays=0.01)
+    llm = make_llm(fake)
+    run_in_threads(lambda: llm.generate_json("sys", "user"), 3)
+    assert fake.calls == 3
+
+
+# ---- Async ----
+
+def test_async_identical_requests_share_one_call(make_llm):
+    fake = FakeCerebras('{"summary": "shared"}', delays=0.05)
+    llm = make_llm(fake, single_flight=SingleFlight())
+
+    async def run_all():
+        return await asyncio.gather(*(llm.agenerate_json("sys", "user") for _ in range(5)))
+
+    results = asyncio.run(run_all())
+    assert fake.calls == 1
+    assert all(r == {"summary": "shared"} for r in results)
+
+
+def test_deadline_bound_callers_share_the_call_but_keep_their_own_timeout(make_llm):
+    fake = FakeCerebras('{"summary": "late"}', delays=0.2)
+    flight = SingleFlight()
+    llm = make_llm(fake, single_flight=flight)
+    errors = []
+
+    def impatient():
+        try:
+            llm.generate_json("sys", "user", timeout=0.05)
+        except LLMTimeoutError as exc:
+            errors.append(exc)
+
+    t = threading.Thread(target=impatient)
+    t.start()
+    time.sleep(0.01)
+    result = llm.generate_json("sys", "user", timeout=5.0)  # must not inherit the 0.05s timeout
+    t.join()
+
+    assert result == {"summary": "late"}
+    assert len(errors) == 1
+    assert fake.calls == 1
+    assert flight.stats() == {"leaders": 1, "coalesced": 1}
+
+
+def test_impatient_follower_times_out_alone(make_llm):
+    fake = FakeCerebras('{"summary": "late"}', delays=0.2)
+    flight = SingleFlight()
+    llm = make_llm(fake, single_flight=flight)
+    results = []
+
+    t = threading.Thread(target=lambda: results.append(llm.generate_json("sys", "user")))
+    t.start()
+    time.sleep(0.01)
+    with pytest.raises(LLMTimeoutError):
+        llm.generate_json("sys", "user", timeout=0.05)
+    t.join()
+
+    assert results == [{"summary": "late"}]
+    assert fake.calls == 1
+
+
+def test_async_follower_outlives_impatient_caller(make_llm):
+    fake = FakeCerebras('{"summary": "late"}', delays=0.2)
+    llm = make_llm(fake, single_flight=SingleFlight())
+
+    async def run_all():
+        return await asyncio.gather(
+            llm.agenerate_json("sys", "user", timeout=0.05),
+            llm.agenerate_json("sys", "user"),
+            return_exceptions=True,
+        )
+
+    impatient, patient = asyncio.run(run_all())
+    assert isinstance(impatient, LLMTimeoutError)
+    assert patient == {"summary": "late"}
+
+
+def test_async_deadline_bound_calls_are_coalesced(make_llm):
+    fake = FakeCerebras('{"summary": "shared"}', delays=0.05)
+    flight = SingleFlight()
+    llm = make_llm(fake, single_flight=flight)
+
+    async def run_all():
+        return await asyncio.gather(*(llm.agenerate_json("sys", "user", timeout=5.0) for _ in range(3)))
+
+    assert asyncio.run(run_all()) == [{"summary": "shared"}] * 3
+    assert fake.calls == 1
+    assert flight.stats() == {"leaders": 1, "coalesced": 2}
+
+
+# ---- Request key ----
+
+def test_key_separates_schema_and_output_modes(make_llm):
+    plain = make_llm()
+    key = plain.request_key("sys", "user")
+    assert plain.request_key("sys", "user", schema=VoteSchema) != key
+    assert plain.request_key("sys", "user", schema=list[AmendmentSchema]) != key
+    assert make_llm(structured_output=True).request_key("sys", "user") != key
+    assert make_llm(stream=True).request_key("sys", "user") != key
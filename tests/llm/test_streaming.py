@@ -0,0 +1,113 @@
+"""
+Unit tests for streaming generation and incremental JSON parsing.
+"""
+
+import asyncio
+import io
+
+from parliament.llm import streaming
+from parliament.llm.schemas import VoteSchema
+from parliament.llm.streaming import IncrementalJSONParser, StreamValidator, consume_stream
+from parliament.utils.colors import PartialRenderer
+from tests.llm.conftest import FakeCerebras
+
+
+# ---- Parser ----
+
+def test_parser_completes_when_top_level_closes():
+    parser = IncrementalJSONParser()
+    assert not parser.feed('Sure: {"a": "}')
+    assert not parser.feed('", "b": [1, {"c": 2}]')
+    assert parser.feed('} trailing words')
+    assert parser.text == '{"a": "}", "b": [1, {"c": 2}]}'
+
+
+def test_parser_partial_value_closes_open_structures():
+    parser = IncrementalJSONParser()
+    parser.feed('{"argument": "We should')
+    assert parser.partial() == {"argument": "We should"}
+    assert parser.in_top_level_string_value
+
+
+def test_parser_partial_decodes_escapes_and_keeps_completed_members():
+    parser = IncrementalJSONParser()
+    parser.feed('{"targets": ["Safety"], "argument": "line\\none \\u00e9')
+    assert parser.partial() == {"targets": ["Safety"], "argument": "line\none \u00e9"}
+
+
+def test_parser_partial_of_top_level_array_lists_complete_elements():
+    parser = IncrementalJSONParser()
+    parser.feed('[{"change_summary": "a", "rationale": "b"}, {"change_summary": "c", "rat')
+    assert parser.partial() == [{"change_summary": "a", "rationale": "b"}]
+
+
+def test_parser_parses_each_member_once(monkeypatch):
+    calls = []
+    real_parse = streaming.parse_model_json
+    monkeypatch.setattr(streaming, "parse_model_json", lambda text: calls.append(text) or real_parse(text))
+
+    parser = IncrementalJSONParser()
+    text = '{"choice": "APPROVE", "justification": "' + "word " * 500 + '"}'
+    for ch in text:
+        parser.feed(ch)
+        parser.partial()
+    assert len(calls) == 2
+    assert parser.partial()["justification"] == "word " * 500
+
+
+def test_validator_rejects_impossible_enum_prefix():
+    validator = StreamValidator(VoteSchema)
+    assert validator.violation({"choice": "APP"}, open_string=True) is None
+    assert validator.violation({"choice": "MAY"}, open_string=True)
+    assert validator.violation({"choice": "APP"}, open_string=False)
+
+
+def test_consume_stream_stops_reading_after_close():
+    consumed = []
+
+    def chunks():
+        for piece in ['{"summary": ', '"ok"}', " and more", " commentary"]:
+            consumed.append(piece)
+            yield piece
+
+    assert consume_stream(chunks()) == '{"summary": "ok"}'
+    assert consumed == ['{"summary": ', '"ok"}']
+
+
+# ---- Client ----
+
+def test_streaming_client_ignores_trailing_commentary(make_llm):
+    response = '{"choice": "APPROVE", "justification": "ok"}' + " Let me explain further." * 20
+    fake = FakeCerebras([response])
+    llm = make_llm(fake, stream=True)
+    assert llm.generate_json("sys", "user", schema=VoteSchema)["choice"] == "APPROVE"
+    assert fake.chunks_sent < len(response) // fake.chunk_size
+
+
+def test_streaming_aborts_invalid_vote_and_reprompts(make_llm):
+    invalid = '{"choice": "MAYBE", "justification": "' + "undecided " * 50 + '"}'
+    valid = '{"choice": "REJECT", "justification": "too risky"}'
+    fake = FakeCerebras([invalid, valid])
+    llm = make_llm(fake, stream=True)
+    assert llm.generate_json("sys", "user", schema=VoteSchema)["choice"] == "REJECT"
+    assert fake.calls == 2
+    # The invalid response was cut off at the choice field
+    assert fake.chunks_sent < len(invalid) // fake.chunk_size
+
+
+def test_partial_fields_reach_renderer_hook(make_llm):
+    updates = []
+    fake = FakeCerebras(['{"summary": "a long statement"}'])
+    llm = make_llm(fake, stream=True, on_partial=lambda phase, partial, done: updates.append((phase, partial, done)))
+    asyncio.run(llm.agenerate_json("sys", "user", phase="statement"))
+    assert updates[-1] == ("statement", {"summary": "a long statement"}, True)
+    assert any(not done and partial.get("summary") not in (None, "a long statement") for _, partial, done in updates)
+
+
+def test_partial_renderer_clears_line_when_done():
+    out = io.StringIO()
+    renderer = PartialRenderer(stream=out)
+    renderer("vote", {"choice": "APP"}, False)
+    renderer("vote", {"choice": "APPROVE"}, True)
+    assert "choice=APP" in out.getvalue()
+    assert out.getvalue().endswith("\r\033[K")
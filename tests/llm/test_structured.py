@@ -0,0 +1,87 @@
+"""
+Unit tests for provider-native structured output.
+"""
+
+import asyncio
+
+from parliament.llm.router import LLMRouter
+from parliament.llm.schemas import AmendmentSchema, DebateSchema, VoteSchema
+from parliament.llm.structured import (
+    compile_json_schema,
+    openai_response_format,
+    supports_structured_output,
+)
+from tests.llm.conftest import FakeCerebras, fake_gemini
+
+
+# ---- Schema compilation ----
+
+def test_compiled_schema_is_strict():
+    schema = compile_json_schema(DebateSchema)
+    assert schema["additionalProperties"] is False
+    assert schema["required"] == ["argument", "targeted_factions"]
+    assert "default" not in schema["properties"]["targeted_factions"]
+
+
+def test_compiled_list_schema_inlines_item_model():
+    schema = compile_json_schema(list[AmendmentSchema])
+    assert "$defs" not in schema
+    assert schema["items"]["required"] == ["change_summary", "rationale"]
+
+
+def test_response_format_names_schema():
+    response_format = openai_response_format(VoteSchema)
+    assert response_format["type"] == "json_schema"
+    assert response_format["json_schema"]["name"] == "VoteSchema"
+    assert response_format["json_schema"]["strict"] is True
+
+
+def test_support_matrix():
+    assert supports_structured_output("google", list[AmendmentSchema])
+    assert supports_structured_output("cerebras", VoteSchema)
+    # Strict OpenAI-compatible schemas need an object at the top level
+    assert not supports_structured_output("cerebras", list[AmendmentSchema])
+    assert not supports_structured_output("cerebras", None)
+
+
+# ---- Client ----
+
+def test_cerebras_sends_response_format_and_drops_prose_instructions(make_llm):
+    fake = FakeCerebras('{"choice": "APPROVE", "justification": "ok"}')
+    llm = make_llm(fake, structured_output=True)
+    llm.generate_json("sys", "user", schema=VoteSchema)
+    messages, kwargs = fake.messages[0], fake.kwargs[0]
+    assert kwargs["response_format"]["json_schema"]["name"] == "VoteSchema"
+    assert "IMPORTANT" not in messages[-1]["content"]
+
+
+def test_unsupported_schema_falls_back_to_prose(make_llm):
+    fake = FakeCerebras("[]")
+    llm = make_llm(fake, structured_output=True)
+    assert llm.generate_json("sys", "user", schema=list[AmendmentSchema]) == []
+    messages, kwargs = fake.messages[0], fake.kwargs[0]
+    assert kwargs == {}
+    assert "IMPORTANT" in messages[-1]["content"]
+
+
+def test_disabled_by_default(make_llm):
+    fake = FakeCerebras('{"choice": "APPROVE", "justification": "ok"}')
+    make_llm(fake).generate_json("sys", "user", schema=VoteSchema)
+    assert fake.kwargs[0] == {}
+
+
+def test_gemini_sends_response_schema(make_llm):
+    gemini = fake_gemini("[]")
+    llm = make_llm(gemini, provider="google", structured_output=True)
+    llm.generate_json("sys", "user", schema=list[AmendmentSchema])
+    config = gemini.models.kwargs[0]["config"]
+    assert config["response_mime_type"] == "application/json"
+    assert config["response_schema"] == list[AmendmentSchema]
+
+
+def test_router_backends_apply_their_own_structured_output(make_llm):
+    fake = FakeCerebras('{"choice": "APPROVE", "justification": "ok"}')
+    backend = make_llm(fake, structured_output=True)
+    llm = make_llm(LLMRouter([backend]), provider="router")
+    asyncio.run(llm.agenerate_json("sys", "user", schema=VoteSchema))
+    assert "response_format" in fake.kwargs[0]
@@ -0,0 +1,83 @@
+"""
+Unit tests for the local debate-order planner.
+"""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from parliament.core.bill import Bill, BillStatus
+from parliament.procedure.order_planner import cosine, plan_debate_order, statement_vectors
+from parliament.procedure.speaker import Speaker
+
+
+# ---- Helpers ----
+
+NAMES = ["Efficiency", "Safety", "Equity", "Innovation"]
+STATEMENTS = {
+    "Efficiency": "Cut costs and deploy quickly with minimal overhead.",
+    "Safety": "Pause deployment until rollback and audit safeguards exist.",
+    "Equity": "Ensure fair access and prevent exclusion of rural students.",
+    "Innovation": "Deploy quickly to learn fast and cut costs of experimentation.",
+}
+
+
+# ---- Vectors ----
+
+def test_vectors_are_unit_length():
+    vectors = statement_vectors(STATEMENTS)
+    for vector in vectors.values():
+        assert sum(w * w for w in vector.values()) == pytest.approx(1.0)
+
+
+def test_cosine_reflects_shared_terms():
+    vectors = statement_vectors(STATEMENTS)
+    assert cosine(vectors["Efficiency"], vectors["Innovation"]) > cosine(vectors["Efficiency"], vectors["Safety"])
+
+
+# ---- Objectives ----
+
+def test_opposed_adjacent_separates_similar_positions():
+    order = plan_debate_order(NAMES, STATEMENTS, "opposed_adjacent")
+    assert sorted(order) == sorted(NAMES)
+    i, j = order.index("Efficiency"), order.index("Innovation")
+    assert abs(i - j) > 1
+
+
+def test_similar_adjacent_pairs_similar_positions():
+    order = plan_debate_order(NAMES, STATEMENTS, "similar_adjacent")
+    i, j = order.index("Efficiency"), order.index("Innovation")
+    assert abs(i - j) == 1
+
+
+def test_distinctive_first_leads_with_outlier():
+    order = plan_debate_order(NAMES, STATEMENTS, "distinctive_first")
+    assert order[-1] in {"Efficiency", "Innovation"}
+
+
+def test_order_is_reproducible_and_missing_statements_tolerated():
+    statements = {k: v for k, v in STATEMENTS.items() if k != "Equity"}
+    first = plan_debate_order(NAMES, statements)
+    assert first == plan_debate_order(NAMES, statements)
+    assert sorted(first) == sorted(NAMES)
+
+
+def test_unknown_objective_rejected():
+    with pytest.raises(ValueError):
+        plan_debate_order(NAMES, STATEMENTS, "alphabetical")
+
+
+# ---- Speaker integration ----
+
+def test_speaker_plans_order_without_llm():
+    bill = Bill(
+        id=uuid4(), title="T", proposal="P", assumptions=["a"], intended_outcomes=["b"],
+        known_risks=["c"], unknowns=["d"], status=BillStatus.DRAFT,
+    )
+    llm = MagicMock()
+    speaker = Speaker(bill, llm=llm)
+    order = speaker.plan_debate_order(NAMES, STATEMENTS, "similar_adjacent")
+    assert sorted(order) == sorted(NAMES)
+    assert speaker.rulings_used["speaker_order"] == {"source": "local_planner", "objective": "similar_adjacent"}
+    llm.generate_json.assert_not_called()
@@ -0,0 +1,103 @@
+"""
+Unit tests for memoized Speaker rulings.
+"""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from parliament.core.bill import Bill, BillStatus
+from parliament.procedure.rulings import RulingCache, ruling_key
+from parliament.procedure.speaker import Speaker, Phase
+from parliament.storage.session_store import SessionStore
+
+
+# ---- Helpers ----
+
+IDEOLOGIES = {
+    "Safety": {"goal": "avoid harm", "priorities": [], "red_lines": ["no audits"]},
+    "Efficiency": {"goal": "save money", "priorities": [], "red_lines": []},
+}
+NAMES = list(IDEOLOGIES)
+
+
+def make_bill(proposal: str = "Deploy the model") -> Bill:
+    return Bill(
+        id=uuid4(),
+        title="Test Bill",
+        proposal=proposal,
+        assumptions=["a"],
+        intended_outcomes=["b"],
+        known_risks=["c"],
+        unknowns=["d"],
+        status=BillStatus.DRAFT,
+    )
+
+
+def make_llm() -> MagicMock:
+    llm = MagicMock()
+    llm.generate_json.side_effect = lambda s, u, **kwargs: (
+        {"factions_with_veto": ["Safety"], "reasoning": "safety critical"}
+        if "factions_with_veto" in u
+        else {"faction_order": ["Safety", "Efficiency"], "reasoning": "risk first"}
+    )
+    return llm
+
+
+def debate_speaker(bill: Bill, llm, rulings) -> Speaker:
+    speaker = Speaker(bill, llm=llm, rulings=rulings)
+    speaker.phase = Phase.DEBATE
+    return speaker
+
+
+# ---- Keys ----
+
+def test_key_ignores_bill_identity_but_not_content():
+    assert ruling_key("speaker_veto", make_bill(), IDEOLOGIES) == ruling_key("speaker_veto", make_bill(), IDEOLOGIES)
+    assert ruling_key("speaker_veto", make_bill(), IDEOLOGIES) != ruling_key("speaker_veto", make_bill("Other"), IDEOLOGIES)
+    assert ruling_key("speaker_veto", make_bill(), IDEOLOGIES) != ruling_key("speaker_order", make_bill(), IDEOLOGIES)
+
+
+def test_key_changes_with_roster_ideology():
+    changed = {**IDEOLOGIES, "Efficiency": {**IDEOLOGIES["Efficiency"], "goal": "grow"}}
+    assert ruling_key("speaker_veto", make_bill(), IDEOLOGIES) != ruling_key("speaker_veto", make_bill(), changed)
+
+
+# ---- Speaker reuse ----
+
+def test_speaker_reuses_rulings_for_same_bill_and_roster():
+    rulings = RulingCache()
+    llm = make_llm()
+
+    first = debate_speaker(make_bill(), llm, rulings)
+    assert first.determine_veto_powers(NAMES, IDEOLOGIES) == {"Safety"}
+    assert first.determine_debate_order(NAMES, {}, faction_ideologies=IDEOLOGIES) == ["Safety", "Efficiency"]
+    assert first.rulings_used["speaker_veto"]["reused"] is False
+
+    second = debate_speaker(make_bill(), llm, rulings)
+    assert second.determine_veto_powers(NAMES, IDEOLOGIES) == {"Safety"}
+    assert second.get_veto_factions() == {"Safety"}
+    assert second.determine_debate_order(NAMES, {}, faction_ideologies=IDEOLOGIES) == ["Safety", "Efficiency"]
+
+    assert llm.generate_json.call_count == 2
+    assert second.rulings_used["speaker_veto"]["reused"] is True
+    assert second.rulings_used["speaker_order"]["reused"] is True
+
+
+def test_failed_ruling_not_memoized():
+    rulings = RulingCache()
+    llm = MagicMock()
+    llm.generate_json.side_effect = RuntimeError("down")
+    speaker = debate_speaker(make_bill(), llm, rulings)
+    assert speaker.determine_veto_powers(NAMES, IDEOLOGIES) == set()
+    assert rulings.stats()["entries"] == 0
+    assert speaker.rulings_used == {}
+
+
+def test_rulings_persist_in_session_store(tmp_path):
+    store = SessionStore(db_path=tmp_path / "rulings.db")
+    debate_speaker(make_bill(), make_llm(), RulingCache(store=store)).determine_veto_powers(NAMES, IDEOLOGIES)
+
+    llm = make_llm()
+    speaker = debate_speaker(make_bill(), llm, RulingCache(store=SessionStore(db_path=tmp_path / "rulings.db")))
+    assert speaker.determine_veto_powers(NAMES, IDEOLOGIES) == {"Safety"}
+    llm.generate_json.assert_not_called()
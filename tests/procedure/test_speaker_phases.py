@@ -7,6 +7,7 @@ from unittest.mock import MagicMock
 from uuid import uuid4
 
 from parliament.core.bill import Bill, BillStatus
+from parliament.core.debate import DebateArgument
 from parliament.procedure.speaker import Speaker, Phase
 
 
@@ -115,6 +116,50 @@ def test_debate_round_advances():
     assert speaker.debate_round == 2
     # At max_debate_rounds, returns False
     assert speaker.next_debate_round() is False
+    assert speaker.debate_end_reason == "maximum of 3 debate round(s) reached"
+
+
+def test_converged_debate_closes_early():
+    from parliament.engine.convergence import ConvergenceDetector
+
+    bill = make_bill()
+    speaker = Speaker(bill, max_debate_rounds=5, llm=MagicMock(), convergence=ConvergenceDetector(threshold=0.9))
+    speaker.advance_phase()  # FACTION_STATEMENTS
+    speaker.advance_phase()  # DEBATE
+
+    def round_of(n: int):
+        return [
+            DebateArgument(
+                id=uuid4(), bill_id=bill.id, bill_version=1, speaker_faction="Safety",
+                round_number=n, argument="The rollout must pause until audits finish.",
+            )
+        ]
+
+    assert speaker.next_debate_round(round_of(1)) is True
+    assert speaker.next_debate_round(round_of(2)) is False
+    assert speaker.debate_round == 2
+    assert speaker.debate_end_reason.startswith("positions converged after round 2")
+
+
+def test_round_limit_takes_precedence_over_convergence_in_final_round():
+    from parliament.engine.convergence import ConvergenceDetector
+
+    bill = make_bill()
+    speaker = Speaker(bill, max_debate_rounds=2, llm=MagicMock(), convergence=ConvergenceDetector(threshold=0.9))
+    speaker.advance_phase()  # FACTION_STATEMENTS
+    speaker.advance_phase()  # DEBATE
+
+    def round_of(n: int):
+        return [
+            DebateArgument(
+                id=uuid4(), bill_id=bill.id, bill_version=1, speaker_faction="Safety",
+                round_number=n, argument="The rollout must pause until audits finish.",
+            )
+        ]
+
+    assert speaker.next_debate_round(round_of(1)) is True
+    assert speaker.next_debate_round(round_of(2)) is False  # would also have converged
+    assert speaker.debate_end_reason == "maximum of 2 debate round(s) reached"
 
 
 def test_set_debate_order_outside_debate_phase_raises():
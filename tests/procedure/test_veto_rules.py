@@ -0,0 +1,119 @@
+"""
+Unit tests for the rule-based veto fast path.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+import yaml
+
+from parliament.core.bill import Bill, BillStatus
+from parliament.procedure.speaker import Speaker
+from parliament.procedure.veto_rules import RedLineIndex, terms
+from parliament.utils.bill_loader import load_bill_from_yaml
+
+
+# ---- Helpers ----
+
+ROOT = Path(__file__).resolve().parents[2]
+
+IDEOLOGIES = {
+    "Safety": {"goal": "g", "priorities": [], "red_lines": ["unbounded risk", "no rollback mechanism"]},
+    "Equity": {"goal": "g", "priorities": [], "red_lines": ["systemic exclusion", "disproportionate harm"]},
+    "Compliance": {"goal": "g", "priorities": [], "red_lines": ["regulatory violation"]},
+}
+
+
+def make_bill(known_risks: list[str], unknowns: list[str] | None = None) -> Bill:
+    return Bill(
+        id=uuid4(),
+        title="Test Bill",
+        proposal="A test proposal",
+        assumptions=["a"],
+        intended_outcomes=["b"],
+        known_risks=known_risks,
+        unknowns=unknowns or ["d"],
+        status=BillStatus.DRAFT,
+    )
+
+
+# ---- Scoring ----
+
+def test_terms_are_stemmed_without_stopwords():
+    assert terms("No rollback mechanisms") == {"rollback", "mechanism"}
+    assert terms("Unbounded risks") == terms("unbounded risk")
+
+
+def test_full_red_line_match_grants_confidently():
+    index = RedLineIndex(IDEOLOGIES)
+    assessment = index.assess(make_bill(["There is no rollback mechanism for deployed models"]))
+    assert assessment.scores["Safety"] == pytest.approx(1.0)
+    assert assessment.grants == {"Safety"}
+    assert assessment.confident is True
+
+
+def test_unrelated_bill_is_left_to_the_llm():
+    # Nothing matches lexically, which is not evidence that no red line is at stake
+    assessment = RedLineIndex(IDEOLOGIES).assess(make_bill(["Hallucinated answers"]))
+    assert assessment.grants == frozenset()
+    assert assessment.scores == {"Safety": 0.0, "Equity": 0.0, "Compliance": 0.0}
+    assert assessment.confident is False
+
+
+def test_half_red_line_match_grants_with_default_cutoff():
+    # "risk" alone is half of "unbounded risk"
+    assessment = RedLineIndex(IDEOLOGIES).assess(make_bill(["Misuse risk"]))
+    assert assessment.scores["Safety"] == pytest.approx(0.5)
+    assert assessment.grants == {"Safety"}
+    assert assessment.confident is True
+
+
+def test_score_near_cutoff_is_ambiguous():
+    assessment = RedLineIndex(IDEOLOGIES, cutoff=0.5).assess(make_bill(["Misuse risk"]))
+    assert assessment.grants == {"Safety"}
+    assert assessment.confident is False
+
+
+def test_unknowns_are_scored_too():
+    assessment = RedLineIndex(IDEOLOGIES).assess(make_bill(["c"], unknowns=["Possible regulatory violations"]))
+    assert assessment.grants == {"Compliance"}
+
+
+def test_invalid_cutoff_rejected():
+    with pytest.raises(ValueError):
+        RedLineIndex(IDEOLOGIES, cutoff=0.0)
+
+
+# ---- Shipped configuration ----
+
+def test_shipped_bill_takes_the_fast_path():
+    index = RedLineIndex(yaml.safe_load((ROOT / "parliament" / "config" / "factions.yaml").read_text()))
+    bill = load_bill_from_yaml(ROOT / "bills" / "open_source_llm_grants.yaml")
+    llm = MagicMock()
+    speaker = Speaker(bill, llm=llm)
+
+    assessment = index.assess(bill)
+    assert assessment.confident is True
+    assert speaker.apply_veto_assessment(assessment) == {"Safety"}
+    llm.generate_json.assert_not_called()
+
+
+def test_shipped_bill_without_red_line_terms_goes_to_the_llm():
+    index = RedLineIndex(yaml.safe_load((ROOT / "parliament" / "config" / "factions.yaml").read_text()))
+    assessment = index.assess(load_bill_from_yaml(ROOT / "bills" / "ai_teaching_assistant.yaml"))
+    assert assessment.grants == frozenset()
+    assert assessment.confident is False
+
+
+# ---- Speaker integration ----
+
+def test_speaker_applies_assessment_without_llm():
+    bill = make_bill(["Unbounded risk of outages"])
+    llm = MagicMock()
+    speaker = Speaker(bill, llm=llm)
+    granted = speaker.apply_veto_assessment(RedLineIndex(IDEOLOGIES).assess(bill))
+    assert granted == {"Safety"} == speaker.get_veto_factions()
+    assert speaker.rulings_used["speaker_veto"]["source"] == "red_line_rules"
+    llm.generate_json.assert_not_called()
@@ -4,6 +4,7 @@ Integration tests for ParliamentSession with mocked LLM agents.
 
 import pytest
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import MagicMock
 from uuid import uuid4
@@ -45,7 +46,7 @@ def _approving_llm_response(faction_name: str):
     """Returns different mock responses based on the prompt content."""
     call_count = {"n": 0}
 
-    def side_effect(system, user):
+    def side_effect(system, user, **kwargs):
         call_count["n"] += 1
         # Statement
         if '"summary"' in user:
@@ -72,7 +73,7 @@ def _approving_llm_response(faction_name: str):
 
 def make_mock_speaker_llm() -> MagicMock:
     mock = MagicMock()
-    mock.generate_json.side_effect = lambda s, u: (
+    mock.generate_json.side_effect = lambda s, u, **kwargs: (
         {"factions_with_veto": [], "reasoning": "test"}
         if "factions_with_veto" in u
         else {"faction_order": [], "reasoning": "test"}
@@ -200,3 +201,431 @@ def test_precedent_context_injected_into_agent_prompts():
         # First call is the statement — system prompt should contain precedent
         first_system = call_args[0][0][0]
         assert "Prior Bill" in first_system
+
+
+# ---- Concurrent faction fan-out ----
+
+def _run_with_workers(tmpdir: str, max_workers: int) -> tuple[str, list[dict]]:
+    import contextlib
+    import io
+
+    store = SessionStore(db_path=Path(tmpdir) / f"workers_{max_workers}.db")
+    agents = [
+        EfficiencyAgent(IDEOLOGY, llm=MagicMock(generate_json=MagicMock(side_effect=_approving_llm_response("Efficiency")))),
+        SafetyAgent(IDEOLOGY, llm=MagicMock(generate_json=MagicMock(side_effect=_approving_llm_response("Safety")))),
+    ]
+    session = ParliamentSession(
+        agents=agents,
+        store=store,
+        max_debate_rounds=1,
+        export_logs=False,
+        speaker_llm=make_mock_speaker_llm(),
+        max_workers=max_workers,
+    )
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        session.run([make_bill("Concurrent Bill")])
+    session_id = store.list_sessions()[0]["session_id"]
+    return buffer.getvalue(), store.get_votes(session_id)
+
+
+def test_concurrent_mode_matches_sequential_transcript():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sequential_output, sequential_votes = _run_with_workers(tmpdir, max_workers=1)
+        concurrent_output, concurrent_votes = _run_with_workers(tmpdir, max_workers=4)
+
+    assert concurrent_output == sequential_output
+    assert [v["faction"] for v in concurrent_votes] == [v["faction"] for v in sequential_votes]
+    assert [v["choice"] for v in concurrent_votes] == ["APPROVE", "APPROVE"]
+
+
+# ---- Simultaneous debate rounds ----
+
+def _debate_llm(faction_name: str, barrier, debate_prompts: list):
+    respond = _approving_llm_response(faction_name)
+
+    def side_effect(system, user, **kwargs):
+        if '"argument"' in user:
+            debate_prompts.append((faction_name, user))
+            barrier.wait(timeout=5)  # Deadlocks unless both factions speak at once
+        return respond(system, user, **kwargs)
+
+    return side_effect
+
+
+def test_simultaneous_debate_runs_round_in_parallel_on_snapshot():
+    import threading
+
+    barrier = threading.Barrier(2)
+    debate_prompts: list = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = SessionStore(db_path=Path(tmpdir) / "test.db")
+        agents = [
+            EfficiencyAgent(IDEOLOGY, llm=MagicMock(generate_json=MagicMock(side_effect=_debate_llm("Efficiency", barrier, debate_prompts)))),
+            SafetyAgent(IDEOLOGY, llm=MagicMock(generate_json=MagicMock(side_effect=_debate_llm("Safety", barrier, debate_prompts)))),
+        ]
+        session = ParliamentSession(
+            agents=agents,
+            store=store,
+            max_debate_rounds=2,
+            export_logs=False,
+            speaker_llm=make_mock_speaker_llm(),
+            max_workers=2,
+            debate_mode="simultaneous",
+        )
+        session.run([make_bill()])
+        session_id = store.list_sessions()[0]["session_id"]
+        stored = store.get_debate_arguments(session_id)
+
+    # Storage follows the Speaker's order within each round
+    assert [(a["round_number"], a["speaker_faction"]) for a in stored] == [
+        (1, "Efficiency"), (1, "Safety"), (2, "Efficiency"), (2, "Safety"),
+    ]
+    # Round 2 speakers both saw exactly round 1, not each other's round-2 turn
+    round_two = debate_prompts[2:]
+    assert [prompt.count("argues for approval") for _, prompt in round_two] == [2, 2]
+
+
+def test_unknown_debate_mode_rejected():
+    with pytest.raises(ValueError):
+        ParliamentSession(agents=[], store=MagicMock(), debate_mode="chaotic")
+
+
+# ---- Debate convergence ----
+
+def test_converged_debate_closes_early_and_records_reason():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = SessionStore(db_path=Path(tmpdir) / "test.db")
+        agents = [
+            EfficiencyAgent(IDEOLOGY, llm=MagicMock(generate_json=MagicMock(side_effect=_approving_llm_response("Efficiency")))),
+            SafetyAgent(IDEOLOGY, llm=MagicMock(generate_json=MagicMock(side_effect=_approving_llm_response("Safety")))),
+        ]
+        session = ParliamentSession(
+            agents=agents,
+            store=store,
+            max_debate_rounds=5,
+            export_logs=False,
+            speaker_llm=make_mock_speaker_llm(),
+            convergence_threshold=0.9,
+        )
+        session.run([make_bill()])
+        session_id = store.list_sessions()[0]["session_id"]
+        recorded = store.get_session(session_id)
+        arguments = store.get_debate_arguments(session_id)
+
+    # The mocks repeat themselves, so round 2 already matches round 1
+    assert {a["round_number"] for a in arguments} == {1, 2}
+    assert recorded["debate_rounds"] == 2
+    assert recorded["debate_end_reason"].startswith("positions converged after round 2")
+
+
+# ---- Early-exit voting ----
+
+def _rejecting_llm(faction_name: str, calls: list, vote_delay: float = 0.0):
+    respond = _approving_llm_response(faction_name)
+
+    def side_effect(system, user, **kwargs):
+        if '"choice"' in user:
+            time.sleep(vote_delay)
+            calls.append(faction_name)
+            return {"choice": "REJECT", "justification": f"{faction_name} rejects."}
+        return respond(system, user, **kwargs)
+
+    return side_effect
+
+
+def _run_early_exit(
+    tmpdir: str, policy: str, max_workers: int = 1, delays: dict[str, float] | None = None
+) -> tuple[list, dict, list[dict]]:
+    from parliament.agents.equity import EquityAgent
+
+    calls: list = []
+    store = SessionStore(db_path=Path(tmpdir) / f"{policy}.db")
+
+    def llm(name: str) -> MagicMock:
+        return MagicMock(generate_json=MagicMock(side_effect=_rejecting_llm(name, calls, (delays or {}).get(name, 0.0))))
+
+    agents = [
+        EfficiencyAgent(IDEOLOGY, llm=llm("Efficiency")),
+        SafetyAgent(IDEOLOGY, llm=llm("Safety")),
+        EquityAgent(IDEOLOGY, llm=llm("Equity")),
+    ]
+    session = ParliamentSession(
+        agents=agents,
+        store=store,
+        max_debate_rounds=1,
+        export_logs=False,
+        speaker_llm=make_mock_speaker_llm(),
+        vote_early_exit=policy,
+        max_workers=max_workers,
+    )
+    decision = session.run([make_bill()])[0]
+    assert decision.passed is False
+    session_id = store.list_sessions()[0]["session_id"]
+    return calls, store.get_session(session_id), store.get_votes(session_id)
+
+
+def test_cancel_policy_skips_votes_after_outcome_locked():
+    import json
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        calls, recorded, votes = _run_early_exit(tmpdir, "cancel")
+
+    # Equal weights: two rejections already outweigh the single outstanding vote
+    assert calls == ["Efficiency", "Safety"]
+    assert [v["faction"] for v in votes] == ["Efficiency", "Safety"]
+    assert json.loads(recorded["votes_not_needed"]) == ["Equity"]
+    assert "cannot be overturned" in recorded["vote_decided_reason"]
+
+
+def test_mark_policy_collects_but_flags_unneeded_votes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        calls, recorded, votes = _run_early_exit(tmpdir, "mark")
+
+    assert calls == ["Efficiency", "Safety", "Equity"]
+    assert [(v["faction"], v["decisive"]) for v in votes] == [("Efficiency", 1), ("Safety", 1), ("Equity", 0)]
+
+
+def test_mark_policy_flags_by_seating_order_not_arrival_order():
+    # The last-seated factions answer first; the marking must match a sequential run
+    delays = {"Efficiency": 0.1, "Safety": 0.05, "Equity": 0.0}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        calls, _, votes = _run_early_exit(tmpdir, "mark", max_workers=3, delays=delays)
+
+    assert calls == ["Equity", "Safety", "Efficiency"]
+    assert [(v["faction"], v["decisive"]) for v in votes] == [("Efficiency", 1), ("Safety", 1), ("Equity", 0)]
+
+
+# ---- Overlapped opening phases ----
+
+def test_veto_determination_overlaps_statements_in_canonical_output():
+    import contextlib
+    import io
+    import threading
+
+    statements_started = threading.Event()
+
+    def speaker_side_effect(system, user, **kwargs):
+        if "factions_with_veto" in user:
+            # Only returns once a statement has been requested concurrently
+            assert statements_started.wait(timeout=5)
+            return {"factions_with_veto": ["Safety"], "reasoning": "veto reasoning"}
+        return {"faction_order": ["Safety", "Efficiency"], "reasoning": "order reasoning"}
+
+    def agent_llm(name: str):
+        respond = _approving_llm_response(name)
+
+        def side_effect(system, user, **kwargs):
+            if '"summary"' in user:
+                statements_started.set()
+            return respond(system, user, **kwargs)
+
+        return MagicMock(generate_json=MagicMock(side_effect=side_effect))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = SessionStore(db_path=Path(tmpdir) / "test.db")
+        session = ParliamentSession(
+            agents=[EfficiencyAgent(IDEOLOGY, llm=agent_llm("Efficiency")), SafetyAgent(IDEOLOGY, llm=agent_llm("Safety"))],
+            store=store,
+            max_debate_rounds=1,
+            export_logs=False,
+            speaker_llm=MagicMock(generate_json=MagicMock(side_effect=speaker_side_effect)),
+        )
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            decision = session.run([make_bill()])[0]
+
+    output = buffer.getvalue()
+    positions = [
+        output.index("Veto power reasoning"),
+        output.index("Speaker grants veto power to"),
+        output.index("FACTION STATEMENTS"),
+        output.index("Efficiency supports this bill."),
+        output.index("DEBATE PHASE"),
+        output.index("Debate order reasoning"),
+    ]
+    assert positions == sorted(positions)
+    assert decision.passed is True
+
+
+# ---- Memoized Speaker rulings ----
+
+def test_repeated_bill_reuses_speaker_rulings_and_labels_them():
+    import json
+    from parliament.procedure.rulings import RulingCache
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = SessionStore(db_path=Path(tmpdir) / "test.db")
+        speaker_llm = make_mock_speaker_llm()
+        session = ParliamentSession(
+            agents=[make_approving_agent("Efficiency")],
+            store=store,
+            max_debate_rounds=1,
+            export_logs=False,
+            speaker_llm=speaker_llm,
+            speaker_rulings=RulingCache(store=store),
+        )
+        session.run([make_bill("Same Bill"), make_bill("Same Bill")])
+        recorded = [
+            json.loads(store.get_session(s["session_id"])["speaker_rulings"])
+            for s in sorted(store.list_sessions(), key=lambda s: s["created_at"])
+        ]
+
+    # The mocked order names no factions, so only the veto ruling is valid and memoized
+    assert recorded[0]["speaker_veto"]["reused"] is False
+    assert recorded[1]["speaker_veto"]["reused"] is True
+    veto_calls = [c for c in speaker_llm.generate_json.call_args_list if "factions_with_veto" in c[0][1]]
+    assert len(veto_calls) == 1
+
+
+# ---- Rule-based veto fast path ----
+
+def run_with_veto_rules(bill: Bill) -> list[str]:
+    """Run one bill before a faction with a red line; return the Speaker's prompts."""
+    agent = make_approving_agent("Efficiency")
+    agent.ideology = {**IDEOLOGY, "red_lines": ["no rollback mechanism"]}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = SessionStore(db_path=Path(tmpdir) / "test.db")
+        speaker_llm = make_mock_speaker_llm()
+        session = ParliamentSession(
+            agents=[agent],
+            store=store,
+            max_debate_rounds=1,
+            export_logs=False,
+            speaker_llm=speaker_llm,
+            veto_rule_margin=0.2,
+        )
+        session.run([bill])
+    return [c[0][1] for c in speaker_llm.generate_json.call_args_list]
+
+
+def test_clear_cut_bill_skips_speaker_veto_llm():
+    prompts = run_with_veto_rules(make_bill().model_copy(update={"known_risks": ["No rollback mechanism"]}))
+    assert not any("factions_with_veto" in p for p in prompts)
+    assert any("faction_order" in p for p in prompts)
+
+
+def test_bill_without_shared_vocabulary_asks_speaker_veto_llm():
+    prompts = run_with_veto_rules(make_bill().model_copy(update={"known_risks": ["Hallucinated grades"]}))
+    assert any("factions_with_veto" in p for p in prompts)
+
+
+# ---- Local debate-order planning ----
+
+def test_local_debate_order_skips_speaker_order_llm():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = SessionStore(db_path=Path(tmpdir) / "test.db")
+        speaker_llm = make_mock_speaker_llm()
+        session = ParliamentSession(
+            agents=[make_approving_agent("Efficiency")],
+            store=store,
+            max_debate_rounds=1,
+            export_logs=False,
+            speaker_llm=speaker_llm,
+            debate_order_strategy="opposed_adjacent",
+        )
+        session.run([make_bill()])
+
+    prompts = [c[0][1] for c in speaker_llm.generate_json.call_args_list]
+    assert not any("faction_order" in p for p in prompts)
+
+
+def test_unknown_debate_order_strategy_rejected():
+    with pytest.raises(ValueError):
+        ParliamentSession(agents=[], store=MagicMock(), debate_order_strategy="random")
+
+
+# ---- Parallel multi-bill runs ----
+
+def _precedent_seeing_agent(seen: dict, started=None):
+    """Agent whose statement call records how many precedents its prompt carried."""
+    respond = _approving_llm_response("Efficiency")
+
+    def side_effect(system, user, **kwargs):
+        if '"summary"' in user:
+            # User prompt opens with "Bill:\n<proposal>"
+            seen[user.split("\n", 2)[1]] = system.count("Past bill:")
+            if started is not None:
+                started.wait(timeout=5)
+        return respond(system, user, **kwargs)
+
+    return EfficiencyAgent(IDEOLOGY, llm=MagicMock(generate_json=MagicMock(side_effect=side_effect)))
+
+
+def _proposal_bill(proposal: str) -> Bill:
+    return make_bill(proposal).model_copy(update={"proposal": proposal})
+
+
+def test_snapshot_waves_share_precedents_and_keep_bill_order():
+    import contextlib
+    import io
+    import threading
+
+    seen: dict = {}
+    barrier = threading.Barrier(2)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = SessionStore(db_path=Path(tmpdir) / "test.db")
+        precedent_store = PrecedentStore()
+        session = ParliamentSession(
+            agents=[_precedent_seeing_agent(seen, barrier)],
+            store=store,
+            precedent_store=precedent_store,
+            max_debate_rounds=1,
+            export_logs=False,
+            speaker_llm=make_mock_speaker_llm(),
+        )
+        bills = [_proposal_bill(f"Proposal {i}") for i in range(4)]
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            decisions = session.run(bills, jobs=2, consistency="snapshot")
+
+    # Two waves of two concurrent bills (the barrier needs both at once)
+    assert seen == {"Proposal 0": 0, "Proposal 1": 0, "Proposal 2": 2, "Proposal 3": 2}
+    assert [d.bill_title for d in decisions] == [b.title for b in bills]
+    output = buffer.getvalue()
+    starts = [output.index(f"AI PARLIAMENT — {b.title}") for b in bills]
+    assert starts == sorted(starts)
+    # Each transcript is printed whole, not interleaved with another bill's
+    assert output.count("SESSION CONCLUDED") == 4
+    assert output.index("SESSION CONCLUDED") < starts[1]
+    assert len(precedent_store) == 4
+
+
+def test_eventual_mode_runs_bills_concurrently():
+    import threading
+
+    seen: dict = {}
+    barrier = threading.Barrier(3)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        session = ParliamentSession(
+            agents=[_precedent_seeing_agent(seen, barrier)],
+            store=SessionStore(db_path=Path(tmpdir) / "test.db"),
+            max_debate_rounds=1,
+            export_logs=False,
+            speaker_llm=make_mock_speaker_llm(),
+        )
+        decisions = session.run([_proposal_bill(f"Proposal {i}") for i in range(3)], jobs=3, consistency="eventual")
+
+    assert len(decisions) == 3
+    assert set(seen.values()) == {0}
+
+
+def test_strict_mode_ignores_jobs():
+    seen: dict = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        session = ParliamentSession(
+            agents=[_precedent_seeing_agent(seen)],
+            store=SessionStore(db_path=Path(tmpdir) / "test.db"),
+            max_debate_rounds=1,
+            export_logs=False,
+            speaker_llm=make_mock_speaker_llm(),
+        )
+        session.run([_proposal_bill(f"Proposal {i}") for i in range(3)], jobs=3, consistency="strict")
+
+    assert seen == {"Proposal 0": 0, "Proposal 1": 1, "Proposal 2": 2}
+
+
+def test_unknown_consistency_rejected():
+    session = ParliamentSession(agents=[], store=MagicMock(), export_logs=False)
+    with pytest.raises(ValueError):
+        session.run([], jobs=2, consistency="linearizable")
@@ -0,0 +1,73 @@
+"""
+Unit tests for PhaseGraph dependency scheduling.
+"""
+
+import threading
+import time
+
+import pytest
+
+from parliament.session.phase_graph import PhaseGraph
+
+
+# ---- Scheduling ----
+
+def test_independent_tasks_overlap():
+    barrier = threading.Barrier(2)
+
+    def task(value):
+        def run():
+            barrier.wait(timeout=5)  # Deadlocks unless both run at once
+            return value
+        return run
+
+    graph = PhaseGraph()
+    graph.add("a", task(1))
+    graph.add("b", task(2))
+    assert graph.run() == {"a": 1, "b": 2}
+
+
+def test_dependant_receives_results_and_starts_when_inputs_ready():
+    graph = PhaseGraph()
+    graph.add("slow", lambda: time.sleep(0.2) or "slow")
+    graph.add("fast", lambda: "fast")
+    graph.add("after_fast", lambda fast: fast.upper(), after=("fast",))
+    results = graph.run()
+
+    assert results["after_fast"] == "FAST"
+    # Did not wait for the unrelated slow task
+    assert graph.timings["after_fast"][1] < graph.timings["slow"][1]
+
+
+def test_multiple_dependencies_passed_in_listed_order():
+    graph = PhaseGraph()
+    graph.add("x", lambda: 1)
+    graph.add("y", lambda: 2)
+    graph.add("pair", lambda y, x: (y, x), after=("y", "x"))
+    assert graph.run()["pair"] == (2, 1)
+
+
+# ---- Errors ----
+
+def test_unknown_dependency_rejected():
+    graph = PhaseGraph()
+    with pytest.raises(ValueError, match="unknown"):
+        graph.add("order", lambda statements: statements, after=("statements",))
+
+
+def test_duplicate_task_rejected():
+    graph = PhaseGraph()
+    graph.add("a", lambda: 1)
+    with pytest.raises(ValueError, match="Duplicate"):
+        graph.add("a", lambda: 2)
+
+
+def test_task_error_propagates():
+    def fail():
+        raise RuntimeError("boom")
+
+    graph = PhaseGraph()
+    graph.add("fail", fail)
+    graph.add("ok", lambda: 1)
+    with pytest.raises(RuntimeError, match="boom"):
+        graph.run()
@@ -179,6 +179,50 @@ class TestSessionStore:
         assert len(store.get_votes(s1)) == 1
         assert len(store.get_votes(s2)) == 1
 
+    def test_record_debate_outcome(self, tmp_path):
+        store = make_store(tmp_path)
+        session_id = store.create_session(make_bill())
+        store.record_debate_outcome(session_id, 2, "positions converged after round 2")
+        session = store.export_session(session_id)["session"]
+        assert session["debate_rounds"] == 2
+        assert session["debate_end_reason"] == "positions converged after round 2"
+
+    def test_debate_outcome_columns_added_to_old_database(self, tmp_path):
+        import sqlite3
+
+        db_path = tmp_path / "old.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "CREATE TABLE sessions (session_id TEXT PRIMARY KEY, bill_id TEXT NOT NULL, "
+                "bill_title TEXT NOT NULL, bill_json TEXT NOT NULL, created_at TEXT NOT NULL, concluded_at TEXT)"
+            )
+        store = SessionStore(db_path=db_path)
+        session_id = store.create_session(make_bill())
+        store.record_debate_outcome(session_id, 1, "maximum of 1 debate round(s) reached")
+        assert store.get_session(session_id)["debate_rounds"] == 1
+
+    def test_concurrent_writers(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        db_path = tmp_path / "shared.db"
+
+        def write_session(_):
+            # A store per writer, as separate sessions or processes would have
+            store = SessionStore(db_path=db_path)
+            bill = make_bill()
+            session_id = store.create_session(bill)
+            for _ in range(5):
+                store.save_vote(session_id, make_vote(bill))
+            store.conclude_session(session_id)
+            return session_id
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            session_ids = list(pool.map(write_session, range(16)))
+
+        store = SessionStore(db_path=db_path)
+        assert len(store.list_sessions()) == 16
+        assert all(len(store.get_votes(s)) == 5 for s in session_ids)
+
 
 # ---- PrecedentStore ----
 
@@ -245,3 +289,12 @@ class TestPrecedentStore:
         assert "Bill 9" in context
         assert "Bill 8" in context
         assert "Bill 7" not in context
+
+    def test_concurrent_records_respect_max_entries(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        store = PrecedentStore(max_entries=10)
+        decisions = [self._make_decision(f"Bill {i}", True) for i in range(50)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda d: (store.record("proposal", d), store.get_precedent_context()), decisions))
+        assert len(store) == 10
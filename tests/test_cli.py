@@ -0,0 +1,78 @@
+"""
+Unit tests for the command-line entry point.
+"""
+
+import threading
+import pytest
+from types import SimpleNamespace
+
+from parliament.__main__ import _build_llm, _build_parser, _print_template_stats
+from parliament.llm import client as client_module
+from parliament.llm.adaptive import clear_adaptive_limiters, get_adaptive_limiter
+from parliament.llm.prompts import PromptTemplate, register_template
+from parliament.llm.repair import ParseStats
+
+
+# ---- Helpers ----
+
+@pytest.fixture
+def fake_sdk(monkeypatch):
+    client_module.clear_client_registry()
+    monkeypatch.setattr(client_module, "get_client_from", lambda provider, model=None: (object(), model))
+    yield
+    client_module.clear_client_registry()
+    clear_adaptive_limiters()
+
+
+def parse_run(*flags: str):
+    return _build_parser().parse_args(["run", "--bill", "bill.yaml", *flags])
+
+
+# ---- Adaptive concurrency ----
+
+@pytest.mark.parametrize("cap", [1, 2, 3])
+def test_small_adaptive_concurrency_cap_starts_at_cap(fake_sdk, cap):
+    _build_llm(parse_run("--adaptive-concurrency", str(cap)))
+    limiter = get_adaptive_limiter("cerebras")
+    assert limiter.max_limit == cap
+    assert limiter.limit == cap
+
+
+def test_large_adaptive_concurrency_cap_keeps_default_start(fake_sdk):
+    _build_llm(parse_run("--adaptive-concurrency", "16"))
+    limiter = get_adaptive_limiter("cerebras")
+    assert limiter.max_limit == 16
+    assert limiter.limit == 4
+
+
+# ---- Router ----
+
+def test_router_provider_builds_without_deadlock(monkeypatch):
+    real_factory = client_module.get_client_from
+
+    def factory(provider="cerebras", model=None):
+        return real_factory(provider, model) if provider == "router" else (object(), model)
+
+    client_module.clear_client_registry()
+    monkeypatch.setattr(client_module, "get_client_from", factory)
+    built = []
+    worker = threading.Thread(target=lambda: built.append(_build_llm(parse_run("--provider", "router"))), daemon=True)
+    worker.start()
+    worker.join(timeout=5)
+    assert not worker.is_alive(), "--provider router deadlocked"
+    client_module.clear_client_registry()
+    assert [b.client.provider for b in built[0].client.backends] == client_module.DEFAULT_ROUTER_PROVIDERS
+
+
+# ---- Telemetry ----
+
+def test_parse_outcomes_are_printed_per_registered_template(capsys):
+    task = register_template(PromptTemplate("cli_test_task", 1, "Do it"))
+    stats = ParseStats()
+    stats.record_response("clean", f"identity/A@v1:aaaa+{task.id}")
+    stats.record_response("repaired", f"identity/B@v1:bbbb+{task.id}")
+    stats.record_response("clean", "identity/A@v1:aaaa+unregistered@v1:cccc")
+
+    _print_template_stats(SimpleNamespace(parse_stats=stats))
+
+    assert capsys.readouterr().out.splitlines() == [f"LLM JSON [{task.id}]: 1 clean, 1 repaired, 0 invalid"]